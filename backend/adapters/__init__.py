@@ -1,8 +1,14 @@
 """News source adapters."""
 
-from .base import NewsAdapter
+from .base import FetchResult, NewsAdapter
 from .google_adapter import GoogleNewsAdapter
 from .nhk_adapter import NHKNewsAdapter
 from .yahoo_adapter import YahooNewsAdapter
 
-__all__ = ["NewsAdapter", "YahooNewsAdapter", "NHKNewsAdapter", "GoogleNewsAdapter"]
+__all__ = [
+    "FetchResult",
+    "NewsAdapter",
+    "YahooNewsAdapter",
+    "NHKNewsAdapter",
+    "GoogleNewsAdapter",
+]
@@ -1,39 +1,360 @@
 """Base adapter class for news sources."""
 
+import time
+import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, Dict, Iterable, List, Optional
 
-from backend.models import NewsItem
+import httpx
+
+from backend import metrics
+from backend.adapters.streaming import StreamingRSSParser
+from backend.config import settings
+from backend.http_client import (
+    FeedValidators,
+    HTTPClientPool,
+    ValidatorStore,
+    body_hash,
+    freshness_hint,
+)
+from backend.models import NewsRecord
+from backend.parse_executor import ParseExecutor
+
+
+class FetchResult(List[NewsRecord]):
+    """List of fetched items that also records which fetch legs were missing.
+
+    Adapters that combine several upstream requests return this when some
+    of them failed or missed their deadline, so callers can tell a partial
+    result from a complete one.
+    """
+
+    def __init__(
+        self, items: Iterable[NewsRecord] = (), missing: Iterable[str] = ()
+    ):
+        """Initialize the result.
+
+        Args:
+            items: Fetched items.
+            missing: Names of the legs that did not contribute items.
+        """
+        super().__init__(items)
+        self.missing: List[str] = list(missing)
+
+    @property
+    def partial(self) -> bool:
+        """Whether any leg was missing."""
+        return bool(self.missing)
 
 
 class NewsAdapter(ABC):
     """Abstract base class for news source adapters."""
 
-    def __init__(self, source_id: str, source_name: str):
+    def __init__(
+        self,
+        source_id: str,
+        source_name: str,
+        http_pool: Optional[HTTPClientPool] = None,
+        parse_executor: Optional[ParseExecutor] = None,
+    ):
         """Initialize the adapter.
 
         Args:
             source_id: Unique identifier for the source (e.g., 'yahoo')
             source_name: Human-readable name (e.g., 'Yahoo News')
+            http_pool: Shared HTTP client pool. If None, a short-lived
+                client is created per request.
+            parse_executor: Worker pool for parsing. If None, parsing runs
+                inline on the event loop.
         """
         self.source_id = source_id
         self.source_name = source_name
+        self.http_pool = http_pool
+        self.parse_executor = parse_executor
+        self.validators = ValidatorStore()
+        # Upstream freshness hints of the last full response, by URL
+        self.freshness_hints: Dict[str, float] = {}
+
+    @property
+    def refresh_hint(self) -> Optional[float]:
+        """Longest freshness lifetime the source's upstreams advertise.
+
+        Taken from ``Cache-Control`` and RSS ``<ttl>``; None without hints.
+        """
+        return max(self.freshness_hints.values(), default=None)
+
+    def _note_freshness(
+        self, url: str, response: httpx.Response, body: Optional[bytes]
+    ) -> None:
+        """Remember the freshness hint of a full response."""
+        hint = freshness_hint(response.headers, body)
+        if hint is None:
+            self.freshness_hints.pop(url, None)
+        else:
+            self.freshness_hints[url] = hint
 
     @abstractmethod
-    async def fetch_news(self, limit: int = 10) -> List[NewsItem]:
+    async def fetch_news(self, limit: int = 10) -> List[NewsRecord]:
         """Fetch news articles from the source.
 
         Args:
             limit: Maximum number of articles to fetch.
 
         Returns:
-            List of NewsItem objects.
+            List of NewsRecord objects.
 
         Raises:
             Exception: If fetching fails.
         """
         pass
 
+    async def _get(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """Fetch a URL through the shared pool when one is injected.
+
+        Args:
+            url: URL to fetch.
+            headers: Optional extra request headers.
+
+        Returns:
+            The HTTP response (a 304 is passed through for conditional GETs).
+
+        Raises:
+            httpx.HTTPStatusError: If the response status is an error.
+        """
+        started = time.perf_counter()
+        if self.http_pool is not None:
+            response = await self.http_pool.get(url, headers=headers)
+        else:
+            async with httpx.AsyncClient(
+                timeout=settings.HTTP_TIMEOUT,
+                headers={"User-Agent": settings.USER_AGENT},
+            ) as client:
+                response = await client.get(url, headers=headers)
+        self._observe_response(response, started)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    def _observe_response(self, response: httpx.Response, started: float) -> None:
+        """Record an upstream response's latency, status and size.
+
+        Args:
+            response: Response whose body has been read.
+            started: ``time.perf_counter()`` when the request was sent.
+        """
+        source = self.source_id
+        metrics.UPSTREAM_REQUEST_SECONDS.observe(
+            time.perf_counter() - started, source=source
+        )
+        metrics.UPSTREAM_RESPONSES.inc(source=source, code=str(response.status_code))
+        metrics.UPSTREAM_BYTES.inc(response.num_bytes_downloaded, source=source)
+
+    async def _parse(
+        self,
+        parse: Callable[[str, int], List[NewsRecord]],
+        body: str,
+        limit: int,
+        cpu_heavy: bool = False,
+    ) -> List[NewsRecord]:
+        """Run a parse function in the parse executor, if one is injected.
+
+        Args:
+            parse: Picklable function turning a body into items.
+            body: Response body.
+            limit: Maximum number of items to parse.
+            cpu_heavy: Route to the executor's pool for CPU-heavy work.
+
+        Returns:
+            List of NewsRecord objects.
+        """
+        self.validators.parsed += 1
+        with metrics.PARSE_SECONDS.time(source=self.source_id):
+            if self.parse_executor is None:
+                return parse(body, limit)
+            return await self.parse_executor.run(
+                parse, body, limit, cpu_heavy=cpu_heavy
+            )
+
+    async def _fetch_parsed(
+        self,
+        url: str,
+        limit: int,
+        parse: Callable[[str, int], List[NewsRecord]],
+        cpu_heavy: bool = False,
+    ) -> List[NewsRecord]:
+        """Fetch a URL with a conditional GET and parse it only if it changed.
+
+        Sends ``If-None-Match``/``If-Modified-Since`` from the previous
+        response. On a 304, or when the body hash matches the previous body,
+        the previously parsed items are returned without parsing again.
+
+        Args:
+            url: URL to fetch.
+            limit: Maximum number of items to return.
+            parse: Picklable function turning a response body into items.
+            cpu_heavy: Route parsing to the executor's pool for CPU-heavy work.
+
+        Returns:
+            List of NewsRecord objects.
+        """
+        cached = self.validators.get(url)
+        headers = {"Accept-Encoding": "gzip"}
+        if cached is not None:
+            headers.update(cached.request_headers())
+
+        response = await self._get(url, headers=headers)
+
+        if cached is not None and response.status_code == 304:
+            self.validators.not_modified += 1
+            return await self._reuse_parsed(cached, limit, parse, cpu_heavy)
+
+        self._note_freshness(url, response, response.content)
+        digest = body_hash(response.content)
+        if cached is not None and cached.body_hash == digest:
+            self.validators.unchanged += 1
+            cached.update_from(response)
+            return await self._reuse_parsed(cached, limit, parse, cpu_heavy)
+
+        body = response.text
+        items = await self._parse(parse, body, limit, cpu_heavy)
+        self.validators.put(
+            url,
+            FeedValidators(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body_hash=digest,
+                body=body,
+                items=items,
+                parsed_limit=limit,
+            ),
+        )
+        return list(items)
+
+    async def _reuse_parsed(
+        self,
+        cached: FeedValidators,
+        limit: int,
+        parse: Callable[[str, int], List[NewsRecord]],
+        cpu_heavy: bool = False,
+    ) -> List[NewsRecord]:
+        """Return previously parsed items, re-parsing only for a larger limit."""
+        if not cached.covers(limit):
+            cached.items = await self._parse(parse, cached.body, limit, cpu_heavy)
+            cached.parsed_limit = limit
+        return cached.items[:limit]
+
+    async def _fetch_streamed(
+        self,
+        url: str,
+        limit: int,
+        make_parser: Callable[[int], StreamingRSSParser],
+        fallback: Callable[[str, int], List[NewsRecord]],
+    ) -> List[NewsRecord]:
+        """Fetch an RSS feed, building items while the body streams in.
+
+        Reading stops, and the connection is closed, as soon as ``limit``
+        items are built. If the bytes read hash the same as last time, the
+        previously built items are returned instead of the new ones.
+        Malformed documents are read in full and parsed with ``fallback``
+        instead. Without a shared pool, or when streaming
+        is disabled, this is the buffered ``_fetch_parsed`` path.
+
+        Args:
+            url: Feed URL.
+            limit: Maximum number of items to return.
+            make_parser: Creates a streaming parser for a limit.
+            fallback: Picklable full-document parser (e.g. feedparser).
+
+        Returns:
+            List of NewsRecord objects.
+        """
+        if self.http_pool is None or not settings.STREAMING_PARSE_ENABLED:
+            return await self._fetch_parsed(url, limit, fallback)
+
+        cached = self.validators.get(url)
+        headers = {"Accept-Encoding": "gzip"}
+        # Streamed bodies are not kept, so only revalidate if no re-parse is needed
+        conditional = cached is not None and cached.covers(limit)
+        if conditional:
+            headers.update(cached.request_headers())
+
+        started = time.perf_counter()
+        async with self.http_pool.stream(url, headers=headers) as response:
+            if conditional and response.status_code == 304:
+                self._observe_response(response, started)
+                self.validators.not_modified += 1
+                return cached.items[:limit]
+            if response.is_error:
+                self._observe_response(response, started)
+            response.raise_for_status()
+
+            parser = make_parser(limit)
+            consumed: List[bytes] = []
+            chunks = response.aiter_bytes()
+            # Parsing is interleaved with the download; time only the parser
+            parse_seconds = 0.0
+            try:
+                async for chunk in chunks:
+                    consumed.append(chunk)
+                    fed_at = time.perf_counter()
+                    await self._feed(parser, chunk)
+                    parse_seconds += time.perf_counter() - fed_at
+                    if parser.done:
+                        break
+                fed_at = time.perf_counter()
+                items = parser.close()
+                parse_seconds += time.perf_counter() - fed_at
+                metrics.PARSE_SECONDS.observe(parse_seconds, source=self.source_id)
+                self.validators.streamed += 1
+            except ET.ParseError:
+                # Malformed feed: read the rest and let feedparser cope
+                async for chunk in chunks:
+                    consumed.append(chunk)
+                body = b"".join(consumed).decode(
+                    response.encoding or "utf-8", errors="replace"
+                )
+                items = await self._parse(fallback, body, limit)
+            self._observe_response(response, started)
+
+        head = b"".join(consumed)
+        self._note_freshness(url, response, head)
+        digest = body_hash(head)
+        if cached is not None and cached.covers(limit) and cached.body_hash == digest:
+            # Same bytes as last time: keep the previous records, so the
+            # store can tell nothing changed
+            self.validators.unchanged += 1
+            cached.update_from(response)
+            return cached.items[:limit]
+        self.validators.put(
+            url,
+            FeedValidators(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body_hash=digest,
+                body="",
+                items=items,
+                parsed_limit=limit,
+            ),
+        )
+        return list(items)
+
+    async def _feed(self, parser: StreamingRSSParser, chunk: bytes) -> None:
+        """Feed a streamed chunk, in the parse executor's threads if large.
+
+        Small chunks are parsed inline, where a thread handoff would cost
+        more than the parse. The parser keeps state between chunks, so it
+        never goes to a process pool.
+        """
+        if (
+            self.parse_executor is None
+            or len(chunk) < settings.STREAMING_PARSE_INLINE_BYTES
+        ):
+            parser.feed(chunk)
+        else:
+            await self.parse_executor.run(parser.feed, chunk)
+
     def __repr__(self) -> str:
         """Return string representation."""
         return f"{self.__class__.__name__}(source_id='{self.source_id}')"
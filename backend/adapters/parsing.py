@@ -0,0 +1,256 @@
+"""Feed and HTML parsing functions shared by the adapters.
+
+These are plain module-level functions so they can run in a worker
+thread or be pickled into a worker process by the parse executor.
+"""
+
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import List, Optional
+from urllib.parse import urljoin
+
+import feedparser
+from bs4 import BeautifulSoup
+
+from backend.models import NewsRecord, is_http_url
+
+
+def _entry_published_at(entry) -> Optional[datetime]:
+    """Return the published (or updated) date of a feedparser entry."""
+    for field in ("published_parsed", "updated_parsed"):
+        parsed = entry.get(field)
+        if parsed:
+            try:
+                return datetime(*parsed[:6])
+            except (ValueError, TypeError):
+                return None
+    return None
+
+
+def parse_rss(
+    body: str,
+    limit: int,
+    source_id: str,
+    source_name: str,
+    include_summary: bool = True,
+) -> List[NewsRecord]:
+    """Parse an RSS document into news items.
+
+    Args:
+        body: RSS document text.
+        limit: Maximum number of articles to parse.
+        source_id: Source identifier set on every item.
+        source_name: Human-readable source name set on every item.
+        include_summary: Whether to keep the entry summary/description.
+
+    Returns:
+        List of NewsRecord objects.
+    """
+    feed = feedparser.parse(body)
+    items: List[NewsRecord] = []
+
+    for entry in feed.entries[:limit]:
+        url = entry.get("link", "")
+        if not is_http_url(url):
+            continue
+
+        # Extract summary/description if available
+        summary = None
+        if include_summary:
+            summary = entry.get("summary", entry.get("description"))
+
+        items.append(
+            NewsRecord(
+                title=entry.get("title", ""),
+                url=url,
+                published_at=_entry_published_at(entry),
+                source=source_id,
+                source_name=source_name,
+                summary=summary,
+            )
+        )
+
+    return items
+
+
+def is_article_link(href: str) -> bool:
+    """Check whether a Yahoo front page link points to an article."""
+    return "news.yahoo.co.jp/articles/" in href or href.startswith("/articles/")
+
+
+def parse_front_page(
+    body: str,
+    limit: int,
+    base_url: str,
+    source_id: str,
+    source_name: str,
+) -> List[NewsRecord]:
+    """Extract article links from the Yahoo front page HTML.
+
+    Args:
+        body: Front page HTML.
+        limit: Maximum number of articles to extract.
+        base_url: URL relative links are resolved against.
+        source_id: Source identifier set on every item.
+        source_name: Human-readable source name set on every item.
+
+    Returns:
+        List of NewsRecord objects.
+    """
+    soup = BeautifulSoup(body, "html.parser")
+    items: List[NewsRecord] = []
+    seen: set[str] = set()
+
+    for anchor in soup.select("a[href]"):
+        href = anchor.get("href")
+        if not href:
+            continue
+
+        # Filter for news article links
+        if not is_article_link(href):
+            continue
+
+        title = " ".join(anchor.get_text(strip=True).split())
+        if not title:
+            continue
+
+        url = urljoin(base_url, href)
+        if url in seen:
+            continue
+
+        seen.add(url)
+        items.append(
+            NewsRecord(
+                title=title,
+                url=url,
+                published_at=None,
+                source=source_id,
+                source_name=source_name,
+            )
+        )
+
+        if len(items) >= limit:
+            break
+
+    return items
+
+
+class _LimitReached(Exception):
+    """Raised inside the tokenizer to stop parsing early."""
+
+
+class ArticleLinkExtractor(HTMLParser):
+    """Tokenizes HTML and collects article anchors, ignoring everything else.
+
+    Unlike a full BeautifulSoup tree this keeps no document structure: only
+    the text of the anchor currently open is buffered, and parsing stops as
+    soon as ``limit`` unique article links have been found.
+    """
+
+    def __init__(self, limit: int, base_url: str):
+        """Initialize the extractor.
+
+        Args:
+            limit: Number of unique article links to collect.
+            base_url: URL relative links are resolved against.
+        """
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.base_url = base_url
+        self.links: List[tuple] = []
+        self._seen: set[str] = set()
+        self._href: Optional[str] = None
+        self._text: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: List[tuple]) -> None:
+        """Open an anchor, or start skipping script/style text."""
+        if tag in ("script", "style"):
+            self._skip_depth += 1
+            return
+        if tag != "a":
+            return
+        # An unclosed anchor ends where the next one starts
+        self._finish_anchor()
+        href = dict(attrs).get("href")
+        if href and is_article_link(href):
+            self._href = href
+            self._text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close an anchor, or stop skipping script/style text."""
+        if tag in ("script", "style"):
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "a":
+            self._finish_anchor()
+
+    def handle_data(self, data: str) -> None:
+        """Buffer text inside an article anchor."""
+        if self._href is not None and not self._skip_depth:
+            # Same as BeautifulSoup's get_text(strip=True)
+            stripped = data.strip()
+            if stripped:
+                self._text.append(stripped)
+
+    def close(self) -> None:
+        """Flush the tokenizer and any anchor left open."""
+        super().close()
+        self._finish_anchor()
+
+    def _finish_anchor(self) -> None:
+        """Record the open anchor if it has a title and is new."""
+        if self._href is None:
+            return
+        href, self._href = self._href, None
+        title = " ".join("".join(self._text).split())
+        if not title:
+            return
+
+        url = urljoin(self.base_url, href)
+        if url in self._seen:
+            return
+        self._seen.add(url)
+        self.links.append((url, title))
+        if len(self.links) >= self.limit:
+            raise _LimitReached
+
+
+def extract_article_links(
+    body: str,
+    limit: int,
+    base_url: str,
+    source_id: str,
+    source_name: str,
+) -> List[NewsRecord]:
+    """Extract article links from the Yahoo front page without a DOM tree.
+
+    Produces the same items as ``parse_front_page`` for well-formed pages
+    while doing a fraction of the work.
+
+    Args:
+        body: Front page HTML.
+        limit: Maximum number of articles to extract.
+        base_url: URL relative links are resolved against.
+        source_id: Source identifier set on every item.
+        source_name: Human-readable source name set on every item.
+
+    Returns:
+        List of NewsRecord objects.
+    """
+    extractor = ArticleLinkExtractor(limit, base_url)
+    try:
+        extractor.feed(body)
+        extractor.close()
+    except _LimitReached:
+        pass
+
+    return [
+        NewsRecord(
+            title=title,
+            url=url,
+            published_at=None,
+            source=source_id,
+            source_name=source_name,
+        )
+        for url, title in extractor.links
+    ]
@@ -0,0 +1,122 @@
+"""Incremental RSS parser with limit pushdown."""
+
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
+
+from backend.models import NewsRecord, is_http_url
+
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Convert to a naive UTC datetime, matching feedparser's output."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _parse_date(item: ET.Element) -> Optional[datetime]:
+    """Return the publication date of an RSS 2.0 or RSS 1.0 item."""
+    for child in item:
+        name = _local_name(child.tag)
+        text = (child.text or "").strip()
+        if not text:
+            continue
+        try:
+            if name == "pubDate":
+                return _to_naive_utc(parsedate_to_datetime(text))
+            if child.tag == _DC_DATE:
+                return _to_naive_utc(datetime.fromisoformat(text))
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+class StreamingRSSParser:
+    """Builds news items from an RSS body fed in chunks.
+
+    Items are built as soon as their closing ``</item>`` tag arrives, and
+    the parser reports ``done`` once ``limit`` items exist so the caller
+    can stop reading the response.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        source_id: str,
+        source_name: str,
+        include_summary: bool = True,
+    ):
+        """Initialize the parser.
+
+        Args:
+            limit: Maximum number of items to build.
+            source_id: Source identifier set on every item.
+            source_name: Human-readable source name set on every item.
+            include_summary: Whether to keep the item description.
+        """
+        self.limit = limit
+        self.source_id = source_id
+        self.source_name = source_name
+        self.include_summary = include_summary
+        self.items: List[NewsRecord] = []
+        self._parser = ET.XMLPullParser(events=("end",))
+
+    @property
+    def done(self) -> bool:
+        """Whether ``limit`` items have been built."""
+        return len(self.items) >= self.limit
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume a chunk of the response body.
+
+        Args:
+            chunk: Next chunk of the raw XML document.
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the document is malformed.
+        """
+        if self.done:
+            return
+        self._parser.feed(chunk)
+        for _, element in self._parser.read_events():
+            if _local_name(element.tag) != "item":
+                continue
+            item = self._build_item(element)
+            if is_http_url(item.url):
+                self.items.append(item)
+            # Release the parsed subtree to keep peak memory flat
+            element.clear()
+            if self.done:
+                break
+
+    def close(self) -> List[NewsRecord]:
+        """Return the items built so far.
+
+        Returns:
+            List of NewsRecord objects.
+        """
+        return self.items[: self.limit]
+
+    def _build_item(self, element: ET.Element) -> NewsRecord:
+        """Turn an ``<item>`` element into a NewsRecord."""
+        fields = {_local_name(child.tag): child.text for child in element}
+        summary = None
+        if self.include_summary:
+            summary = fields.get("description")
+
+        return NewsRecord(
+            title=(fields.get("title") or "").strip(),
+            url=(fields.get("link") or "").strip(),
+            published_at=_parse_date(element),
+            source=self.source_id,
+            source_name=self.source_name,
+            summary=summary,
+        )
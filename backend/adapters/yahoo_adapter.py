@@ -1,167 +1,144 @@
 """Yahoo News adapter."""
 
-from datetime import datetime
-from typing import Any, Dict, List
-from urllib.parse import urljoin
+import asyncio
+from functools import partial
+from typing import Dict, List, Optional
 
-import feedparser
-import httpx
-from bs4 import BeautifulSoup
-
-from backend.adapters.base import NewsAdapter
+from backend.adapters.base import FetchResult, NewsAdapter
+from backend.adapters.parsing import extract_article_links, parse_rss
+from backend.adapters.streaming import StreamingRSSParser
 from backend.config import settings
-from backend.models import NewsItem
+from backend.models import NewsRecord
 
 
 class YahooNewsAdapter(NewsAdapter):
     """Adapter for Yahoo News (RSS + Web Scraping)."""
 
-    def __init__(self):
-        """Initialize Yahoo News adapter."""
+    def __init__(self, deadline: float = settings.YAHOO_FETCH_DEADLINE):
+        """Initialize Yahoo News adapter.
+
+        Args:
+            deadline: Seconds to wait for the RSS and scrape legs.
+        """
         super().__init__(source_id="yahoo", source_name="Yahoo News")
         self.rss_url = settings.NEWS_SOURCES["yahoo"]["rss_url"]
         self.scrape_url = settings.NEWS_SOURCES["yahoo"]["scrape_url"]
+        self.deadline = deadline
 
-    async def fetch_news(self, limit: int = 10) -> List[NewsItem]:
+    async def fetch_news(self, limit: int = 10) -> List[NewsRecord]:
         """Fetch news from Yahoo News using both RSS and scraping.
 
+        Both legs run concurrently under one deadline. If a leg fails or
+        misses the deadline, the items of the other leg are used and the
+        missing leg is recorded in ``FetchResult.missing``.
+
         Args:
             limit: Maximum number of articles to fetch.
 
         Returns:
-            List of NewsItem objects merged from RSS and scraping.
+            FetchResult of NewsRecord objects merged from RSS and scraping.
+
+        Raises:
+            Exception: If neither leg produced a result.
         """
         # Fetch from both sources in parallel
-        rss_items = await self._fetch_rss(limit)
-        scrape_items = await self._fetch_scrape(limit)
+        legs = {
+            "rss": asyncio.ensure_future(self._fetch_rss(limit)),
+            "scrape": asyncio.ensure_future(self._fetch_scrape(limit)),
+        }
+        try:
+            _, pending = await asyncio.wait(legs.values(), timeout=self.deadline)
+        finally:
+            # Also runs when the caller cancels us, so no leg is orphaned
+            for task in legs.values():
+                if not task.done():
+                    task.cancel()
+
+        results: Dict[str, List[NewsRecord]] = {}
+        error: Optional[BaseException] = None
+        for name, task in legs.items():
+            if task in pending:
+                error = error or asyncio.TimeoutError(f"{name} missed the deadline")
+            elif task.exception() is not None:
+                error = error or task.exception()
+            else:
+                results[name] = task.result()
+
+        if not results:
+            raise error
 
         # Merge and deduplicate
-        return self._merge_items(rss_items, scrape_items, limit)
+        merged = self._merge_items(
+            results.get("rss", []), results.get("scrape", []), limit
+        )
+        return FetchResult(merged, missing=[n for n in legs if n not in results])
 
-    async def fetch_rss_only(self, limit: int = 10) -> List[NewsItem]:
+    async def fetch_rss_only(self, limit: int = 10) -> List[NewsRecord]:
         """Fetch news from RSS feed only.
 
         Args:
             limit: Maximum number of articles to fetch.
 
         Returns:
-            List of NewsItem objects from RSS.
+            List of NewsRecord objects from RSS.
         """
         return await self._fetch_rss(limit)
 
-    async def fetch_scrape_only(self, limit: int = 10) -> List[NewsItem]:
+    async def fetch_scrape_only(self, limit: int = 10) -> List[NewsRecord]:
         """Fetch news from web scraping only.
 
         Args:
             limit: Maximum number of articles to fetch.
 
         Returns:
-            List of NewsItem objects from scraping.
+            List of NewsRecord objects from scraping.
         """
         return await self._fetch_scrape(limit)
 
-    async def _fetch_rss(self, limit: int) -> List[NewsItem]:
+    async def _fetch_rss(self, limit: int) -> List[NewsRecord]:
         """Fetch news from RSS feed.
 
         Args:
             limit: Maximum number of articles to fetch.
 
         Returns:
-            List of NewsItem objects.
+            List of NewsRecord objects.
         """
-        async with httpx.AsyncClient(
-            timeout=settings.HTTP_TIMEOUT, headers={"User-Agent": settings.USER_AGENT}
-        ) as client:
-            response = await client.get(self.rss_url)
-            response.raise_for_status()
-
-        feed = feedparser.parse(response.text)
-        items: List[NewsItem] = []
-
-        for entry in feed.entries[:limit]:
-            # Parse published date
-            published_at = None
-            published_str = entry.get("published") or entry.get("updated")
-            if published_str:
-                try:
-                    # feedparser usually parses the date into a struct_time
-                    if hasattr(entry, "published_parsed") and entry.published_parsed:
-                        published_at = datetime(*entry.published_parsed[:6])
-                    elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                        published_at = datetime(*entry.updated_parsed[:6])
-                except (ValueError, TypeError):
-                    pass
-
-            items.append(
-                NewsItem(
-                    title=entry.get("title", ""),
-                    url=entry.get("link", ""),
-                    published_at=published_at,
-                    source=self.source_id,
-                    source_name=self.source_name,
-                )
-            )
-
-        return items
-
-    async def _fetch_scrape(self, limit: int) -> List[NewsItem]:
+        make_parser = partial(
+            StreamingRSSParser,
+            source_id=self.source_id,
+            source_name=self.source_name,
+            include_summary=False,
+        )
+        fallback = partial(
+            parse_rss,
+            source_id=self.source_id,
+            source_name=self.source_name,
+            include_summary=False,
+        )
+        return await self._fetch_streamed(self.rss_url, limit, make_parser, fallback)
+
+    async def _fetch_scrape(self, limit: int) -> List[NewsRecord]:
         """Fetch news from web scraping.
 
         Args:
             limit: Maximum number of articles to fetch.
 
         Returns:
-            List of NewsItem objects.
+            List of NewsRecord objects.
         """
-        async with httpx.AsyncClient(
-            timeout=settings.HTTP_TIMEOUT, headers={"User-Agent": settings.USER_AGENT}
-        ) as client:
-            response = await client.get(self.scrape_url)
-            response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        items: List[NewsItem] = []
-        seen: set[str] = set()
-
-        for anchor in soup.select("a[href]"):
-            href = anchor.get("href")
-            if not href:
-                continue
-
-            # Filter for news article links
-            if (
-                "news.yahoo.co.jp/articles/" not in href
-                and not href.startswith("/articles/")
-            ):
-                continue
-
-            title = " ".join(anchor.get_text(strip=True).split())
-            if not title:
-                continue
-
-            url = urljoin(self.scrape_url, href)
-            if url in seen:
-                continue
-
-            seen.add(url)
-            items.append(
-                NewsItem(
-                    title=title,
-                    url=url,
-                    published_at=None,
-                    source=self.source_id,
-                    source_name=self.source_name,
-                )
-            )
-
-            if len(items) >= limit:
-                break
-
-        return items
+        parse = partial(
+            extract_article_links,
+            base_url=self.scrape_url,
+            source_id=self.source_id,
+            source_name=self.source_name,
+        )
+        # The front page is the largest document we parse
+        return await self._fetch_parsed(self.scrape_url, limit, parse, cpu_heavy=True)
 
     def _merge_items(
-        self, primary: List[NewsItem], secondary: List[NewsItem], limit: int
-    ) -> List[NewsItem]:
+        self, primary: List[NewsRecord], secondary: List[NewsRecord], limit: int
+    ) -> List[NewsRecord]:
         """Merge news items from multiple sources and remove duplicates.
 
         Args:
@@ -170,9 +147,9 @@ class YahooNewsAdapter(NewsAdapter):
             limit: Maximum number of items to return.
 
         Returns:
-            Merged and deduplicated list of NewsItem objects.
+            Merged and deduplicated list of NewsRecord objects.
         """
-        merged: List[NewsItem] = []
+        merged: List[NewsRecord] = []
         seen: set[str] = set()
 
         for item in primary + secondary:
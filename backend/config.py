@@ -12,14 +12,93 @@ class Settings:
 
     # Cache configuration
     CACHE_TTL_SECONDS: int = 300  # 5 minutes
+    CACHE_STALE_SECONDS: int = 600  # Serve stale results this long after TTL
+    CACHE_MAX_ENTRIES: int = 256
+    CACHE_MAX_BYTES: int = 8 * 1024 * 1024  # 8 MB
     MAX_LIMIT: int = 50
 
+    # Near-duplicate clustering (?cluster=true)
+    CLUSTER_SIMILARITY: float = 0.5  # Jaccard similarity of title bigrams
+
+    # Cursor pagination (result snapshots pinned for paging)
+    PAGINATION_SNAPSHOT_TTL_SECONDS: int = 900  # Extended while being paged
+    PAGINATION_MAX_SNAPSHOTS: int = 256
+
+    # Pre-encoded response bodies (built once per cache refresh)
+    RESPONSE_COMPRESS_MIN_BYTES: int = 512  # Smaller bodies are sent as-is
+    RESPONSE_GZIP_LEVEL: int = 6
+    RESPONSE_BROTLI_QUALITY: int = 5  # Requires the optional 'brotli' package
+    # Clients may store /api/news but must revalidate with the ETag each time
+    RESPONSE_CACHE_CONTROL: str = "no-cache"
+
+    # Per-source item store
+    SOURCE_FETCH_LIMIT: int = 50  # Items fetched per source, independent of limit
+    SOURCE_TTL_SECONDS: Dict[str, int] = {
+        "yahoo": 300,
+        "nhk": 180,
+        "google": 300,
+    }
+
+    # Deadlines and circuit breakers for upstream fetches
+    REQUEST_DEADLINE_SECONDS: float = 4.0  # Longest a request waits on refreshes
+    SOURCE_FETCH_TIMEOUT: float = 12.0  # Per-source fetch, covering all its legs
+    CIRCUIT_FAILURE_THRESHOLD: int = 3  # Consecutive failures that open a circuit
+    CIRCUIT_RESET_SECONDS: float = 60.0  # Open time before a half-open probe
+
+    # Ingest log of newly seen articles, pushed by /api/news/stream
+    INGEST_BACKLOG_SIZE: int = 2000  # Recent entries a client can resume from
+    INGEST_SEEN_MAX: int = 20000  # (source, URL) pairs remembered as seen
+    STREAM_HEARTBEAT_SECONDS: float = 15.0  # Keeps proxies from closing idle streams
+    STREAM_RETRY_MILLISECONDS: int = 5000  # Client reconnect delay
+
+    # Persistent article store (SQLite, restored on startup)
+    ARTICLE_STORE_ENABLED: bool = True
+    ARTICLE_STORE_PATH: str = "data/articles.db"
+    ARTICLE_RETENTION_DAYS: float = 30.0  # Since the article was last in a feed
+    ARTICLE_STORE_MAX_ARTICLES: int = 50000
+    HISTORY_MAX_LIMIT: int = 200
+
+    # Adaptive polling: SOURCE_TTL_SECONDS is only the starting interval, then
+    # each source is polled so that about POLL_TARGET_NEW_ITEMS new articles
+    # arrive per poll, never faster than its Cache-Control/<ttl> hint
+    POLL_ADAPTIVE_ENABLED: bool = True
+    POLL_MIN_SECONDS: float = 60.0
+    POLL_MAX_SECONDS: float = 1800.0
+    POLL_SMOOTHING: float = 0.3  # Weight of the newest rate observation
+    POLL_TARGET_NEW_ITEMS: float = 1.0
+
+    # Background ingestion (sources are polled every SOURCE_TTL_SECONDS)
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_WARMUP_TIMEOUT: float = 15.0
+    SCHEDULER_RETRY_SECONDS: float = 30.0
+
     # User agent for HTTP requests
     USER_AGENT: str = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
 
     # HTTP client timeout (seconds)
     HTTP_TIMEOUT: float = 10.0
 
+    # Parse worker pool ('thread' or 'process' for the CPU-heavy HTML path)
+    PARSE_WORKERS: int = 2
+    PARSE_QUEUE_SIZE: int = 16
+    PARSE_HEAVY_EXECUTOR: str = "thread"
+    # Parse RSS incrementally and stop reading once enough items are built
+    STREAMING_PARSE_ENABLED: bool = True
+    # Streamed chunks of at least this many bytes are parsed in the parse
+    # pool; smaller ones (well under a millisecond) are parsed on the loop
+    STREAMING_PARSE_INLINE_BYTES: int = 16384
+
+    # Deadline for Yahoo's concurrent RSS + scrape fetch (seconds)
+    YAHOO_FETCH_DEADLINE: float = 6.0
+
+    # Shared HTTP client pool
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 4
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 120.0
+    HTTP2_ENABLED: bool = True  # Requires the optional 'h2' package
+    HTTP_WARMUP_TIMEOUT: float = 3.0
+
     # News source configurations
     NEWS_SOURCES: Dict[str, Dict[str, str]] = {
         "yahoo": {
@@ -0,0 +1,279 @@
+"""Shared HTTP client pool for news adapters."""
+
+import asyncio
+import hashlib
+import re
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from backend.config import settings
+
+_MAX_AGE = re.compile(r"(?:^|[,\s])(s-maxage|max-age)\s*=\s*\"?(\d+)", re.IGNORECASE)
+_NO_CACHE = re.compile(r"\b(no-cache|no-store)\b", re.IGNORECASE)
+_RSS_TTL = re.compile(rb"<ttl>\s*(\d+)\s*</ttl>", re.IGNORECASE)
+# <ttl> is a channel element, so it appears before the items
+_RSS_TTL_SCAN_BYTES = 16 * 1024
+
+
+def _http2_available() -> bool:
+    """Check whether the optional ``h2`` package is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HTTPClientPool:
+    """App-scoped pooled HTTP client shared by all adapters.
+
+    Wraps a single ``httpx.AsyncClient`` so connections, TLS sessions and
+    DNS lookups are reused across refreshes, and caps the number of
+    concurrent requests per upstream host.
+    """
+
+    def __init__(
+        self,
+        timeout: float = settings.HTTP_TIMEOUT,
+        max_connections: int = settings.HTTP_MAX_CONNECTIONS,
+        max_connections_per_host: int = settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+        max_keepalive_connections: int = settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = settings.HTTP_KEEPALIVE_EXPIRY,
+        http2: bool = settings.HTTP2_ENABLED,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize the client pool.
+
+        Args:
+            timeout: Request timeout in seconds.
+            max_connections: Maximum number of open connections overall.
+            max_connections_per_host: Maximum concurrent requests per host.
+            max_keepalive_connections: Maximum idle connections kept alive.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Enable HTTP/2 when the ``h2`` package is installed.
+            transport: Optional custom transport (e.g. for tests).
+        """
+        self.http2 = http2 and transport is None and _http2_available()
+        self.max_connections_per_host = max_connections_per_host
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            headers={"User-Agent": settings.USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=self.http2,
+            transport=transport,
+        )
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrency for the URL's host."""
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    async def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """Send a GET request through the shared client.
+
+        Args:
+            url: URL to fetch.
+            headers: Optional extra request headers.
+
+        Returns:
+            The HTTP response.
+        """
+        async with self._host_slot(url):
+            return await self.client.get(url, headers=headers)
+
+    @asynccontextmanager
+    async def stream(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[httpx.Response]:
+        """Send a GET request whose body is read incrementally.
+
+        Leaving the context before the body is fully read closes the
+        connection instead of downloading the rest.
+
+        Args:
+            url: URL to fetch.
+            headers: Optional extra request headers.
+
+        Yields:
+            The HTTP response with an unread body.
+        """
+        async with self._host_slot(url):
+            async with self.client.stream("GET", url, headers=headers) as response:
+                yield response
+
+    async def warm_up(
+        self, urls: Iterable[str], timeout: float = settings.HTTP_WARMUP_TIMEOUT
+    ) -> None:
+        """Resolve DNS and open a connection to each upstream host.
+
+        Failures are ignored; warm-up is best effort and never blocks
+        startup for longer than ``timeout`` seconds.
+
+        Args:
+            urls: URLs whose hosts should be warmed.
+            timeout: Overall warm-up budget in seconds.
+        """
+        origins = set()
+        for url in urls:
+            parts = urlsplit(url)
+            origins.add(f"{parts.scheme}://{parts.netloc}/")
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(self._warm_origin(o) for o in origins)),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            pass
+
+    async def _warm_origin(self, origin: str) -> None:
+        """Open a keep-alive connection to a single origin."""
+        try:
+            async with self._host_slot(origin):
+                await self.client.head(origin)
+        except httpx.HTTPError:
+            pass
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self.client.aclose()
+
+
+class FeedValidators:
+    """Cache validators and the last parsed result for one feed URL."""
+
+    __slots__ = (
+        "etag",
+        "last_modified",
+        "body_hash",
+        "body",
+        "items",
+        "parsed_limit",
+    )
+
+    def __init__(
+        self,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body_hash: str,
+        body: str,
+        items: List[Any],
+        parsed_limit: int,
+    ):
+        """Initialize validators for a feed.
+
+        Args:
+            etag: ETag header of the last full response.
+            last_modified: Last-Modified header of the last full response.
+            body_hash: Hash of the last response body.
+            body: Last response body, kept to re-parse with a larger limit.
+            items: Items parsed from the body.
+            parsed_limit: Limit the items were parsed with.
+        """
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body_hash = body_hash
+        self.body = body
+        self.items = items
+        self.parsed_limit = parsed_limit
+
+    def update_from(self, response: httpx.Response) -> None:
+        """Refresh the validators from a response that confirmed the body."""
+        self.etag = response.headers.get("ETag") or self.etag
+        self.last_modified = (
+            response.headers.get("Last-Modified") or self.last_modified
+        )
+
+    def request_headers(self) -> Dict[str, str]:
+        """Build conditional request headers from the stored validators."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def covers(self, limit: int) -> bool:
+        """Check whether the stored items can answer a request for ``limit``.
+
+        The stored items suffice if they were parsed with at least ``limit``
+        or if the feed ran out of entries before the parse limit.
+
+        Streamed fetches store no body (``body=""``), since reading stops
+        once the parse limit is reached. A request for a larger limit is
+        therefore not sent conditionally and downloads the feed in full.
+        """
+        return self.parsed_limit >= limit or len(self.items) < self.parsed_limit
+
+
+class ValidatorStore:
+    """Per-URL store of ETag, Last-Modified and body hash validators."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._entries: Dict[str, FeedValidators] = {}
+        self.not_modified = 0
+        self.unchanged = 0
+        self.parsed = 0
+        self.streamed = 0
+
+    def get(self, url: str) -> Optional[FeedValidators]:
+        """Return the validators stored for a URL, if any."""
+        return self._entries.get(url)
+
+    def put(self, url: str, validators: FeedValidators) -> None:
+        """Store validators for a URL."""
+        self._entries[url] = validators
+
+    def clear(self) -> None:
+        """Forget all stored validators."""
+        self._entries.clear()
+
+
+def freshness_hint(
+    headers: Mapping[str, str], body: Optional[bytes] = None
+) -> Optional[float]:
+    """Return how long the upstream says a response stays fresh.
+
+    Looks at ``Cache-Control`` (``s-maxage`` before ``max-age``) and at an
+    RSS ``<ttl>`` element near the start of the body, and returns the
+    longer of the two.
+
+    Args:
+        headers: Response headers.
+        body: Start of the response body, if it was read.
+
+    Returns:
+        Freshness lifetime in seconds, or None without a usable hint.
+    """
+    hints = []
+    cache_control = headers.get("Cache-Control")
+    if cache_control and not _NO_CACHE.search(cache_control):
+        ages = {k.lower(): int(v) for k, v in _MAX_AGE.findall(cache_control)}
+        age = ages.get("s-maxage", ages.get("max-age"))
+        if age:
+            hints.append(float(age))
+    if body:
+        match = _RSS_TTL.search(body, 0, _RSS_TTL_SCAN_BYTES)
+        if match and int(match.group(1)) > 0:
+            hints.append(int(match.group(1)) * 60.0)  # <ttl> is in minutes
+    return max(hints) if hints else None
+
+
+def body_hash(content: bytes) -> str:
+    """Return a stable hash of a response body."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
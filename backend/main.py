@@ -1,26 +1,48 @@
 from __future__ import annotations
 
 import asyncio
+import secrets
 import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
 
-from fastapi import BackgroundTasks, FastAPI, Request, Query
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import BackgroundTasks, FastAPI, Header, HTTPException, Request, Query
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
+from backend import metrics
 from backend.adapters import YahooNewsAdapter, NHKNewsAdapter, GoogleNewsAdapter
 from backend.config import settings
-from backend.models import NewsItem
-from backend.services import NewsAggregator
+from backend.http_client import HTTPClientPool
+from backend.models import NewsRecord
+from backend.parse_executor import ParseExecutor
+from backend.response_body import EncodedBody, encode_json
+from backend.services import (
+    ArticleStore,
+    IngestionScheduler,
+    NewsAggregator,
+    SingleFlight,
+    SourceStore,
+    StoryCluster,
+    TTLCache,
+    cluster_stories,
+)
+from backend.services.article_store import history_key
+from backend.services.keyword_index import normalize_text, searchable_text
+from backend.services.pagination import (
+    ResultSnapshot,
+    decode_cursor,
+    decode_key_cursor,
+    encode_cursor,
+    encode_key_cursor,
+)
 
 # このファイルの場所を基準にテンプレートディレクトリを解決
 BASE_DIR = Path(__file__).resolve().parent
 TEMPLATE_DIR = BASE_DIR.parent / "frontend"
 
-app = FastAPI(title="News Aggregator API", version="2.0.0")
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
-
 # Initialize adapters
 yahoo_adapter = YahooNewsAdapter()
 nhk_adapter = NHKNewsAdapter()
@@ -35,12 +57,172 @@ aggregator = NewsAggregator(
     }
 )
 
+# Article history on disk, opened in the lifespan
+article_store = ArticleStore()
+# Per-source item store shared by all queries
+source_store = SourceStore(
+    aggregator.adapters,
+    article_store=article_store,
+    breakers=aggregator.breakers,  # One breaker per upstream on every path
+    adaptive=settings.POLL_ADAPTIVE_ENABLED,
+)
+scheduler = IngestionScheduler(source_store)
+
+
+def _upstream_urls() -> List[str]:
+    """Collect the upstream URLs of all enabled sources."""
+    urls = []
+    for source_id in settings.ENABLED_SOURCES:
+        source = settings.NEWS_SOURCES.get(source_id, {})
+        urls.extend(v for k, v in source.items() if k.endswith("_url"))
+    return urls
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Own the shared HTTP client pool, parse pool, article store and scheduler."""
+    if settings.ARTICLE_STORE_ENABLED:
+        # Serve the last saved snapshots until the first polls complete
+        await asyncio.to_thread(article_store.open)
+        await source_store.restore()
+    http_pool = HTTPClientPool()
+    parse_executor = ParseExecutor()
+    for adapter in aggregator.adapters.values():
+        adapter.http_pool = http_pool
+        adapter.parse_executor = parse_executor
+    await http_pool.warm_up(_upstream_urls())
+    if settings.SCHEDULER_ENABLED:
+        # Startup waits until every source not restored above was fetched once
+        await scheduler.start(settings.ENABLED_SOURCES)
+    try:
+        yield
+    finally:
+        await scheduler.stop()
+        for adapter in aggregator.adapters.values():
+            adapter.http_pool = None
+            adapter.parse_executor = None
+        await http_pool.aclose()
+        parse_executor.shutdown()
+        await asyncio.to_thread(article_store.close)
+
+
+app = FastAPI(title="News Aggregator API", version="2.0.0", lifespan=lifespan)
+templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+
 # Cache configuration
 CACHE_TTL_SECONDS = settings.CACHE_TTL_SECONDS
 MAX_LIMIT = settings.MAX_LIMIT
 
-_cache: dict[str, dict[str, Any]] = {}
-_cache_lock = asyncio.Lock()
+_CACHE_ITEM_OVERHEAD = 8  # List slot per record; records belong to the store
+# A cluster holds its title shingles, MinHash signature and merged dict
+_CLUSTER_OVERHEAD = 3500
+_ALTERNATE_OVERHEAD = 200  # One entry in a cluster's alternates list
+
+
+def _results_size(results: ResultSnapshot) -> int:
+    """Estimate the memory held by a result snapshot.
+
+    Records are shared with the source store, so they cost a list slot;
+    clusters and their dictionaries exist only for this snapshot.
+
+    Args:
+        results: Result snapshot, measured as far as it has been produced.
+
+    Returns:
+        Approximate size in bytes.
+    """
+    size = 0
+    for item in results.produced:
+        size += _CACHE_ITEM_OVERHEAD
+        if isinstance(item, StoryCluster):
+            size += _CLUSTER_OVERHEAD + _ALTERNATE_OVERHEAD * len(item.alternates)
+    return size
+
+
+def _cache_entry_size(value: Dict[str, Any]) -> int:
+    """Estimate the memory held by a cached result.
+
+    Args:
+        value: Cached result with an encoded ``body`` and its ``results``.
+
+    Returns:
+        Approximate size in bytes.
+    """
+    return value["body"].size + _results_size(value["results"])
+
+
+# Query-keyed result cache, bounded by entry count and memory
+_cache = TTLCache(
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    max_bytes=settings.CACHE_MAX_BYTES,
+    ttl_seconds=CACHE_TTL_SECONDS,
+    stale_seconds=settings.CACHE_STALE_SECONDS,
+    size_of=_cache_entry_size,
+    # A queried source's snapshot changed since this result was computed
+    is_valid=lambda value: (
+        value["versions"] == source_store.versions_of(value["versions"])
+    ),
+)
+# Concurrent refreshes of the same cache key share one computation
+_refresh_flights = SingleFlight()
+
+
+def _cache_lookups() -> Dict[tuple, float]:
+    """Return the result cache's lookups by outcome."""
+    return {
+        ("hit",): _cache.hits,
+        ("stale",): _cache.stale_hits,
+        ("miss",): _cache.misses,
+    }
+
+
+def _cache_ratios() -> Dict[tuple, float]:
+    """Return each lookup outcome's share of all lookups."""
+    lookups = _cache_lookups()
+    total = sum(lookups.values())
+    return {key: count / total if total else 0.0 for key, count in lookups.items()}
+
+
+metrics.REGISTRY.register(
+    metrics.CallbackMetric(
+        "news_cache_lookups_total",
+        "Result cache lookups by outcome (hit, stale, miss).",
+        "counter",
+        ["result"],
+        _cache_lookups,
+    )
+)
+metrics.REGISTRY.register(
+    metrics.CallbackMetric(
+        "news_cache_lookup_ratio",
+        "Share of result cache lookups per outcome since startup.",
+        "gauge",
+        ["result"],
+        _cache_ratios,
+    )
+)
+metrics.REGISTRY.register(
+    metrics.CallbackMetric(
+        "news_cache_bytes",
+        "Approximate memory held by the result cache.",
+        "gauge",
+        [],
+        lambda: {(): _cache.total_bytes},
+    )
+)
+
+# Result snapshots that cursors point into, independent of source refreshes
+_result_snapshots = TTLCache(
+    max_entries=settings.PAGINATION_MAX_SNAPSHOTS,
+    max_bytes=settings.CACHE_MAX_BYTES,
+    ttl_seconds=settings.PAGINATION_SNAPSHOT_TTL_SECONDS,
+    stale_seconds=0,
+    size_of=_results_size,
+)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+SOURCE_STATUS_HEADER = "X-Source-Status"
+# Ingest sequence a page reflects; resume /api/news/stream from it
+INGEST_SEQUENCE_HEADER = "X-Ingest-Sequence"
 
 
 def _now() -> float:
@@ -57,13 +239,10 @@ def _is_cache_fresh(cache_key: str, limit: int) -> bool:
     Returns:
         True if cache is fresh and sufficient.
     """
-    entry = _cache.get(cache_key)
-    if not entry:
-        return False
-    if _now() - entry["fetched_at"] >= CACHE_TTL_SECONDS:
+    entry = _cache.peek(cache_key)
+    if entry is None or entry.stale:
         return False
-    items = entry.get("items", [])
-    return len(items) >= limit
+    return entry.value["limit"] >= limit
 
 
 def _clamp_limit(limit: int) -> int:
@@ -72,28 +251,53 @@ def _clamp_limit(limit: int) -> int:
     return min(limit, MAX_LIMIT)
 
 
-def _news_items_to_dict(items: List[NewsItem]) -> List[Dict[str, Any]]:
-    """Convert NewsItem objects to dictionary format for API response.
+def _news_items_to_dict(items: List[NewsRecord]) -> List[Dict[str, Any]]:
+    """Convert news records to dictionary format for API response.
 
     Args:
-        items: List of NewsItem objects.
+        items: List of NewsRecord objects.
 
     Returns:
         List of dictionaries compatible with existing frontend.
     """
-    result = []
-    for item in items:
-        result.append(
-            {
-                "title": item.title,
-                "url": str(item.url),
-                "published_at": item.published_at.isoformat() if item.published_at else None,
-                "source": item.source,
-                "source_name": item.source_name,
-                "summary": item.summary,
-            }
-        )
-    return result
+    return [item.to_dict() for item in items]
+
+
+def _resolve_sources(sources: List[str]) -> List[str]:
+    """Map requested source identifiers to store source IDs.
+
+    Args:
+        sources: Requested source identifiers, possibly including 'all'.
+
+    Returns:
+        Known source IDs, falling back to Yahoo if none are known.
+    """
+    if "all" in sources:
+        return list(aggregator.adapters.keys())
+    # Validate and filter sources
+    valid_sources = [s for s in sources if s in aggregator.adapters]
+    if not valid_sources:
+        valid_sources = ["yahoo"]  # Default fallback
+    return valid_sources
+
+
+def _source_status_headers(sources: List[str]) -> Dict[str, str]:
+    """Describe the current state of each queried source.
+
+    Args:
+        sources: Requested source identifiers.
+
+    Returns:
+        Header like ``X-Source-Status: yahoo=ok, nhk=timeout``; empty for
+        the legacy Yahoo modes, which bypass the store.
+    """
+    if any(mode in sources for mode in ("rss", "scrape", "mixed")):
+        return {}
+    statuses = ", ".join(
+        f"{source_id}={source_store.status(source_id)}"
+        for source_id in _resolve_sources(sources)
+    )
+    return {SOURCE_STATUS_HEADER: statuses}
 
 
 async def _fetch_news(
@@ -102,50 +306,64 @@ async def _fetch_news(
     sort_by: str = "published_at",
     sort_order: str = "desc",
     keyword: Optional[str] = None,
-) -> List[Dict[str, Any]]:
+) -> Iterable[NewsRecord]:
     """Fetch news using the aggregator or specific adapter.
 
     Args:
         sources: List of source identifiers.
-        limit: Maximum number of items to return.
+        limit: Number of items to fetch in the legacy Yahoo modes.
         sort_by: Sort field ('published_at' or 'source').
         sort_order: Sort order ('asc' or 'desc').
-        keyword: Optional keyword to filter by title.
+        keyword: Optional keyword to filter by title or summary.
 
     Returns:
-        List of news items as dictionaries.
+        All matching news records in their final order. Date-sorted
+        results are produced lazily from the immutable source snapshots.
     """
     # Handle legacy Yahoo-specific modes
     if "rss" in sources:
-        items = await yahoo_adapter.fetch_rss_only(limit)
-        return _news_items_to_dict(items)
+        return await yahoo_adapter.fetch_rss_only(limit)
     elif "scrape" in sources:
-        items = await yahoo_adapter.fetch_scrape_only(limit)
-        return _news_items_to_dict(items)
+        return await yahoo_adapter.fetch_scrape_only(limit)
     elif "mixed" in sources:
-        items = await yahoo_adapter.fetch_news(limit)
-        return _news_items_to_dict(items)
+        return await yahoo_adapter.fetch_news(limit)
 
-    # Handle new multi-source aggregation
-    if "all" in sources:
-        # Fetch from all sources
-        items = await aggregator.fetch_and_aggregate(
-            limit=limit, sort_by=sort_by, sort_order=sort_order, keyword=keyword
-        )
-    else:
-        # Validate and filter sources
-        valid_sources = [s for s in sources if s in aggregator.adapters]
-        if not valid_sources:
-            valid_sources = ["yahoo"]  # Default fallback
-        items = await aggregator.fetch_and_aggregate(
-            sources=valid_sources,
-            limit=limit,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            keyword=keyword,
+    # Handle new multi-source aggregation from the per-source store
+    valid_sources = _resolve_sources(sources)
+
+    # While the scheduler runs, requests only read the published snapshots
+    refresh = not scheduler.running
+    if sort_by == "published_at" and not keyword:
+        # Merge the presorted per-source streams only as far as pages need
+        streams = await source_store.get_sorted_streams(
+            valid_sources, sort_order, refresh=refresh
         )
+        return aggregator.iter_sorted_streams(streams, sort_order)
+
+    # Keyword matches come from the store's index instead of a scan
+    stored_items = await source_store.get_items(
+        valid_sources, refresh=refresh, keyword=keyword
+    )
+    with metrics.REQUEST_STAGE_SECONDS.time(stage="merge_sort"):
+        return aggregator.aggregate(stored_items, None, sort_by, sort_order)
 
-    return _news_items_to_dict(items)
+
+def _pin_results(results: ResultSnapshot) -> None:
+    """Keep a result snapshot reachable by its cursors.
+
+    Called after every page, so the snapshot is measured again as paging
+    produces more of it.
+    """
+    _result_snapshots.set(results.snapshot_id, results)
+
+
+def _page_headers(
+    results: ResultSnapshot, offset: int, has_more: bool
+) -> Dict[str, str]:
+    """Return the pagination headers for a page ending at ``offset``."""
+    if not has_more:
+        return {}
+    return {NEXT_CURSOR_HEADER: encode_cursor(results.snapshot_id, offset)}
 
 
 async def _refresh_cache(
@@ -155,7 +373,8 @@ async def _refresh_cache(
     sort_by: str = "published_at",
     sort_order: str = "desc",
     keyword: Optional[str] = None,
-) -> List[Dict[str, Any]]:
+    cluster: bool = False,
+) -> Dict[str, Any]:
     """Refresh the cache for given sources.
 
     Args:
@@ -165,36 +384,95 @@ async def _refresh_cache(
         sort_by: Sort field.
         sort_order: Sort order.
         keyword: Optional keyword filter.
+        cluster: Collapse near-duplicate stories from different sources.
 
     Returns:
-        List of news items.
+        Cached first page with its encoded body and result snapshot.
     """
-    async with _cache_lock:
-        if _is_cache_fresh(cache_key, limit):
-            return _cache[cache_key]["items"]
-
-        items = await _fetch_news(sources, limit, sort_by, sort_order, keyword)
-        _cache[cache_key] = {
-            "items": items,
-            "fetched_at": _now(),
+    if _is_cache_fresh(cache_key, limit):
+        return _cache.peek(cache_key).value
+
+    async def rebuild() -> Dict[str, Any]:
+        records = await _fetch_news(sources, limit, sort_by, sort_order, keyword)
+        versions = source_store.versions_of(_resolve_sources(sources))
+        sequence = source_store.ingest_log.sequence
+        # Date-sorted streams are merged lazily, as the first page is taken
+        with metrics.REQUEST_STAGE_SECONDS.time(stage="paginate"):
+            if cluster:
+                # Clustering needs every article, so the ordering is materialized
+                records = cluster_stories(records)
+            results = ResultSnapshot(secrets.token_hex(8), records)
+            page, has_more = results.page(0, limit)
+        with metrics.REQUEST_STAGE_SECONDS.time(stage="serialize"):
+            # Serialize and compress once; cache hits only copy these bytes
+            body = EncodedBody.build(_news_items_to_dict(page))
+        value = {
+            "body": body,
+            "headers": {
+                **_page_headers(results, limit, has_more),
+                INGEST_SEQUENCE_HEADER: str(sequence),
+            },
+            "results": results,
             "limit": limit,
+            "versions": versions,
         }
-        return items
+        _pin_results(results)
+        _cache.set(cache_key, value)
+        return value
 
+    coalesced = "true" if _refresh_flights.in_flight(cache_key) else "false"
+    with metrics.REFRESH_WAIT_SECONDS.time(coalesced=coalesced):
+        return await _refresh_flights.do(cache_key, rebuild)
 
-def _get_cached_items(cache_key: str) -> List[Dict[str, Any]] | None:
-    """Get cached items for a cache key.
 
-    Args:
-        cache_key: Cache key.
+def _first_page_response(
+    value: Dict[str, Any],
+    accept_encoding: Optional[str],
+    if_none_match: Optional[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Serve a cached first page and keep its cursors valid.
 
-    Returns:
-        Cached items or None if not available.
+    ``headers`` are added to the stored page headers, for metadata that
+    changes independently of the cached body.
     """
-    entry = _cache.get(cache_key)
-    if not entry:
-        return None
-    return entry.get("items")
+    _pin_results(value["results"])
+    body = value["body"]
+    return body.response(
+        accept_encoding, if_none_match, {**value["headers"], **(headers or {})}
+    )
+
+
+def _cursor_page_response(
+    cursor: str,
+    limit: int,
+    accept_encoding: Optional[str],
+    if_none_match: Optional[str],
+) -> Response:
+    """Serve the page a cursor points to.
+
+    Raises:
+        HTTPException: 400 for a malformed cursor, 410 once its result
+            snapshot has expired.
+    """
+    try:
+        snapshot_id, offset = decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    entry = _result_snapshots.get(snapshot_id)
+    if entry is None:
+        raise HTTPException(
+            status_code=410, detail="Cursor expired; start again without a cursor"
+        )
+    results = entry.value
+    page, has_more = results.page(offset, limit)
+    _pin_results(results)
+
+    headers = _page_headers(results, offset + limit, has_more)
+    with metrics.REQUEST_STAGE_SECONDS.time(stage="serialize"):
+        body = EncodedBody.build(_news_items_to_dict(page))
+    return body.response(accept_encoding, if_none_match, headers)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -204,6 +482,7 @@ async def root(request: Request) -> HTMLResponse:
 
 @app.get("/api/news")
 async def get_news(
+    request: Request,
     background_tasks: BackgroundTasks,
     sources: Optional[str] = Query(
         default="all",
@@ -218,21 +497,48 @@ async def get_news(
         default="desc", description="Sort order: 'asc' or 'desc'"
     ),
     keyword: Optional[str] = Query(
-        default=None, description="Filter by keyword in title"
+        default=None, description="Filter by keyword in title or summary"
+    ),
+    cluster: bool = Query(
+        default=False,
+        description="Collapse the same story from several sources into one item",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description=f"Continue from a previous page's {NEXT_CURSOR_HEADER} header",
     ),
-) -> JSONResponse:
+    since: Optional[str] = Query(
+        default=None,
+        description=f"Only items ingested after this {INGEST_SEQUENCE_HEADER} "
+        "value or ISO 8601 timestamp",
+    ),
+) -> Response:
     """Get news from specified sources with filtering and sorting.
 
     Args:
+        request: Incoming request, used for content negotiation.
         background_tasks: FastAPI background tasks.
         sources: Comma-separated source list or special values.
         limit: Maximum number of items to return.
         sort_by: Sort field ('published_at' or 'source').
         sort_order: Sort order ('asc' or 'desc').
-        keyword: Optional keyword to filter by title.
+        keyword: Optional keyword to filter by title or summary.
+        cluster: Collapse near-duplicate stories into one item with an
+            ``alternates`` list of the other sources' articles.
+        cursor: Opaque cursor of the next page. Sources, sorting, keyword
+            and clustering come from the snapshot it points into; ``limit``
+            sets the page size.
+        since: Watermark from a previous response's ``X-Ingest-Sequence``
+            header, or a timestamp. Only items ingested after it are
+            returned, without clustering or cursors, and the header holds
+            the next watermark.
 
     Returns:
-        JSON response with news items.
+        JSON response with news items, compressed if the client accepts it,
+        or 304 Not Modified if the client's ETag is current. If more items
+        follow, the ``X-Next-Cursor`` header holds the cursor to them.
+        First pages carry an ``X-Source-Status`` header with each source's
+        status: ok, stale, timeout, error, circuit_open or pending.
     """
     # Validate sort parameters
     if sort_by not in ["published_at", "source"]:
@@ -248,27 +554,371 @@ async def get_news(
     # Create cache key from parameters
     cache_key = (
         f"{','.join(sorted(source_list))}:{limit}:{sort_by}:{sort_order}"
-        f":{keyword or ''}"
+        f":{keyword or ''}:{int(cluster)}"
     )
 
+    accept_encoding = request.headers.get("accept-encoding")
+    if_none_match = request.headers.get("if-none-match")
+
+    if cursor is not None:
+        # Later pages come from the pinned snapshot, not the current data
+        return _cursor_page_response(cursor, limit, accept_encoding, if_none_match)
+
+    if since is not None:
+        return await _delta_response(
+            since,
+            source_list,
+            limit,
+            sort_by,
+            sort_order,
+            keyword,
+            accept_encoding,
+            if_none_match,
+        )
+
     # Check cache
-    cached_items = _get_cached_items(cache_key)
+    entry = _cache.get(cache_key)
 
-    if cached_items and _is_cache_fresh(cache_key, limit):
-        return JSONResponse(cached_items[:limit])
+    if entry is not None and not entry.stale:
+        return _first_page_response(
+            entry.value,
+            accept_encoding,
+            if_none_match,
+            _source_status_headers(source_list),
+        )
 
-    if cached_items and len(cached_items) >= limit:
+    if entry is not None:
         # Return cached data and refresh in background
-        background_tasks.add_task(
-            _refresh_cache, cache_key, source_list, limit, sort_by, sort_order, keyword
+        if not _refresh_flights.in_flight(cache_key):
+            background_tasks.add_task(
+                _refresh_cache,
+                cache_key,
+                source_list,
+                limit,
+                sort_by,
+                sort_order,
+                keyword,
+                cluster,
+            )
+        return _first_page_response(
+            entry.value,
+            accept_encoding,
+            if_none_match,
+            _source_status_headers(source_list),
         )
-        return JSONResponse(cached_items[:limit])
 
     # Fetch new data
-    items = await _refresh_cache(
-        cache_key, source_list, limit, sort_by, sort_order, keyword
+    value = await _refresh_cache(
+        cache_key, source_list, limit, sort_by, sort_order, keyword, cluster
+    )
+    return _first_page_response(
+        value, accept_encoding, if_none_match, _source_status_headers(source_list)
+    )
+
+
+def _ingest_filter(
+    sources: List[str], keyword: Optional[str]
+) -> Callable[[NewsRecord], bool]:
+    """Build the predicate selecting ingested articles for a client.
+
+    Args:
+        sources: Source IDs the client reads.
+        keyword: Only select articles whose title or summary contains this.
+
+    Returns:
+        Function telling whether a record matches.
+    """
+    allowed = set(sources)
+    needle = normalize_text(keyword) if keyword else None
+    return lambda record: record.source in allowed and (
+        needle is None or needle in searchable_text(record)
+    )
+
+
+def _parse_since(since: str) -> int:
+    """Turn a ``since`` watermark into an ingest sequence number.
+
+    Args:
+        since: An ingest sequence number, as in ``X-Ingest-Sequence``, or
+            an ISO 8601 timestamp. Timestamps without a zone are UTC.
+
+    Returns:
+        Sequence number of the last article ingested at or before it.
+
+    Raises:
+        HTTPException: 400 if the value is neither.
+    """
+    if since.isdigit():
+        return int(since)
+    try:
+        when = datetime.fromisoformat(since.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="since must be an ingest sequence or an ISO 8601 timestamp",
+        )
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return source_store.ingest_log.sequence_at(when.timestamp())
+
+
+async def _delta_response(
+    since: str,
+    sources: List[str],
+    limit: int,
+    sort_by: str,
+    sort_order: str,
+    keyword: Optional[str],
+    accept_encoding: Optional[str],
+    if_none_match: Optional[str],
+) -> Response:
+    """Serve the articles ingested after a client's watermark.
+
+    At most ``limit`` articles are returned, the earliest ingested first
+    in sequence order; the ``X-Ingest-Sequence`` header holds the new
+    watermark, which stops before the first article left out when more
+    remain.
+
+    Raises:
+        HTTPException: 400 for a malformed watermark, 410 if the articles
+            after it are no longer retained.
+    """
+    after = _parse_since(since)
+    valid_sources = _resolve_sources(sources)
+    if not scheduler.running:
+        # Without the scheduler, requests drive ingestion
+        await source_store.get_items(valid_sources)
+
+    log = source_store.ingest_log
+    watermark = log.sequence
+    entries = log.since(after)
+    if entries is None:
+        raise HTTPException(
+            status_code=410, detail="since is too old; reload without since"
+        )
+    matches = _ingest_filter(valid_sources, keyword)
+    items = []
+    for sequence, record in entries:
+        if not matches(record):
+            continue
+        if len(items) == limit:
+            # Continue from this item on the next request
+            watermark = sequence - 1
+            break
+        items.append(record)
+
+    items = aggregator.merge_and_sort(items, None, sort_by, sort_order)
+    headers = {
+        INGEST_SEQUENCE_HEADER: str(watermark),
+        **_source_status_headers(valid_sources),
+    }
+    body = EncodedBody.build(_news_items_to_dict(items))
+    return body.response(accept_encoding, if_none_match, headers)
+
+
+def _sse_event(
+    data: Optional[str] = None,
+    event: Optional[str] = None,
+    event_id: Optional[int] = None,
+) -> str:
+    """Format one Server-Sent Events message.
+
+    A message with only an ID moves the client's ``Last-Event-ID`` forward
+    without dispatching an event.
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    if data is not None:
+        lines.extend(f"data: {line}" for line in data.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+
+async def _stream_events(
+    is_disconnected: Callable[[], Any],
+    sources: List[str],
+    keyword: Optional[str],
+    after: int,
+    heartbeat: float = settings.STREAM_HEARTBEAT_SECONDS,
+) -> AsyncIterator[str]:
+    """Yield SSE messages for articles ingested after a sequence number.
+
+    Args:
+        is_disconnected: Coroutine function telling whether the client left.
+        sources: Source IDs to push.
+        keyword: Only push articles whose title or summary contains this.
+        after: Last ingest sequence the client has.
+        heartbeat: Seconds between keep-alive messages while idle.
+
+    Yields:
+        ``news`` events with a JSON list of new items (newest first), and a
+        ``reset`` event when the client's position can no longer be resumed
+        and it should reload the list.
+    """
+    log = source_store.ingest_log
+    matches = _ingest_filter(sources, keyword)
+    position = after
+    yield f"retry: {settings.STREAM_RETRY_MILLISECONDS}\n\n"
+    while not await is_disconnected():
+        entries = log.since(position)
+        if entries is None:
+            position = log.sequence
+            yield _sse_event("{}", event="reset", event_id=position)
+            continue
+        if entries:
+            position = entries[-1][0]
+            items = [
+                record.to_dict() for _, record in reversed(entries) if matches(record)
+            ]
+            if items:
+                data = encode_json(items).decode("utf-8")
+                yield _sse_event(data, event="news", event_id=position)
+            else:
+                yield _sse_event(event_id=position)
+            continue
+        if not await log.wait(position, heartbeat):
+            yield ": keep-alive\n\n"
+
+
+@app.get("/api/news/stream")
+async def stream_news(
+    request: Request,
+    sources: Optional[str] = Query(
+        default="all",
+        description="Comma-separated list of sources (yahoo,nhk,google) or 'all'",
+    ),
+    keyword: Optional[str] = Query(
+        default=None, description="Only push items with this keyword"
+    ),
+    last_event_id: Optional[str] = Query(
+        default=None,
+        description=f"Ingest sequence to resume after, e.g. from "
+        f"{INGEST_SEQUENCE_HEADER}",
+    ),
+    last_event_id_header: Optional[str] = Header(
+        default=None, alias="Last-Event-ID"
+    ),
+) -> StreamingResponse:
+    """Push newly ingested articles as Server-Sent Events.
+
+    Args:
+        request: Incoming request, polled for disconnects.
+        sources: Comma-separated source list or 'all'.
+        keyword: Optional keyword to filter by title or summary.
+        last_event_id: Sequence to resume after on the first connection.
+        last_event_id_header: ``Last-Event-ID`` sent by a reconnecting
+            EventSource; takes precedence over the query parameter.
+
+    Returns:
+        An event stream that stays open until the client disconnects.
+        Without a position, only articles ingested from now on are pushed.
+    """
+    source_list = [s.strip().lower() for s in sources.split(",") if s.strip()]
+    resume = last_event_id_header or last_event_id
+    if resume is None:
+        after = source_store.ingest_log.sequence
+    else:
+        try:
+            after = int(resume)
+        except ValueError:
+            after = -1  # Not resumable; the stream starts with a reset
+
+    events = _stream_events(
+        request.is_disconnected,
+        _resolve_sources(source_list or ["all"]),
+        keyword,
+        after,
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/news/history")
+async def get_news_history(
+    request: Request,
+    sources: Optional[str] = Query(
+        default="all",
+        description="Comma-separated list of sources (yahoo,nhk,google) or 'all'",
+    ),
+    limit: int = Query(default=20, ge=1, le=settings.HISTORY_MAX_LIMIT),
+    before: Optional[datetime] = Query(
+        default=None,
+        description="Only articles published before this time (ISO 8601)",
+    ),
+    keyword: Optional[str] = Query(
+        default=None, description="Filter by keyword in title or summary"
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description=f"Continue from a previous page's {NEXT_CURSOR_HEADER} header",
+    ),
+) -> Response:
+    """Get stored articles, including ones no longer in the live feeds.
+
+    Args:
+        request: Incoming request, used for content negotiation.
+        sources: Comma-separated source list or 'all'.
+        limit: Maximum number of items to return.
+        before: Only return articles published before this time.
+        keyword: Optional keyword to filter by title or summary.
+        cursor: Cursor of the next page, used with the same other
+            parameters as the previous page.
+
+    Returns:
+        JSON response with news items, newest first. If more items follow,
+        the ``X-Next-Cursor`` header holds the cursor to them.
+
+    Raises:
+        HTTPException: 400 for a malformed cursor, 503 if the article
+            store is disabled.
+    """
+    if not article_store.is_open:
+        raise HTTPException(status_code=503, detail="Article history is disabled")
+
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_key_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    source_list = [s.strip().lower() for s in sources.split(",") if s.strip()]
+    if not source_list or "all" in source_list:
+        source_list = list(aggregator.adapters.keys())
+
+    # One extra row tells whether a next page exists
+    records = await asyncio.to_thread(
+        article_store.history, source_list, limit + 1, before, keyword, after
+    )
+    headers = {}
+    if len(records) > limit:
+        records = records[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_key_cursor(history_key(records[-1]))
+    body = EncodedBody.build(_news_items_to_dict(records))
+    return body.response(
+        request.headers.get("accept-encoding"),
+        request.headers.get("if-none-match"),
+        headers,
+    )
+
+
+@app.get("/metrics")
+def get_metrics() -> Response:
+    """Expose the service metrics in the Prometheus text format.
+
+    Returns:
+        Upstream latency, status and bytes per source, parse time per
+        adapter, result cache lookups, refresh waits and /api/news stage
+        timings.
+    """
+    return Response(
+        metrics.REGISTRY.render(), media_type="text/plain; version=0.0.4"
     )
-    return JSONResponse(items[:limit])
 
 
 @app.get("/health")
@@ -290,6 +940,8 @@ def get_sources() -> JSONResponse:
                 "id": source_id,
                 "name": adapter.source_name,
                 "enabled": source_id in settings.ENABLED_SOURCES,
+                "status": source_store.status(source_id),
+                "poll_interval_seconds": round(source_store.ttl_for(source_id), 1),
             }
         )
     return JSONResponse(
@@ -0,0 +1,283 @@
+"""In-process metrics exposed in the Prometheus text format."""
+
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, LabelValues, float]
+
+# Seconds; the Prometheus client defaults
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the text format."""
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    return repr(float(value))
+
+
+class Metric:
+    """Base class of a metric family with fixed label names.
+
+    Metrics are only updated from the event loop thread (parse timings are
+    recorded after the worker returns), so plain dictionaries are enough
+    and recording never takes a lock.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        """Initialize the metric.
+
+        Args:
+            name: Metric name.
+            help: One-line description.
+            labelnames: Names of the labels every sample carries.
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Return the label values in ``labelnames`` order."""
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield (sample name, label values, value) for every series."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Return the text format lines of the family."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for sample_name, values, value in self.samples():
+            names = self.labelnames
+            if sample_name.endswith("_bucket"):
+                names += ("le",)
+            labels = ",".join(
+                f'{name}="{_escape(label)}"' for name, label in zip(names, values)
+            )
+            if labels:
+                labels = "{" + labels + "}"
+            lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add to the count of a label set.
+
+        Args:
+            amount: Non-negative increment.
+            **labels: Value of every label name.
+        """
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current count of a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        for key, value in sorted(self._values.items()):
+            yield self.name, key, value
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name.
+            help: One-line description.
+            labelnames: Names of the labels every sample carries.
+            buckets: Sorted upper bounds; ``+Inf`` is added.
+        """
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets) + (float("inf"),)
+        # Per label set: per-bucket counts (not cumulative), sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one value.
+
+        Args:
+            value: Observed value, e.g. a duration in seconds.
+            **labels: Value of every label name.
+        """
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = ([0] * len(self.buckets), [0.0])
+            self._series[key] = series
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1][0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of a ``with`` block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations of a label set."""
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def samples(self) -> Iterator[Sample]:
+        for key, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f"{self.name}_bucket", key + (_format_value(bound),), cumulative
+            yield f"{self.name}_sum", key, total[0]
+            yield f"{self.name}_count", key, cumulative
+
+
+class CallbackMetric(Metric):
+    """Metric whose values are read from existing counters at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        kind: str,
+        labelnames: Sequence[str],
+        collect: Callable[[], Dict[LabelValues, float]],
+    ):
+        """Initialize the metric.
+
+        Args:
+            name: Metric name.
+            help: One-line description.
+            kind: Prometheus type, e.g. 'counter' or 'gauge'.
+            labelnames: Names of the labels every sample carries.
+            collect: Returns the current value of every label set.
+        """
+        super().__init__(name, help, labelnames)
+        self.kind = kind
+        self.collect = collect
+
+    def samples(self) -> Iterator[Sample]:
+        for key, value in sorted(self.collect().items()):
+            yield self.name, key, value
+
+
+class Registry:
+    """Set of metric families rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric family, replacing one with the same name.
+
+        Returns:
+            The registered metric.
+        """
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Return every family in the Prometheus text format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+SOURCE_FETCHES = REGISTRY.register(
+    Counter(
+        "news_source_fetches_total",
+        "Source fetches by outcome (ok, partial, timeout, error, circuit_open).",
+        ["source", "status"],
+    )
+)
+SOURCE_FETCH_SECONDS = REGISTRY.register(
+    Histogram(
+        "news_source_fetch_seconds",
+        "Duration of a whole source fetch, including parsing.",
+        ["source"],
+    )
+)
+UPSTREAM_REQUEST_SECONDS = REGISTRY.register(
+    Histogram(
+        "news_upstream_request_seconds",
+        "Duration of one upstream HTTP request, including the body.",
+        ["source"],
+    )
+)
+UPSTREAM_RESPONSES = REGISTRY.register(
+    Counter(
+        "news_upstream_responses_total",
+        "Upstream HTTP responses by status code.",
+        ["source", "code"],
+    )
+)
+UPSTREAM_BYTES = REGISTRY.register(
+    Counter(
+        "news_upstream_bytes_total",
+        "Bytes downloaded from upstreams, as sent on the wire.",
+        ["source"],
+    )
+)
+PARSE_SECONDS = REGISTRY.register(
+    Histogram(
+        "news_parse_seconds",
+        "Time spent parsing one upstream response, including any worker wait.",
+        ["source"],
+    )
+)
+PARSE_QUEUE_WAIT_SECONDS = REGISTRY.register(
+    Histogram(
+        "news_parse_queue_wait_seconds",
+        "Time a parse job waited for a queue slot and a worker.",
+        ["pool"],
+    )
+)
+REFRESH_WAIT_SECONDS = REGISTRY.register(
+    Histogram(
+        "news_refresh_wait_seconds",
+        "Time a request waited for a cache refresh it started or joined.",
+        ["coalesced"],
+    )
+)
+REQUEST_STAGE_SECONDS = REGISTRY.register(
+    Histogram(
+        "news_request_stage_seconds",
+        "Time spent in /api/news stages (merge_sort, serialize).",
+        ["stage"],
+    )
+)
@@ -1,5 +1,21 @@
 """Data models for the news aggregator."""
 
 from .news import NewsItem
+from .record import (
+    NewsRecord,
+    drop_invalid,
+    is_http_url,
+    published_key,
+    timestamp_of,
+    validate_records,
+)
 
-__all__ = ["NewsItem"]
+__all__ = [
+    "NewsItem",
+    "NewsRecord",
+    "drop_invalid",
+    "is_http_url",
+    "published_key",
+    "timestamp_of",
+    "validate_records",
+]
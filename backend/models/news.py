@@ -1,7 +1,7 @@
 """News item data model."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field, HttpUrl
 
@@ -22,6 +22,18 @@ class NewsItem(BaseModel):
     image_url: Optional[HttpUrl] = Field(None, description="URL to article thumbnail")
     category: Optional[str] = Field(None, description="Article category")
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary format used by the API response."""
+        published_at = self.published_at.isoformat() if self.published_at else None
+        return {
+            "title": self.title,
+            "url": str(self.url),
+            "published_at": published_at,
+            "source": self.source,
+            "source_name": self.source_name,
+            "summary": self.summary,
+        }
+
     class Config:
         """Pydantic configuration."""
 
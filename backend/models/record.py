@@ -0,0 +1,204 @@
+"""Lightweight internal news record."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from pydantic import TypeAdapter, ValidationError
+
+from .news import NewsItem
+
+_news_item_list = TypeAdapter(List[NewsItem])
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+# Sorts below every real date, like datetime.min did
+MISSING_TIMESTAMP = -(2**63)
+
+
+def is_http_url(url: str) -> bool:
+    """Cheap structural check for an absolute http(s) URL."""
+    parts = urlsplit(url)
+    return parts.scheme in ("http", "https") and bool(parts.netloc)
+
+
+def timestamp_of(published_at: Optional[datetime]) -> int:
+    """Return an integer sort key for a publication date.
+
+    Args:
+        published_at: Naive UTC or timezone-aware datetime, or None.
+
+    Returns:
+        Microseconds since the UNIX epoch, or ``MISSING_TIMESTAMP``.
+    """
+    if published_at is None:
+        return MISSING_TIMESTAMP
+    if published_at.tzinfo is not None:
+        published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return (published_at - _EPOCH) // _MICROSECOND
+
+
+class NewsRecord:
+    """Compact representation of a news article on the ingest-to-response path.
+
+    Unlike NewsItem it performs no validation on construction and keeps the
+    URL as a plain string. The publication date is also kept as an integer
+    ``timestamp`` for cheap sorting, and the API dictionary is built once
+    and reused by every response that includes the record. Fetched records
+    are checked in bulk with ``drop_invalid`` before they are served; use
+    ``to_news_item`` or ``validate_records`` where a validated model is needed.
+    """
+
+    __slots__ = (
+        "title",
+        "url",
+        "published_at",
+        "source",
+        "source_name",
+        "summary",
+        "image_url",
+        "category",
+        "timestamp",
+        "_dict",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        url: str,
+        published_at: Optional[datetime],
+        source: str,
+        source_name: str,
+        summary: Optional[str] = None,
+        image_url: Optional[str] = None,
+        category: Optional[str] = None,
+    ):
+        """Initialize the record.
+
+        Args:
+            title: The title of the news article.
+            url: The URL to the full article.
+            published_at: The publication date and time.
+            source: Source identifier (e.g., 'yahoo', 'nhk').
+            source_name: Human-readable source name (e.g., 'Yahoo News').
+            summary: Brief summary of the article.
+            image_url: URL to article thumbnail.
+            category: Article category.
+        """
+        self.title = title
+        self.url = url
+        self.published_at = published_at
+        self.source = source
+        self.source_name = source_name
+        self.summary = summary
+        self.image_url = image_url
+        self.category = category
+        self.timestamp = timestamp_of(published_at)
+        self._dict: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_news_item(cls, item: NewsItem) -> "NewsRecord":
+        """Create a record from a validated NewsItem."""
+        return cls(
+            title=item.title,
+            url=str(item.url),
+            published_at=item.published_at,
+            source=item.source,
+            source_name=item.source_name,
+            summary=item.summary,
+            image_url=str(item.image_url) if item.image_url else None,
+            category=item.category,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the API dictionary for this record.
+
+        The dictionary is built on first use and shared afterwards, so
+        callers must not mutate it.
+        """
+        if self._dict is None:
+            self._dict = {
+                "title": self.title,
+                "url": self.url,
+                "published_at": (
+                    self.published_at.isoformat() if self.published_at else None
+                ),
+                "source": self.source,
+                "source_name": self.source_name,
+                "summary": self.summary,
+            }
+        return self._dict
+
+    def to_news_item(self) -> NewsItem:
+        """Validate the record into a NewsItem.
+
+        Raises:
+            pydantic.ValidationError: If a field is invalid.
+        """
+        return NewsItem(
+            title=self.title,
+            url=self.url,
+            published_at=self.published_at,
+            source=self.source,
+            source_name=self.source_name,
+            summary=self.summary,
+            image_url=self.image_url,
+            category=self.category,
+        )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"NewsRecord(source='{self.source}', url='{self.url}')"
+
+
+def published_key(item: Union[NewsRecord, NewsItem]) -> int:
+    """Integer sort key for the publication time of a record or NewsItem."""
+    if isinstance(item, NewsRecord):
+        return item.timestamp  # Precomputed when the record was built
+    return timestamp_of(item.published_at)
+
+
+def validate_records(records: Iterable[NewsRecord]) -> List[NewsItem]:
+    """Validate many records into NewsItems in a single pydantic call.
+
+    Args:
+        records: Records to validate.
+
+    Returns:
+        List of validated NewsItem objects.
+
+    Raises:
+        pydantic.ValidationError: If any record is invalid.
+    """
+    return _news_item_list.validate_python([_fields(r) for r in records])
+
+
+def drop_invalid(records: List[NewsRecord]) -> Tuple[List[NewsRecord], int]:
+    """Keep the records that validate as NewsItems, in a single pydantic call.
+
+    Args:
+        records: Records to check.
+
+    Returns:
+        The valid records in their original order, and the number dropped.
+    """
+    try:
+        _news_item_list.validate_python([_fields(r) for r in records])
+    except ValidationError as e:
+        invalid = {error["loc"][0] for error in e.errors()}
+        return [r for i, r in enumerate(records) if i not in invalid], len(invalid)
+    return list(records), 0
+
+
+def _fields(record: NewsRecord) -> Dict[str, Any]:
+    """Return the NewsItem fields of a record."""
+    return {
+        "title": record.title,
+        "url": record.url,
+        "published_at": record.published_at,
+        "source": record.source,
+        "source_name": record.source_name,
+        "summary": record.summary,
+        "image_url": record.image_url,
+        "category": record.category,
+    }
@@ -0,0 +1,108 @@
+"""Worker pool for feed and HTML parsing."""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+from backend import metrics
+from backend.config import settings
+
+
+def _timed_call(
+    fn: Callable[..., Any], submitted_at: float, *args: Any
+) -> Tuple[Any, float, float]:
+    """Run ``fn`` in a worker and report when it started and finished.
+
+    Uses wall-clock time so the measurement also works across processes.
+    """
+    started_at = time.time()
+    result = fn(*args)
+    return result, started_at - submitted_at, time.time() - started_at
+
+
+class ParseExecutor:
+    """Runs parsing off the event loop with a bounded queue.
+
+    Regular parsing goes to a thread pool. CPU-heavy work (the Yahoo front
+    page) can be routed to a process pool so it does not hold the GIL. At
+    most ``max_queue`` jobs are queued or running; further callers wait on
+    the event loop without piling work into the executor.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.PARSE_WORKERS,
+        max_queue: int = settings.PARSE_QUEUE_SIZE,
+        heavy_kind: str = settings.PARSE_HEAVY_EXECUTOR,
+    ):
+        """Initialize the executor.
+
+        Args:
+            workers: Number of worker threads (and processes, if used).
+            max_queue: Maximum number of queued or running parse jobs.
+            heavy_kind: Pool for CPU-heavy jobs: 'thread' or 'process'.
+        """
+        self._threads = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="parse"
+        )
+        self._heavy: Executor = self._threads
+        self._heavy_kind = "thread"
+        if heavy_kind == "process":
+            self._heavy = ProcessPoolExecutor(max_workers=workers)
+            self._heavy_kind = "process"
+        self._slots = asyncio.Semaphore(max_queue)
+        self.jobs = 0
+        self.queue_wait_seconds = 0.0
+        self.max_queue_wait_seconds = 0.0
+        self.parse_seconds = 0.0
+
+    async def run(
+        self, fn: Callable[..., Any], *args: Any, cpu_heavy: bool = False
+    ) -> Any:
+        """Run a parse function in the pool.
+
+        Args:
+            fn: Picklable function to run.
+            *args: Positional arguments for ``fn``.
+            cpu_heavy: Route the job to the heavy (possibly process) pool.
+
+        Returns:
+            The return value of ``fn``.
+        """
+        submitted_at = time.time()
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            pool = self._heavy if cpu_heavy else self._threads
+            result, queue_wait, parse_time = await loop.run_in_executor(
+                pool, _timed_call, fn, submitted_at, *args
+            )
+
+        metrics.PARSE_QUEUE_WAIT_SECONDS.observe(
+            queue_wait, pool=self._heavy_kind if cpu_heavy else "thread"
+        )
+        self.jobs += 1
+        self.queue_wait_seconds += queue_wait
+        self.max_queue_wait_seconds = max(self.max_queue_wait_seconds, queue_wait)
+        self.parse_seconds += parse_time
+        return result
+
+    def stats(self) -> Dict[str, float]:
+        """Return parse job counters.
+
+        Returns:
+            Dictionary with job count, queue wait and parse time totals.
+        """
+        return {
+            "jobs": self.jobs,
+            "queue_wait_seconds": self.queue_wait_seconds,
+            "max_queue_wait_seconds": self.max_queue_wait_seconds,
+            "parse_seconds": self.parse_seconds,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pools."""
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._heavy is not self._threads:
+            self._heavy.shutdown(wait=False, cancel_futures=True)
+
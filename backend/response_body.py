@@ -0,0 +1,224 @@
+"""Pre-encoded JSON response bodies."""
+
+import gzip
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi.responses import Response
+
+from backend.config import settings
+from backend.http_client import body_hash
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+# Preferred order when the client accepts several encodings equally
+_PREFERENCE = ("br", "gzip")
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode content exactly like FastAPI's ``JSONResponse``."""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Parse an ``Accept-Encoding`` header into quality values.
+
+    Args:
+        header: Raw header value, or None if the client sent none.
+
+    Returns:
+        Mapping of lower-cased coding names to their q-values.
+    """
+    accepted: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def _opaque_tags(header: str) -> List[str]:
+    """Split an ``If-None-Match`` header into opaque tags.
+
+    Weak tags are compared by their opaque part, as ``If-None-Match``
+    uses weak comparison.
+    """
+    tags = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag:
+            tags.append(tag)
+    return tags
+
+
+class EncodedBody:
+    """A JSON response body serialized and compressed once.
+
+    Cache hits serve one of the stored variants directly instead of
+    re-encoding the payload on every request. Each variant has its own
+    strong ETag derived from a hash of the JSON bytes.
+    """
+
+    __slots__ = ("identity", "gzip", "br", "digest")
+
+    def __init__(
+        self,
+        identity: bytes,
+        gzip: Optional[bytes] = None,
+        br: Optional[bytes] = None,
+    ):
+        """Initialize the body.
+
+        Args:
+            identity: Uncompressed JSON bytes.
+            gzip: Gzip-compressed variant, if built.
+            br: Brotli-compressed variant, if built.
+        """
+        self.identity = identity
+        self.gzip = gzip
+        self.br = br
+        self.digest = body_hash(identity)
+
+    @classmethod
+    def build(
+        cls,
+        content: Any,
+        min_size: int = settings.RESPONSE_COMPRESS_MIN_BYTES,
+        gzip_level: int = settings.RESPONSE_GZIP_LEVEL,
+        brotli_quality: int = settings.RESPONSE_BROTLI_QUALITY,
+    ) -> "EncodedBody":
+        """Serialize content and build its compressed variants.
+
+        Args:
+            content: JSON-serializable payload.
+            min_size: Bodies smaller than this are not compressed.
+            gzip_level: Gzip compression level.
+            brotli_quality: Brotli quality, used when ``brotli`` is installed.
+
+        Returns:
+            The encoded body.
+        """
+        identity = encode_json(content)
+        if len(identity) < min_size:
+            return cls(identity)
+
+        # mtime=0 keeps the gzip bytes stable for identical payloads
+        gzipped = gzip.compress(identity, compresslevel=gzip_level, mtime=0)
+        br = None
+        if brotli is not None:
+            br = brotli.compress(identity, quality=brotli_quality)
+        return cls(identity, gzipped, br)
+
+    @property
+    def size(self) -> int:
+        """Total bytes held by all variants."""
+        return sum(len(v) for v in (self.identity, self.gzip, self.br) if v)
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        """Return the strong ETag of a variant.
+
+        Args:
+            encoding: Content coding of the variant, or None for identity.
+
+        Returns:
+            Quoted entity tag.
+        """
+        if encoding is None:
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Check whether a client already holds this body.
+
+        Any variant's tag matches, since every variant carries the same
+        JSON document.
+
+        Args:
+            if_none_match: The request's ``If-None-Match`` header.
+
+        Returns:
+            True if the client's copy is current.
+        """
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        current = {self.etag(None), self.etag("gzip"), self.etag("br")}
+        return any(tag in current for tag in _opaque_tags(if_none_match))
+
+    def select(self, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """Pick the best variant for a client.
+
+        Args:
+            accept_encoding: The request's ``Accept-Encoding`` header.
+
+        Returns:
+            Tuple of body bytes and the ``Content-Encoding`` to send, or
+            None for the uncompressed body.
+        """
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        best, best_quality = None, 0.0
+        for coding in _PREFERENCE:
+            if getattr(self, coding) is None:
+                continue
+            quality = accepted.get(coding, wildcard)
+            if quality > best_quality:
+                best, best_quality = coding, quality
+        if best is None:
+            return self.identity, None
+        return getattr(self, best), best
+
+    def response(
+        self,
+        accept_encoding: Optional[str],
+        if_none_match: Optional[str] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """Build a response serving the best variant.
+
+        Args:
+            accept_encoding: The request's ``Accept-Encoding`` header.
+            if_none_match: The request's ``If-None-Match`` header.
+            extra_headers: Additional headers, also sent with a 304.
+
+        Returns:
+            Response with ``ETag``, ``Cache-Control``, ``Content-Encoding``
+            and ``Vary`` headers set, or a bodiless 304 if the client's
+            copy is current.
+        """
+        content, encoding = self.select(accept_encoding)
+        headers = {
+            "ETag": self.etag(encoding),
+            "Cache-Control": settings.RESPONSE_CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+            **(extra_headers or {}),
+        }
+        if self.matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return Response(
+            content=content, media_type="application/json", headers=headers
+        )
@@ -1,5 +1,26 @@
 """Business logic services."""
 
 from .aggregator import NewsAggregator
+from .article_store import ArticleStore
+from .cache import CacheEntry, TTLCache
+from .clustering import StoryCluster, cluster_stories
+from .ingest_log import IngestLog
+from .keyword_index import KeywordIndex
+from .scheduler import IngestionScheduler
+from .singleflight import SingleFlight
+from .source_store import SourceSnapshot, SourceStore
 
-__all__ = ["NewsAggregator"]
+__all__ = [
+    "ArticleStore",
+    "CacheEntry",
+    "IngestLog",
+    "IngestionScheduler",
+    "KeywordIndex",
+    "NewsAggregator",
+    "SingleFlight",
+    "SourceSnapshot",
+    "SourceStore",
+    "StoryCluster",
+    "TTLCache",
+    "cluster_stories",
+]
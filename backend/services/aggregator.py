@@ -1,60 +1,103 @@
 """News aggregator service."""
 
-import asyncio
-from typing import Dict, List, Optional
+import heapq
+import itertools
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from backend.adapters.base import NewsAdapter
-from backend.models import NewsItem
+from backend.config import settings
+from backend.models import NewsRecord, published_key
+from backend.services.circuit_breaker import CircuitBreaker
+from backend.services.keyword_index import normalize_text, searchable_text
+from backend.services.source_store import SourceStore
+
+
+def _source_key(item: NewsRecord) -> str:
+    """Sort key for the source identifier."""
+    return item.source
+
+
+class AggregateResult(List[NewsRecord]):
+    """Combined items of several sources with the fetch status of each."""
+
+    def __init__(self, items: Iterable[NewsRecord] = (), status=None):
+        """Initialize the result.
+
+        Args:
+            items: Fetched items.
+            status: Dictionary mapping source IDs to a ``STATUS_*`` value.
+        """
+        super().__init__(items)
+        self.status: Dict[str, str] = {} if status is None else status
 
 
 class NewsAggregator:
     """Service for aggregating news from multiple sources."""
 
-    def __init__(self, adapters: Dict[str, NewsAdapter]):
+    def __init__(
+        self,
+        adapters: Dict[str, NewsAdapter],
+        deadline: Optional[float] = settings.REQUEST_DEADLINE_SECONDS,
+    ):
         """Initialize the news aggregator.
 
         Args:
             adapters: Dictionary mapping source IDs to their adapters.
+            deadline: Seconds to wait for sources before returning the ones
+                that finished. None waits up to ``SOURCE_FETCH_TIMEOUT``.
         """
         self.adapters = adapters
+        self.deadline = deadline
+        self.breakers: Dict[str, CircuitBreaker] = {}
 
     async def fetch_from_sources(
-        self, sources: List[str], limit_per_source: int = 10
-    ) -> List[NewsItem]:
+        self,
+        sources: List[str],
+        limit_per_source: int = 10,
+        deadline: Optional[float] = None,
+    ) -> AggregateResult:
         """Fetch news from multiple sources in parallel.
 
+        The fetch goes through a throwaway SourceStore sharing this
+        aggregator's breakers, so sources whose circuit is open are skipped,
+        and sources still running at the deadline are cancelled and counted
+        as failures, exactly as on the store's path.
+
         Args:
             sources: List of source IDs to fetch from.
             limit_per_source: Maximum number of items to fetch per source.
+            deadline: Overrides the aggregator's deadline in seconds.
 
         Returns:
-            Combined list of NewsItem objects from all sources.
+            Combined list of NewsRecord objects from the sources that
+            finished in time, with each source's status in ``status``.
         """
-        tasks = []
-        for source_id in sources:
-            adapter = self.adapters.get(source_id)
-            if adapter:
-                tasks.append(self._fetch_with_error_handling(adapter, limit_per_source))
-
-        # Fetch from all sources in parallel
-        results = await asyncio.gather(*tasks)
-
-        # Flatten the results
-        all_items: List[NewsItem] = []
-        for items in results:
-            if items:
-                all_items.extend(items)
-
-        return all_items
+        if deadline is None:
+            deadline = self.deadline
+        if deadline is None:
+            deadline = settings.SOURCE_FETCH_TIMEOUT
+        store = SourceStore(
+            self.adapters,
+            fetch_limit=limit_per_source,
+            ttl_seconds={},
+            default_ttl_seconds=settings.CACHE_TTL_SECONDS,
+            breakers=self.breakers,
+            # Every fetch starts now, so a per-fetch timeout is the deadline
+            fetch_timeout=deadline,
+            deadline=None,
+        )
+        items = await store.get_items(sources)
+        status = {s: store.status(s) for s in sources if s in self.adapters}
+        return AggregateResult(items, status)
 
-    async def fetch_all_sources(self, limit_per_source: int = 10) -> List[NewsItem]:
+    async def fetch_all_sources(self, limit_per_source: int = 10) -> AggregateResult:
         """Fetch news from all available sources.
 
         Args:
             limit_per_source: Maximum number of items to fetch per source.
 
         Returns:
-            Combined list of NewsItem objects from all sources.
+            Combined list of NewsRecord objects with per-source status.
         """
         return await self.fetch_from_sources(
             list(self.adapters.keys()), limit_per_source
@@ -62,25 +105,28 @@ class NewsAggregator:
 
     def merge_and_sort(
         self,
-        items: List[NewsItem],
+        items: List[NewsRecord],
         limit: Optional[int] = None,
         sort_by: str = "published_at",
         sort_order: str = "desc",
-    ) -> List[NewsItem]:
+    ) -> List[NewsRecord]:
         """Merge news items, remove duplicates, and sort.
 
+        With a limit, only the top ``limit`` items are selected with a heap
+        instead of sorting the whole list.
+
         Args:
-            items: List of NewsItem objects to merge.
+            items: List of NewsRecord objects to merge.
             limit: Optional maximum number of items to return.
             sort_by: Sort field ('published_at' or 'source').
             sort_order: Sort order ('asc' or 'desc').
 
         Returns:
-            Sorted and deduplicated list of NewsItem objects.
+            Sorted and deduplicated list of NewsRecord objects.
         """
         # Remove duplicates based on URL
         seen_urls: set[str] = set()
-        unique_items: List[NewsItem] = []
+        unique_items: List[NewsRecord] = []
 
         for item in items:
             url = str(item.url)
@@ -88,44 +134,86 @@ class NewsAggregator:
                 seen_urls.add(url)
                 unique_items.append(item)
 
-        # Sort items
-        if sort_by == "source":
-            sorted_items = sorted(
-                unique_items,
-                key=lambda x: x.source,
-                reverse=(sort_order == "desc"),
-            )
-        else:  # published_at
-            # Items without published_at go to the end
-            sorted_items = sorted(
-                unique_items,
-                key=lambda x: x.published_at if x.published_at else datetime.min,
-                reverse=(sort_order == "desc"),
-            )
-
-        # Apply limit if specified
-        if limit is not None:
-            return sorted_items[:limit]
-
-        return sorted_items
+        # Items without published_at go to the end
+        key = _source_key if sort_by == "source" else published_key
+        descending = sort_order == "desc"
+
+        # nlargest/nsmallest are stable, like sorted()
+        if limit is not None and limit < len(unique_items):
+            if descending:
+                return heapq.nlargest(limit, unique_items, key=key)
+            return heapq.nsmallest(limit, unique_items, key=key)
+
+        return sorted(unique_items, key=key, reverse=descending)
+
+    def merge_sorted_streams(
+        self,
+        streams: Iterable[Iterable[NewsRecord]],
+        limit: Optional[int] = None,
+        sort_order: str = "desc",
+    ) -> List[NewsRecord]:
+        """K-way merge of per-source streams already sorted by date.
+
+        Duplicates are dropped as they come out of the merge, keeping the
+        first (newest, for 'desc') copy, and the merge stops as soon as
+        ``limit`` unique items have been emitted.
+
+        Args:
+            streams: Item streams, each ordered by ``published_at`` in
+                ``sort_order`` (e.g. ``SourceSnapshot.newest_first``).
+            limit: Optional maximum number of items to return.
+            sort_order: Sort order of the streams ('asc' or 'desc').
+
+        Returns:
+            Sorted and deduplicated list of NewsRecord objects.
+        """
+        return list(
+            itertools.islice(self.iter_sorted_streams(streams, sort_order), limit)
+        )
+
+    def iter_sorted_streams(
+        self, streams: Iterable[Iterable[NewsRecord]], sort_order: str = "desc"
+    ) -> Iterator[NewsRecord]:
+        """Lazily merge and deduplicate per-source streams sorted by date.
+
+        Args:
+            streams: Item streams, each ordered by ``published_at`` in
+                ``sort_order``.
+            sort_order: Sort order of the streams ('asc' or 'desc').
+
+        Yields:
+            Unique NewsRecord objects in sorted order.
+        """
+        merged = heapq.merge(
+            *streams, key=published_key, reverse=(sort_order == "desc")
+        )
+        seen_urls: set[str] = set()
+        for item in merged:
+            url = str(item.url)
+            if url not in seen_urls:
+                seen_urls.add(url)
+                yield item
 
     def filter_by_keyword(
-        self, items: List[NewsItem], keyword: str
-    ) -> List[NewsItem]:
-        """Filter news items by keyword in title.
+        self, items: List[NewsRecord], keyword: str
+    ) -> List[NewsRecord]:
+        """Filter news items by keyword in title or summary.
+
+        Linear scan with the same matching rules as ``KeywordIndex``, for
+        item lists that are not indexed.
 
         Args:
-            items: List of NewsItem objects.
-            keyword: Keyword to search for (case-insensitive).
+            items: List of NewsRecord objects.
+            keyword: Keyword to search for (case- and width-insensitive).
 
         Returns:
-            Filtered list of NewsItem objects.
+            Filtered list of NewsRecord objects.
         """
         if not keyword:
             return items
 
-        keyword_lower = keyword.lower()
-        return [item for item in items if keyword_lower in item.title.lower()]
+        needle = normalize_text(keyword)
+        return [item for item in items if needle in searchable_text(item)]
 
     async def fetch_and_aggregate(
         self,
@@ -135,50 +223,55 @@ class NewsAggregator:
         sort_by: str = "published_at",
         sort_order: str = "desc",
         keyword: Optional[str] = None,
-    ) -> List[NewsItem]:
+    ) -> AggregateResult:
         """Fetch news from sources, merge, deduplicate, filter, and sort.
 
+        Sources that miss the aggregator's deadline are left out instead of
+        delaying the result.
+
         Args:
             sources: List of source IDs to fetch from. If None, fetch from all.
             limit: Maximum number of items to return.
             limit_per_source: Maximum number of items to fetch per source.
             sort_by: Sort field ('published_at' or 'source').
             sort_order: Sort order ('asc' or 'desc').
-            keyword: Optional keyword to filter by title.
+            keyword: Optional keyword to filter by title or summary.
 
         Returns:
-            Sorted and deduplicated list of NewsItem objects.
+            Sorted and deduplicated list of NewsRecord objects, with each
+            source's status in ``status``.
         """
         if sources is None:
             items = await self.fetch_all_sources(limit_per_source)
         else:
             items = await self.fetch_from_sources(sources, limit_per_source)
 
-        # Filter by keyword if specified
-        if keyword:
-            items = self.filter_by_keyword(items, keyword)
-
-        return self.merge_and_sort(items, limit, sort_by, sort_order)
+        return AggregateResult(
+            self.aggregate(items, limit, sort_by, sort_order, keyword), items.status
+        )
 
-    async def _fetch_with_error_handling(
-        self, adapter: NewsAdapter, limit: int
-    ) -> List[NewsItem]:
-        """Fetch news with error handling.
+    def aggregate(
+        self,
+        items: List[NewsRecord],
+        limit: Optional[int] = None,
+        sort_by: str = "published_at",
+        sort_order: str = "desc",
+        keyword: Optional[str] = None,
+    ) -> List[NewsRecord]:
+        """Filter, deduplicate, and sort already fetched items.
 
         Args:
-            adapter: The news adapter to fetch from.
-            limit: Maximum number of items to fetch.
+            items: List of NewsRecord objects, e.g. from a SourceStore.
+            limit: Optional maximum number of items to return.
+            sort_by: Sort field ('published_at' or 'source').
+            sort_order: Sort order ('asc' or 'desc').
+            keyword: Optional keyword to filter by title or summary.
 
         Returns:
-            List of NewsItem objects, or empty list if error occurs.
+            Sorted and deduplicated list of NewsRecord objects.
         """
-        try:
-            return await adapter.fetch_news(limit)
-        except Exception as e:
-            # Log the error but don't fail the entire aggregation
-            print(f"Error fetching from {adapter.source_id}: {e}")
-            return []
-
+        # Filter by keyword if specified
+        if keyword:
+            items = self.filter_by_keyword(items, keyword)
 
-# Import datetime for sorting
-from datetime import datetime
+        return self.merge_and_sort(items, limit, sort_by, sort_order)
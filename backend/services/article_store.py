@@ -0,0 +1,298 @@
+"""Persistent article store backed by SQLite."""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from backend.config import settings
+from backend.models import NewsItem, NewsRecord, published_key, timestamp_of
+from backend.services.keyword_index import normalize_text, searchable_text
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    source TEXT NOT NULL,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    source_name TEXT NOT NULL,
+    summary TEXT,
+    image_url TEXT,
+    category TEXT,
+    published_at TEXT,
+    published_ts INTEGER NOT NULL,
+    search_text TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (source, url)
+);
+CREATE INDEX IF NOT EXISTS articles_published ON articles (published_ts);
+CREATE INDEX IF NOT EXISTS articles_last_seen ON articles (last_seen);
+CREATE TABLE IF NOT EXISTS fetches (
+    source TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO articles (
+    source, url, title, source_name, summary, image_url, category,
+    published_at, published_ts, search_text, position, first_seen, last_seen
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (source, url) DO UPDATE SET
+    title = excluded.title,
+    source_name = excluded.source_name,
+    summary = excluded.summary,
+    image_url = excluded.image_url,
+    category = excluded.category,
+    published_at = excluded.published_at,
+    published_ts = excluded.published_ts,
+    search_text = excluded.search_text,
+    position = excluded.position,
+    last_seen = excluded.last_seen
+"""
+
+_RECORD_COLUMNS = (
+    "title, url, published_at, source, source_name, summary, image_url, category"
+)
+
+
+HistoryKey = Tuple[int, str, str]
+
+
+def history_key(record: NewsRecord) -> HistoryKey:
+    """Return the position of a record in the history order.
+
+    Args:
+        record: Record returned by ``ArticleStore.history``.
+
+    Returns:
+        Publication time key, source and URL; unique per stored article.
+    """
+    return published_key(record), record.source, record.url
+
+
+def _row_to_record(row: tuple) -> NewsRecord:
+    """Build a record from a row selected with ``_RECORD_COLUMNS``."""
+    title, url, published_at, source, source_name, summary, image_url, category = row
+    return NewsRecord(
+        title=title,
+        url=url,
+        published_at=datetime.fromisoformat(published_at) if published_at else None,
+        source=source,
+        source_name=source_name,
+        summary=summary,
+        image_url=image_url,
+        category=category,
+    )
+
+
+class ArticleStore:
+    """Article history that survives restarts.
+
+    Every fetched snapshot is upserted in one transaction, keyed by source
+    and URL, so the latest snapshot of each source can be restored on
+    startup and articles that have dropped out of the live feeds remain
+    queryable until the retention limits remove them. The database runs
+    in WAL mode, so history reads never block the ingest writes.
+
+    Methods are blocking; call them from a worker thread.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = settings.ARTICLE_STORE_PATH,
+        retention_days: float = settings.ARTICLE_RETENTION_DAYS,
+        max_articles: int = settings.ARTICLE_STORE_MAX_ARTICLES,
+    ):
+        """Initialize the store. The database is opened by ``open``.
+
+        Args:
+            path: SQLite database file.
+            retention_days: Delete articles not seen in a feed for this long.
+            max_articles: Keep at most this many articles, dropping the ones
+                seen least recently.
+        """
+        self.path = Path(path)
+        self.retention_days = retention_days
+        self.max_articles = max_articles
+        self._writer: Optional[sqlite3.Connection] = None
+        self._reader: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the database is open."""
+        return self._writer is not None
+
+    def open(self) -> None:
+        """Open the database, creating it and its schema if needed."""
+        if self.is_open:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        writer = sqlite3.connect(self.path, check_same_thread=False)
+        writer.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps the database consistent; a crash can only lose the
+        # last few commits, which the next poll fetches again
+        writer.execute("PRAGMA synchronous=NORMAL")
+        writer.executescript(_SCHEMA)
+        writer.commit()
+        self._writer = writer
+        self._reader = sqlite3.connect(self.path, check_same_thread=False)
+
+    def close(self) -> None:
+        """Close the database."""
+        for conn in (self._reader, self._writer):
+            if conn is not None:
+                conn.close()
+        self._writer = self._reader = None
+
+    def save(
+        self,
+        source_id: str,
+        items: Iterable[Union[NewsRecord, NewsItem]],
+        fetched_at: float,
+    ) -> None:
+        """Upsert a fetched snapshot and apply the retention limits.
+
+        Args:
+            source_id: Source the items were fetched from.
+            items: Items in feed order.
+            fetched_at: UNIX timestamp of the fetch.
+        """
+        rows = [
+            (
+                source_id,
+                str(item.url),
+                item.title,
+                item.source_name,
+                item.summary,
+                str(item.image_url) if item.image_url else None,
+                item.category,
+                item.published_at.isoformat() if item.published_at else None,
+                published_key(item),
+                searchable_text(item),
+                position,
+                fetched_at,
+                fetched_at,
+            )
+            for position, item in enumerate(items)
+        ]
+        with self._write_lock, self._writer:
+            self._writer.executemany(_UPSERT, rows)
+            self._writer.execute(
+                "INSERT INTO fetches (source, fetched_at) VALUES (?, ?)"
+                " ON CONFLICT (source) DO UPDATE SET fetched_at = excluded.fetched_at",
+                (source_id, fetched_at),
+            )
+            self._prune(fetched_at)
+
+    def touch(self, source_id: str, saved_at: float, fetched_at: float) -> None:
+        """Record an unchanged refetch of the snapshot saved at ``saved_at``.
+
+        Args:
+            source_id: Source that was refetched.
+            saved_at: Fetch time of the saved snapshot.
+            fetched_at: UNIX timestamp of the refetch.
+        """
+        with self._write_lock, self._writer:
+            self._writer.execute(
+                "UPDATE articles SET last_seen = ? WHERE source = ? AND last_seen = ?",
+                (fetched_at, source_id, saved_at),
+            )
+            self._writer.execute(
+                "UPDATE fetches SET fetched_at = ? WHERE source = ?",
+                (fetched_at, source_id),
+            )
+
+    def _prune(self, now: float) -> None:
+        """Delete articles beyond the retention limits, inside a transaction."""
+        cutoff = now - self.retention_days * 86400
+        self._writer.execute("DELETE FROM articles WHERE last_seen < ?", (cutoff,))
+        (count,) = self._writer.execute("SELECT COUNT(*) FROM articles").fetchone()
+        if count > self.max_articles:
+            self._writer.execute(
+                "DELETE FROM articles WHERE rowid IN ("
+                " SELECT rowid FROM articles"
+                " ORDER BY last_seen, published_ts LIMIT ?)",
+                (count - self.max_articles,),
+            )
+
+    def load_snapshots(self) -> Dict[str, Tuple[float, List[NewsRecord]]]:
+        """Return the last saved snapshot of every source.
+
+        Returns:
+            Dictionary mapping source IDs to their fetch time and items in
+            feed order.
+        """
+        with self._read_lock:
+            fetches = self._reader.execute(
+                "SELECT source, fetched_at FROM fetches"
+            ).fetchall()
+            snapshots = {}
+            for source_id, fetched_at in fetches:
+                rows = self._reader.execute(
+                    f"SELECT {_RECORD_COLUMNS} FROM articles"
+                    " WHERE source = ? AND last_seen = ? ORDER BY position",
+                    (source_id, fetched_at),
+                ).fetchall()
+                if rows:
+                    records = [_row_to_record(row) for row in rows]
+                    snapshots[source_id] = (fetched_at, records)
+        return snapshots
+
+    def history(
+        self,
+        sources: Iterable[str],
+        limit: int,
+        before: Optional[datetime] = None,
+        keyword: Optional[str] = None,
+        after: Optional[HistoryKey] = None,
+    ) -> List[NewsRecord]:
+        """Return stored articles, newest first.
+
+        Articles published at the same time are ordered by source and URL,
+        so ``after`` can continue exactly where a page ended.
+
+        Args:
+            sources: Source IDs to read.
+            limit: Maximum number of articles.
+            before: Only return articles published before this time.
+            keyword: Only return articles whose title or summary contains
+                this keyword (case- and width-insensitive).
+            after: ``history_key`` of the last article of the previous page;
+                only articles ordered after it are returned.
+
+        Returns:
+            Articles ordered by publication time, newest first, with
+            undated articles last.
+        """
+        sources = list(sources)
+        if not sources:
+            return []
+        query = (
+            f"SELECT {_RECORD_COLUMNS} FROM articles"
+            f" WHERE source IN ({', '.join('?' * len(sources))})"
+        )
+        params: list = list(sources)
+        if before is not None:
+            query += " AND published_ts < ?"
+            params.append(timestamp_of(before))
+        if keyword:
+            query += " AND instr(search_text, ?) > 0"
+            params.append(normalize_text(keyword))
+        if after is not None:
+            published_ts, source, url = after
+            query += (
+                " AND (published_ts < ? OR (published_ts = ?"
+                " AND (source > ? OR (source = ? AND url > ?))))"
+            )
+            params.extend([published_ts, published_ts, source, source, url])
+        query += " ORDER BY published_ts DESC, source, url LIMIT ?"
+        params.append(limit)
+
+        with self._read_lock:
+            rows = self._reader.execute(query, params).fetchall()
+        return [_row_to_record(row) for row in rows]
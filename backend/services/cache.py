@@ -0,0 +1,175 @@
+"""Bounded TTL/LRU cache."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from backend.config import settings
+
+
+class CacheEntry:
+    """A cached value with its bookkeeping."""
+
+    __slots__ = ("value", "stored_at", "size", "stale")
+
+    def __init__(self, value: Any, stored_at: float, size: int):
+        """Initialize the entry.
+
+        Args:
+            value: Cached value.
+            stored_at: UNIX timestamp when the value was stored.
+            size: Accounted size of the value in bytes.
+        """
+        self.value = value
+        self.stored_at = stored_at
+        self.size = size
+        self.stale = False
+
+
+class TTLCache:
+    """LRU cache bounded by entry count and byte budget, with TTL expiry.
+
+    Entries younger than ``ttl_seconds`` are fresh. Older entries are still
+    returned, flagged as stale, for another ``stale_seconds`` so callers can
+    serve them while refreshing; after that they are dropped. When either
+    limit is exceeded the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.CACHE_MAX_ENTRIES,
+        max_bytes: int = settings.CACHE_MAX_BYTES,
+        ttl_seconds: float = settings.CACHE_TTL_SECONDS,
+        stale_seconds: float = settings.CACHE_STALE_SECONDS,
+        size_of: Callable[[Any], int] = lambda value: 0,
+        is_valid: Optional[Callable[[Any], bool]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries.
+            max_bytes: Maximum total accounted size in bytes.
+            ttl_seconds: Age after which an entry becomes stale.
+            stale_seconds: How long a stale entry is kept after its TTL.
+            size_of: Function returning the accounted size of a value.
+            is_valid: Optional check; values failing it are treated as stale.
+            clock: Time source, for tests.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.size_of = size_of
+        self.is_valid = is_valid
+        self.clock = clock
+        self.total_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether a key is stored, without touching LRU order."""
+        return key in self._entries
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """Return an entry without updating LRU order or counters.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The entry, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        age = self.clock() - entry.stored_at
+        if age >= self.ttl_seconds + self.stale_seconds:
+            self._remove(key)
+            self.expirations += 1
+            return None
+        entry.stale = age >= self.ttl_seconds or (
+            self.is_valid is not None and not self.is_valid(entry.value)
+        )
+        return entry
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Return an entry, marking it most recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The entry (check ``entry.stale``), or None on a miss.
+        """
+        entry = self.peek(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        if entry.stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting least recently used entries if needed.
+
+        Values larger than the whole byte budget are not stored.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+        """
+        size = self.size_of(value)
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            self.evictions += 1
+            return
+
+        self._entries[key] = CacheEntry(value, self.clock(), size)
+        self.total_bytes += size
+
+        while (
+            len(self._entries) > self.max_entries
+            or self.total_bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters.
+
+        Returns:
+            Dictionary of sizes and hit/miss/eviction counters.
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry and release its accounted size."""
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
@@ -0,0 +1,102 @@
+"""Per-source circuit breakers and fetch status."""
+
+import logging
+import time
+from typing import Callable
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Per-source status reported with API responses
+STATUS_OK = "ok"  # Fresh snapshot
+STATUS_PARTIAL = "partial"  # Fresh snapshot, but some fetch legs were missing
+STATUS_STALE = "stale"  # Snapshot older than its TTL, refresh pending
+STATUS_TIMEOUT = "timeout"  # Last fetch missed its deadline
+STATUS_ERROR = "error"  # Last fetch failed
+STATUS_CIRCUIT_OPEN = "circuit_open"  # Upstream skipped after repeated failures
+STATUS_PENDING = "pending"  # Never fetched yet
+
+
+class CircuitBreaker:
+    """Stops calling an upstream after repeated failures.
+
+    Closed: every call is allowed. After ``failure_threshold`` consecutive
+    failures the circuit opens and calls are refused for
+    ``reset_seconds``. Then it is half-open: a single probe call is
+    allowed, which closes the circuit on success or opens it again on
+    failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = settings.CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds: float = settings.CIRCUIT_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        name: str = "upstream",
+    ):
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_seconds: Seconds the circuit stays open before a probe.
+            clock: Monotonic time source, replaceable in tests.
+            name: Name of the guarded upstream, used in log messages.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self.failures = 0
+        self._opened_at = 0.0
+        self._open = False
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Current state: CLOSED, OPEN or HALF_OPEN."""
+        if not self._open:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Check whether a call may be made now.
+
+        In the half-open state only the first caller gets through, as the
+        probe; the others are refused until it reports back.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self._open:
+            logger.warning("Circuit for %s closed again", self.name)
+        self.failures = 0
+        self._open = False
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            if self._probing or not self._open:
+                logger.warning(
+                    "Circuit for %s opened after %d consecutive failures",
+                    self.name,
+                    self.failures,
+                )
+            self._open = True
+            self._opened_at = self._clock()
+        self._probing = False
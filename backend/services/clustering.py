@@ -0,0 +1,224 @@
+"""Near-duplicate story clustering with MinHash and LSH banding."""
+
+import hashlib
+import random
+import re
+import unicodedata
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from backend.config import settings
+from backend.models import NewsRecord
+from backend.services.keyword_index import normalize_text
+
+# Signature = BANDS * ROWS MinHash values. A pair with Jaccard
+# similarity J becomes an LSH candidate with probability
+# 1 - (1 - J**ROWS)**BANDS: 0.99 at J=0.5, 0.15 at J=0.1.
+BANDS = 16
+ROWS = 2
+# Each MinHash function is the shingle hash XORed with a random mask; the
+# seed is fixed so signatures agree across processes and restarts
+_MASKS = [random.Random(seed).getrandbits(64) for seed in range(BANDS * ROWS)]
+# Google News appends " - <publisher>" to every title
+_PUBLISHER_SUFFIX = re.compile(r"\s+[-－–—|｜]\s+[^-－–—|｜]+$")
+
+
+def normalize_title(title: str) -> str:
+    """Reduce a title to the characters that identify the story.
+
+    Strips a trailing publisher name, then drops whitespace and
+    punctuation after NFKC normalization and lower-casing.
+    """
+    title = _PUBLISHER_SUFFIX.sub("", title.strip())
+    return "".join(
+        ch for ch in normalize_text(title) if unicodedata.category(ch)[0] in "LN"
+    )
+
+
+def _feature_hash(feature: str) -> int:
+    """Stable 64-bit hash of a shingle, independent of PYTHONHASHSEED."""
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def shingles(text: str) -> FrozenSet[str]:
+    """Return the character bigrams of a normalized title."""
+    if len(text) < 2:
+        return frozenset([text])
+    return frozenset(text[i : i + 2] for i in range(len(text) - 1))
+
+
+@lru_cache(maxsize=4096)
+def title_signature(title: str) -> Tuple[FrozenSet[str], Tuple[int, ...]]:
+    """Return the shingles and MinHash signature of a title.
+
+    Memoized, since the same titles are clustered again on every refresh.
+
+    Args:
+        title: Raw article title.
+
+    Returns:
+        Tuple of the bigram set and its MinHash signature.
+    """
+    grams = shingles(normalize_title(title))
+    hashes = [_feature_hash(gram) for gram in grams]
+    signature = tuple(min([h ^ mask for h in hashes]) for mask in _MASKS)
+    return grams, signature
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Return the Jaccard similarity of two shingle sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class StoryCluster:
+    """A story reported by several sources, shown as its first article.
+
+    ``to_dict`` adds an ``alternates`` list with the other articles, so the
+    cluster can stand in for a NewsRecord in API responses.
+    """
+
+    __slots__ = ("record", "shingles", "signature", "alternates", "_dict")
+
+    def __init__(
+        self,
+        record: NewsRecord,
+        shingles: FrozenSet[str],
+        signature: Tuple[int, ...],
+    ):
+        """Initialize the cluster.
+
+        Args:
+            record: Representative article.
+            shingles: Bigrams of the representative's normalized title.
+            signature: MinHash signature of ``shingles``.
+        """
+        self.record = record
+        self.shingles = shingles
+        self.signature = signature
+        self.alternates: List[NewsRecord] = []
+        self._dict: Optional[Dict[str, Any]] = None
+
+    def sources(self) -> set:
+        """Return the sources already represented in the cluster."""
+        return {self.record.source, *(alt.source for alt in self.alternates)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the representative's API dictionary with alternates."""
+        if self._dict is None:
+            self._dict = {
+                **self.record.to_dict(),
+                "alternates": [
+                    {
+                        "title": alt.title,
+                        "url": str(alt.url),
+                        "source": alt.source,
+                        "source_name": alt.source_name,
+                    }
+                    for alt in self.alternates
+                ],
+            }
+        return self._dict
+
+
+class NearDuplicateIndex:
+    """LSH index over MinHash signatures.
+
+    Signatures are split into bands; clusters sharing any whole band land
+    in the same bucket and are the only ones compared, by exact Jaccard
+    similarity of their title bigrams.
+    """
+
+    def __init__(self, threshold: float = settings.CLUSTER_SIMILARITY):
+        """Initialize the index.
+
+        Args:
+            threshold: Minimum Jaccard similarity treated as the same story.
+        """
+        self.threshold = threshold
+        self._buckets: Dict[tuple, List[StoryCluster]] = {}
+        self.comparisons = 0
+
+    @staticmethod
+    def _keys(signature: Tuple[int, ...]) -> List[tuple]:
+        """Return the bucket key of every band of a signature."""
+        return [
+            (band, signature[band * ROWS : (band + 1) * ROWS])
+            for band in range(BANDS)
+        ]
+
+    def candidates(
+        self, shingles: FrozenSet[str], signature: Tuple[int, ...]
+    ) -> Iterator[StoryCluster]:
+        """Yield indexed clusters similar to a title, most similar first.
+
+        Args:
+            shingles: Bigrams of the normalized title.
+            signature: MinHash signature of ``shingles``.
+        """
+        seen = set()
+        scored = []
+        for key in self._keys(signature):
+            for cluster in self._buckets.get(key, ()):
+                if id(cluster) in seen:
+                    continue
+                seen.add(id(cluster))
+                self.comparisons += 1
+                similarity = jaccard(shingles, cluster.shingles)
+                if similarity >= self.threshold:
+                    scored.append((similarity, len(scored), cluster))
+        scored.sort(key=lambda entry: (-entry[0], entry[1]))
+        for _, _, cluster in scored:
+            yield cluster
+
+    def add(self, cluster: StoryCluster) -> None:
+        """Index a cluster under each of its band keys."""
+        for key in self._keys(cluster.signature):
+            self._buckets.setdefault(key, []).append(cluster)
+
+
+def cluster_stories(
+    items: Iterable[NewsRecord],
+    threshold: float = settings.CLUSTER_SIMILARITY,
+) -> List[Union[NewsRecord, StoryCluster]]:
+    """Collapse near-duplicate articles into clusters.
+
+    The first article of a story (in the given order) represents it and
+    later ones from other sources become its alternates. Articles from the
+    same source are never merged, since one outlet publishing two similar
+    headlines usually means two updates worth showing.
+
+    Args:
+        items: Articles in display order.
+        threshold: Minimum Jaccard similarity of title bigrams treated as
+            the same story.
+
+    Returns:
+        Articles without duplicates as they were, and a StoryCluster for
+        each article that has alternates, in the original order.
+    """
+    index = NearDuplicateIndex(threshold)
+    clusters: List[StoryCluster] = []
+    for item in items:
+        grams, signature = title_signature(item.title)
+        for cluster in index.candidates(grams, signature):
+            if item.source not in cluster.sources():
+                cluster.alternates.append(item)
+                break
+        else:
+            cluster = StoryCluster(item, grams, signature)
+            index.add(cluster)
+            clusters.append(cluster)
+    return [c if c.alternates else c.record for c in clusters]
@@ -0,0 +1,150 @@
+"""Sequence-numbered log of newly ingested articles."""
+
+import asyncio
+import bisect
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Iterable, List, Optional, Set, Tuple
+
+from backend.config import settings
+from backend.models import NewsRecord, published_key
+
+Entry = Tuple[int, NewsRecord]
+
+
+class IngestLog:
+    """Assigns every newly seen article a sequence number.
+
+    An article is new the first time its source publishes its URL. New
+    articles are numbered oldest first, so a higher sequence means a later
+    ingest (and, within one fetch, a later publication). The most recent
+    entries are kept so consumers can resume from a sequence number, and
+    waiters are woken whenever entries are added.
+
+    Numbering starts from the process start time in milliseconds, so
+    sequence numbers keep increasing across restarts and a position from
+    an earlier process is always older than the backlog.
+    """
+
+    def __init__(
+        self,
+        backlog_size: int = settings.INGEST_BACKLOG_SIZE,
+        seen_max: int = settings.INGEST_SEEN_MAX,
+        start: Optional[int] = None,
+    ):
+        """Initialize an empty log.
+
+        Args:
+            backlog_size: Number of recent entries kept for resuming.
+            seen_max: Number of (source, URL) pairs remembered as seen.
+            start: Sequence number before the first entry. Defaults to the
+                current time in milliseconds.
+        """
+        self.start = int(time.time() * 1000) if start is None else start
+        self.sequence = self.start
+        self.seen_max = seen_max
+        self._backlog: Deque[Entry] = deque(maxlen=backlog_size)
+        # (ingest time, last sequence) of each recorded fetch with entries
+        self._marks: Deque[Tuple[float, int]] = deque(maxlen=backlog_size)
+        self._seen: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._waiters: Set[asyncio.Event] = set()
+
+    def record(
+        self,
+        source_id: str,
+        items: Iterable[NewsRecord],
+        now: Optional[float] = None,
+    ) -> List[Entry]:
+        """Number the articles of a fetch that were not seen before.
+
+        Args:
+            source_id: Source the items were fetched from.
+            items: Items of the fetch.
+            now: UNIX timestamp of the ingest. Defaults to now.
+
+        Returns:
+            The new entries, in sequence order.
+        """
+        new = []
+        for item in items:
+            key = (source_id, str(item.url))
+            if key in self._seen:
+                self._seen.move_to_end(key)
+                continue
+            self._seen[key] = None
+            new.append(item)
+        while len(self._seen) > self.seen_max:
+            self._seen.popitem(last=False)
+
+        entries = []
+        for item in sorted(new, key=published_key):
+            self.sequence += 1
+            entries.append((self.sequence, item))
+        self._backlog.extend(entries)
+        if entries:
+            ingested_at = time.time() if now is None else now
+            self._marks.append((ingested_at, self.sequence))
+            for waiter in self._waiters:
+                waiter.set()
+        return entries
+
+    def sequence_at(self, when: float) -> int:
+        """Return the last sequence number ingested at or before a time.
+
+        Args:
+            when: UNIX timestamp.
+
+        Returns:
+            Sequence number to pass to ``since`` for the articles ingested
+            after ``when``. Times before the retained entries map to a
+            position ``since`` cannot serve, unless nothing was dropped yet.
+        """
+        index = bisect.bisect_right(self._marks, when, key=lambda mark: mark[0])
+        if index:
+            return self._marks[index - 1][1]
+        if not self._backlog or self._backlog[0][0] == self.start + 1:
+            return self.start
+        return self._backlog[0][0] - 2
+
+    def since(self, sequence: int) -> Optional[List[Entry]]:
+        """Return the entries after a sequence number.
+
+        Args:
+            sequence: Last sequence number the consumer has seen.
+
+        Returns:
+            Entries with a higher sequence number, oldest first, or None if
+            they can no longer be served because older entries were dropped
+            or the sequence is from before a restart.
+        """
+        if sequence > self.sequence:
+            return None
+        if sequence == self.sequence:
+            return []
+        oldest = self._backlog[0][0] if self._backlog else self.sequence + 1
+        if sequence < oldest - 1:
+            return None
+        return [entry for entry in self._backlog if entry[0] > sequence]
+
+    async def wait(self, sequence: int, timeout: Optional[float] = None) -> bool:
+        """Wait until entries after ``sequence`` exist.
+
+        Args:
+            sequence: Last sequence number the consumer has seen.
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if new entries exist, False on timeout.
+        """
+        if self.sequence > sequence:
+            return True
+        # Created per call, so the event belongs to the waiter's loop
+        waiter = asyncio.Event()
+        self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._waiters.discard(waiter)
+        return self.sequence > sequence
@@ -0,0 +1,171 @@
+"""Character n-gram inverted index for keyword search."""
+
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+
+from backend.models import NewsRecord
+
+# Intersect posting lists until this few candidates remain, then verify
+_VERIFY_THRESHOLD = 32
+# Rebuild posting lists once this many removed documents have piled up
+_COMPACT_MIN_DEAD = 1024
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for matching.
+
+    NFKC folds full-width ASCII and half-width katakana into their usual
+    forms, so "ＮＨＫ" matches "nhk".
+    """
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def searchable_text(record: NewsRecord) -> str:
+    """Return the normalized title and summary of a record.
+
+    The fields are joined with a NUL so a keyword never matches across
+    the boundary.
+    """
+    return normalize_text(f"{record.title}\0{record.summary or ''}")
+
+
+def _grams(text: str) -> Set[str]:
+    """Return the characters and character bigrams of a text.
+
+    Japanese titles have no whitespace to tokenize on, so every bigram
+    is indexed; single characters are indexed for one-letter queries.
+    """
+    grams = set(text)
+    grams.update(text[i : i + 2] for i in range(len(text) - 1))
+    grams.discard("\0")
+    return {gram for gram in grams if "\0" not in gram}
+
+
+def _query_grams(keyword: str) -> Set[str]:
+    """Return the grams a document must contain to match ``keyword``."""
+    if len(keyword) == 1:
+        return {keyword}
+    return {keyword[i : i + 2] for i in range(len(keyword) - 1)}
+
+
+class KeywordIndex:
+    """Inverted index from character n-grams to news records.
+
+    Records are indexed per source and replaced incrementally when a new
+    snapshot of that source is published: unchanged articles keep their
+    postings, new ones are added and vanished ones are dropped. Queries
+    intersect posting lists and verify the few remaining candidates with
+    a substring check, so results match a linear scan exactly.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._next_id = 0
+        self._records: Dict[int, NewsRecord] = {}
+        self._texts: Dict[int, str] = {}
+        # Document IDs only grow, so every posting list stays sorted
+        self._postings: Dict[str, List[int]] = {}
+        self._by_source: Dict[str, Dict[str, int]] = {}
+        self._dead = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed records."""
+        return len(self._records)
+
+    def replace_source(self, source_id: str, records: Iterable[NewsRecord]) -> None:
+        """Make the index hold exactly ``records`` for a source.
+
+        Args:
+            source_id: Source the records belong to.
+            records: Current records of the source, in feed order.
+        """
+        previous = self._by_source.get(source_id, {})
+        current: Dict[str, int] = {}
+        for record in records:
+            if record.url in current:
+                continue
+            text = searchable_text(record)
+            doc_id = previous.get(record.url)
+            if doc_id is not None and self._texts[doc_id] == text:
+                # Same article: point at the new record, keep the postings
+                self._records[doc_id] = record
+            else:
+                doc_id = self._add(record, text)
+            current[record.url] = doc_id
+
+        for url, doc_id in previous.items():
+            if current.get(url) != doc_id:
+                self._remove(doc_id)
+        self._by_source[source_id] = current
+        self._maybe_compact()
+
+    def search(
+        self, keyword: str, sources: Optional[Iterable[str]] = None
+    ) -> List[NewsRecord]:
+        """Return the records whose title or summary contains ``keyword``.
+
+        Args:
+            keyword: Keyword to search for (case- and width-insensitive).
+            sources: Restrict results to these source IDs.
+
+        Returns:
+            Matching records in indexing order.
+        """
+        needle = normalize_text(keyword)
+        if not needle:
+            return []
+
+        postings = []
+        for gram in _query_grams(needle):
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if len(candidates) <= _VERIFY_THRESHOLD:
+                break
+            candidates.intersection_update(posting)
+
+        allowed = None if sources is None else set(sources)
+        results = []
+        for doc_id in sorted(candidates):
+            record = self._records.get(doc_id)
+            if record is None:
+                continue  # Removed; its postings are cleaned up lazily
+            if allowed is not None and record.source not in allowed:
+                continue
+            if needle in self._texts[doc_id]:
+                results.append(record)
+        return results
+
+    def _add(self, record: NewsRecord, text: str) -> int:
+        """Index a record and return its document ID."""
+        doc_id = self._next_id
+        self._next_id += 1
+        self._records[doc_id] = record
+        self._texts[doc_id] = text
+        for gram in _grams(text):
+            self._postings.setdefault(gram, []).append(doc_id)
+        return doc_id
+
+    def _remove(self, doc_id: int) -> None:
+        """Drop a document; its posting entries are removed on compaction."""
+        del self._records[doc_id]
+        del self._texts[doc_id]
+        self._dead += 1
+
+    def _maybe_compact(self) -> None:
+        """Drop removed documents from the posting lists once they dominate."""
+        if self._dead < _COMPACT_MIN_DEAD or self._dead < len(self._records):
+            return
+        live = self._records
+        postings = {}
+        for gram, posting in self._postings.items():
+            kept = [doc_id for doc_id in posting if doc_id in live]
+            if kept:
+                postings[gram] = kept
+        self._postings = postings
+        self._dead = 0
@@ -0,0 +1,149 @@
+"""Cursor pagination over stable result snapshots."""
+
+import base64
+import itertools
+import json
+from typing import Iterable, Iterator, List, Tuple
+
+from backend.models import NewsRecord
+
+
+class ResultSnapshot:
+    """The full ordered result of one query at one point in time.
+
+    The ordering is produced lazily from an iterator over immutable source
+    snapshots, and every item produced is kept, so any page can be served
+    again and later pages continue the same ordering even after newer
+    source snapshots have been published. An ordering that is already a
+    list, such as a clustered or keyword result, is kept as it is.
+    """
+
+    __slots__ = ("snapshot_id", "_source", "_items", "_exhausted")
+
+    def __init__(self, snapshot_id: str, results: Iterable[NewsRecord]):
+        """Initialize the snapshot.
+
+        Args:
+            snapshot_id: Identifier embedded in cursors.
+            results: Query results in their final order. Must only read
+                immutable data, since it is consumed over several requests.
+        """
+        self.snapshot_id = snapshot_id
+        if isinstance(results, list):
+            self._source: Iterator[NewsRecord] = iter(())
+            self._items: List[NewsRecord] = results
+            self._exhausted = True
+        else:
+            self._source = iter(results)
+            self._items = []
+            self._exhausted = False
+
+    def page(self, offset: int, limit: int) -> Tuple[List[NewsRecord], bool]:
+        """Return the items at ``offset`` and whether more follow.
+
+        Only ``offset + limit + 1`` results are ever produced, so a page
+        costs time proportional to its size.
+
+        Args:
+            offset: Position of the first item.
+            limit: Maximum number of items.
+
+        Returns:
+            Tuple of the page items and a flag telling whether a next page
+            exists.
+        """
+        end = offset + limit
+        missing = end + 1 - len(self._items)
+        if missing > 0 and not self._exhausted:
+            before = len(self._items)
+            self._items.extend(itertools.islice(self._source, missing))
+            if len(self._items) - before < missing:
+                self._exhausted = True
+        return self._items[offset:end], len(self._items) > end
+
+    def __len__(self) -> int:
+        """Return the number of results produced so far."""
+        return len(self._items)
+
+    @property
+    def produced(self) -> List[NewsRecord]:
+        """Return the results produced so far, in order."""
+        return self._items
+
+
+def encode_cursor(snapshot_id: str, offset: int) -> str:
+    """Encode a snapshot ID and position into an opaque cursor.
+
+    Args:
+        snapshot_id: Result snapshot the cursor points into.
+        offset: Position of the next item.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = f"{snapshot_id}:{offset}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Opaque cursor string.
+
+    Returns:
+        Tuple of snapshot ID and offset.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+        snapshot_id, offset = raw.rsplit(":", 1)
+        position = int(offset)
+    except (UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not snapshot_id or position < 0:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return snapshot_id, position
+
+
+def encode_key_cursor(key: Tuple[int, str, str]) -> str:
+    """Encode the sort key of a page's last item into an opaque cursor.
+
+    Args:
+        key: Sort key, as returned by ``article_store.history_key``.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = json.dumps(list(key), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_key_cursor(cursor: str) -> Tuple[int, str, str]:
+    """Decode a cursor produced by ``encode_key_cursor``.
+
+    Args:
+        cursor: Opaque cursor string.
+
+    Returns:
+        The sort key of the last item of the previous page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if (
+        not isinstance(key, list)
+        or len(key) != 3
+        or type(key[0]) is not int
+        or not all(isinstance(part, str) for part in key[1:])
+    ):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return key[0], key[1], key[2]
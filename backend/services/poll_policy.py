@@ -0,0 +1,105 @@
+"""Adaptive poll intervals learned from each feed's publish rate."""
+
+from typing import Iterable, Optional, Set
+
+from backend.config import settings
+from backend.models import NewsRecord, published_key
+from backend.models.record import MISSING_TIMESTAMP
+
+_MICROSECONDS = 1_000_000
+
+
+class AdaptivePollPolicy:
+    """Chooses how often to poll one feed.
+
+    The rate at which previously unseen article URLs appear is tracked as
+    an exponentially weighted moving average, and the interval is set so
+    that about ``target_new_items`` new articles arrive per poll, within
+    ``[min_seconds, max_seconds]``. Before the first comparison the rate
+    is estimated from the spread of the feed's publication times. An
+    upstream freshness hint raises the lower bound, so a feed is never
+    polled more often than it says its content changes.
+    """
+
+    def __init__(
+        self,
+        initial_seconds: float,
+        min_seconds: float = settings.POLL_MIN_SECONDS,
+        max_seconds: float = settings.POLL_MAX_SECONDS,
+        smoothing: float = settings.POLL_SMOOTHING,
+        target_new_items: float = settings.POLL_TARGET_NEW_ITEMS,
+    ):
+        """Initialize the policy.
+
+        Args:
+            initial_seconds: Interval used until the feed has been observed.
+            min_seconds: Shortest interval.
+            max_seconds: Longest interval.
+            smoothing: Weight of the newest observation in the average.
+            target_new_items: New articles to expect per poll.
+        """
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.smoothing = smoothing
+        self.target_new_items = target_new_items
+        self.interval = float(initial_seconds)
+        self.rate: Optional[float] = None  # New articles per second
+        self.hint: Optional[float] = None
+        self._seen: Set[str] = set()
+        self._observed_at: Optional[float] = None
+
+    def observe(
+        self,
+        items: Iterable[NewsRecord],
+        now: float,
+        hint: Optional[float] = None,
+    ) -> float:
+        """Update the interval from a successful fetch.
+
+        Args:
+            items: Items the fetch returned.
+            now: UNIX timestamp of the fetch.
+            hint: Upstream freshness lifetime in seconds, if advertised.
+
+        Returns:
+            The new poll interval in seconds.
+        """
+        items = list(items)
+        urls = {str(item.url) for item in items}
+        if self._observed_at is None:
+            self.rate = self._rate_from_timestamps(items)
+        else:
+            elapsed = max(now - self._observed_at, 1.0)
+            observed = len(urls - self._seen) / elapsed
+            if self.rate is None:
+                self.rate = observed
+            else:
+                self.rate += self.smoothing * (observed - self.rate)
+        self._seen = urls
+        self._observed_at = now
+        self.hint = hint
+        self.interval = self._interval()
+        return self.interval
+
+    def _interval(self) -> float:
+        """Return the interval for the current rate and hint."""
+        lower = self.min_seconds
+        if self.hint is not None:
+            lower = min(max(lower, self.hint), self.max_seconds)
+        if self.rate is None:
+            # Nothing learned yet; only apply the bounds
+            return min(max(self.interval, lower), self.max_seconds)
+        if self.rate <= 0:
+            return self.max_seconds
+        return min(max(self.target_new_items / self.rate, lower), self.max_seconds)
+
+    @staticmethod
+    def _rate_from_timestamps(items: Iterable[NewsRecord]) -> Optional[float]:
+        """Estimate the publish rate from the spread of publication times."""
+        stamps = sorted(
+            key for key in map(published_key, items) if key != MISSING_TIMESTAMP
+        )
+        if len(stamps) < 2 or stamps[-1] == stamps[0]:
+            return None
+        span = (stamps[-1] - stamps[0]) / _MICROSECONDS
+        return (len(stamps) - 1) / span
@@ -0,0 +1,120 @@
+"""Background ingestion scheduler."""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from backend.config import settings
+from backend.services.source_store import SourceStore
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionScheduler:
+    """Polls every source on its own interval and publishes snapshots.
+
+    While the scheduler is running, API requests only read the snapshots
+    held by the SourceStore and never wait on an upstream fetch.
+    """
+
+    def __init__(
+        self,
+        store: SourceStore,
+        retry_seconds: float = settings.SCHEDULER_RETRY_SECONDS,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            store: Store the fetched snapshots are published to.
+            retry_seconds: Poll interval used after a failed refresh.
+        """
+        self.store = store
+        self.retry_seconds = retry_seconds
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    @property
+    def running(self) -> bool:
+        """Whether the polling tasks are active."""
+        return bool(self._tasks)
+
+    def interval_for(self, source_id: str) -> float:
+        """Return the poll interval of a source in seconds."""
+        return self.store.ttl_for(source_id)
+
+    async def start(
+        self,
+        sources: Optional[List[str]] = None,
+        warmup_timeout: float = settings.SCHEDULER_WARMUP_TIMEOUT,
+    ) -> None:
+        """Warm every source, then start one polling task per source.
+
+        Sources that already have a snapshot, e.g. restored from the article
+        store, are not waited for; stale ones are refreshed right away in
+        the background.
+
+        Args:
+            sources: Source IDs to poll. If None, poll all adapters.
+            warmup_timeout: Maximum seconds to wait for the initial fetch.
+        """
+        if self.running:
+            return
+        if sources is None:
+            sources = list(self.store.adapters.keys())
+
+        cold = [s for s in sources if self.store.get(s) is None]
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(self._refresh(s) for s in cold)),
+                timeout=warmup_timeout,
+            )
+        except asyncio.TimeoutError:
+            pass
+
+        for source_id in sources:
+            refresh_now = source_id not in cold and not self.store.is_fresh(source_id)
+            self._tasks[source_id] = asyncio.create_task(
+                self._poll(source_id, refresh_now)
+            )
+
+    async def stop(self) -> None:
+        """Cancel all polling tasks."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _refresh(self, source_id: str) -> bool:
+        """Refresh a source, logging any error instead of raising it.
+
+        Args:
+            source_id: Source to refresh.
+
+        Returns:
+            True if the refresh completed.
+        """
+        try:
+            await self.store.refresh(source_id)
+        except Exception:
+            logger.exception("Error refreshing %s", source_id)
+            return False
+        return True
+
+    async def _poll(self, source_id: str, refresh_now: bool = False) -> None:
+        """Refresh a single source forever.
+
+        Args:
+            source_id: Source to refresh.
+            refresh_now: Refresh once before the first wait.
+        """
+        ok = await self._refresh(source_id) if refresh_now else True
+        while True:
+            if not ok:
+                delay = self.retry_seconds
+            elif self.store.is_fresh(source_id):
+                delay = self.interval_for(source_id)
+            else:
+                # Last fetch failed or never ran; retry sooner
+                delay = min(self.retry_seconds, self.interval_for(source_id))
+            await asyncio.sleep(delay)
+            ok = await self._refresh(source_id)
@@ -0,0 +1,429 @@
+"""Per-source item store."""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend import metrics
+from backend.adapters.base import NewsAdapter
+from backend.config import settings
+from backend.models import NewsRecord, drop_invalid, published_key
+from backend.services.article_store import ArticleStore
+from backend.services.circuit_breaker import (
+    STATUS_CIRCUIT_OPEN,
+    STATUS_ERROR,
+    STATUS_OK,
+    STATUS_PARTIAL,
+    STATUS_PENDING,
+    STATUS_STALE,
+    STATUS_TIMEOUT,
+    CircuitBreaker,
+)
+from backend.services.ingest_log import IngestLog
+from backend.services.keyword_index import KeywordIndex
+from backend.services.poll_policy import AdaptivePollPolicy
+from backend.services.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def _content_key(item: NewsRecord) -> Tuple[str, str, int, Optional[str]]:
+    """Fields that decide whether a refetched item changed."""
+    return str(item.url), item.title, published_key(item), item.summary
+
+
+class SourceSnapshot:
+    """Immutable set of items fetched from one source at one point in time.
+
+    Besides the feed order, the items are kept sorted by publication time
+    in both directions so queries can merge sources without sorting.
+    """
+
+    __slots__ = ("source_id", "items", "fetched_at", "newest_first", "oldest_first")
+
+    def __init__(
+        self, source_id: str, items: Tuple[NewsRecord, ...], fetched_at: float
+    ):
+        """Initialize the snapshot.
+
+        Args:
+            source_id: Source the items were fetched from.
+            items: Items in the order the adapter returned them.
+            fetched_at: UNIX timestamp of the fetch.
+        """
+        self.source_id = source_id
+        self.items = items
+        self.fetched_at = fetched_at
+        # Two stable sorts, so items with equal dates keep their feed order
+        # in either direction
+        self.newest_first = tuple(sorted(items, key=published_key, reverse=True))
+        self.oldest_first = tuple(sorted(items, key=published_key))
+
+    def refetched(self, fetched_at: float) -> "SourceSnapshot":
+        """Return a copy for an unchanged refetch, sharing the sorted items.
+
+        Args:
+            fetched_at: UNIX timestamp of the refetch.
+        """
+        snapshot = SourceSnapshot.__new__(SourceSnapshot)
+        snapshot.source_id = self.source_id
+        snapshot.items = self.items
+        snapshot.fetched_at = fetched_at
+        snapshot.newest_first = self.newest_first
+        snapshot.oldest_first = self.oldest_first
+        return snapshot
+
+
+class SourceStore:
+    """Keeps one fresh item set per adapter, independent of API queries.
+
+    Upstream traffic scales with the number of sources: every query is
+    answered from these per-source snapshots, and a source is only fetched
+    again once its own TTL has expired. A keyword index over the current
+    snapshots is updated as each one is published, newly seen articles are
+    numbered in an IngestLog, and fetched snapshots are persisted to an
+    optional ArticleStore.
+
+    Each source has a circuit breaker, so a dead upstream is only probed
+    now and then, and queries wait on refreshes only up to a deadline.
+    """
+
+    def __init__(
+        self,
+        adapters: Dict[str, NewsAdapter],
+        fetch_limit: int = settings.SOURCE_FETCH_LIMIT,
+        ttl_seconds: Optional[Dict[str, int]] = None,
+        default_ttl_seconds: int = settings.CACHE_TTL_SECONDS,
+        article_store: Optional[ArticleStore] = None,
+        breakers: Optional[Dict[str, CircuitBreaker]] = None,
+        fetch_timeout: float = settings.SOURCE_FETCH_TIMEOUT,
+        deadline: Optional[float] = settings.REQUEST_DEADLINE_SECONDS,
+        adaptive: bool = False,
+    ):
+        """Initialize the store.
+
+        Args:
+            adapters: Dictionary mapping source IDs to their adapters.
+            fetch_limit: Number of items to fetch from each source.
+            ttl_seconds: Per-source TTL overrides in seconds.
+            default_ttl_seconds: TTL for sources without an override.
+            article_store: Store every fetched snapshot is saved to while
+                it is open.
+            breakers: Circuit breakers by source ID, e.g. shared with a
+                NewsAggregator. Missing ones are created on first use.
+            fetch_timeout: Seconds a single source fetch may take.
+            deadline: Seconds a query waits on inline refreshes before
+                answering from the snapshots it has. None waits for all.
+            adaptive: Learn each source's TTL from its publish rate, starting
+                from the configured TTL.
+        """
+        self.adapters = adapters
+        self.fetch_limit = fetch_limit
+        self.ttl_seconds = dict(
+            settings.SOURCE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        )
+        self.default_ttl_seconds = default_ttl_seconds
+        self.article_store = article_store
+        self.breakers = {} if breakers is None else breakers
+        self.fetch_timeout = fetch_timeout
+        self.deadline = deadline
+        self._outcomes: Dict[str, str] = {}
+        self.policies: Optional[Dict[str, AdaptivePollPolicy]] = (
+            {} if adaptive else None
+        )
+        # Bumped on every changed publish: overall and per source
+        self.version = 0
+        self.versions: Dict[str, int] = {}
+        self._snapshots: Dict[str, SourceSnapshot] = {}
+        self._flights = SingleFlight()
+        self.index = KeywordIndex()
+        self.ingest_log = IngestLog()
+
+    def ttl_for(self, source_id: str) -> float:
+        """Return the TTL of a source in seconds.
+
+        With adaptive polling this is the source's current learned interval.
+        """
+        if self.policies is not None:
+            return self.policy_for(source_id).interval
+        return self.ttl_seconds.get(source_id, self.default_ttl_seconds)
+
+    def policy_for(self, source_id: str) -> AdaptivePollPolicy:
+        """Return the adaptive poll policy of a source."""
+        policy = self.policies.get(source_id)
+        if policy is None:
+            initial = self.ttl_seconds.get(source_id, self.default_ttl_seconds)
+            policy = self.policies[source_id] = AdaptivePollPolicy(initial)
+        return policy
+
+    def breaker_for(self, source_id: str) -> CircuitBreaker:
+        """Return the circuit breaker of a source."""
+        breaker = self.breakers.get(source_id)
+        if breaker is None:
+            breaker = self.breakers[source_id] = CircuitBreaker(name=source_id)
+        return breaker
+
+    def status(self, source_id: str) -> str:
+        """Return the ``STATUS_*`` value describing a source's data."""
+        if self.breaker_for(source_id).state != CircuitBreaker.CLOSED:
+            return STATUS_CIRCUIT_OPEN
+        outcome = self._outcomes.get(source_id)
+        if self.is_fresh(source_id):
+            return STATUS_PARTIAL if outcome == STATUS_PARTIAL else STATUS_OK
+        if outcome in (STATUS_TIMEOUT, STATUS_ERROR):
+            return outcome
+        return STATUS_STALE if source_id in self._snapshots else STATUS_PENDING
+
+    def versions_of(self, sources: Iterable[str]) -> Dict[str, int]:
+        """Return the current version of each source.
+
+        A result computed from these sources is current as long as this
+        returns the same dictionary; publishes of other sources do not
+        affect it.
+        """
+        return {source_id: self.versions.get(source_id, 0) for source_id in sources}
+
+    def get(self, source_id: str) -> Optional[SourceSnapshot]:
+        """Return the current snapshot of a source, if any."""
+        return self._snapshots.get(source_id)
+
+    def is_fresh(self, source_id: str) -> bool:
+        """Check whether a source has a snapshot younger than its TTL."""
+        snapshot = self._snapshots.get(source_id)
+        if snapshot is None:
+            return False
+        return time.time() - snapshot.fetched_at < self.ttl_for(source_id)
+
+    def publish(
+        self,
+        source_id: str,
+        items: List[NewsRecord],
+        fetched_at: Optional[float] = None,
+    ) -> SourceSnapshot:
+        """Replace the snapshot of a source.
+
+        The snapshot is immutable and swapped in with a single assignment,
+        so readers always see either the old or the new item set.
+
+        If the items match the current snapshot's in URL, title, date and
+        summary, as after a 304 or an unchanged body, only the fetch time
+        moves: the version, the index and the ingest log are left alone, so
+        cached results stay valid and the current records are kept.
+
+        Args:
+            source_id: Source the items belong to.
+            items: Newly fetched items.
+            fetched_at: UNIX timestamp of the fetch. Defaults to now; older
+                times are used for restored snapshots so they expire on
+                their original schedule.
+
+        Returns:
+            The published snapshot.
+        """
+        if fetched_at is None:
+            fetched_at = time.time()
+        items = tuple(items)
+        current = self._snapshots.get(source_id)
+        if current is not None and self._unchanged(current.items, items):
+            snapshot = self._snapshots[source_id] = current.refetched(fetched_at)
+            return snapshot
+        snapshot = SourceSnapshot(source_id, items, fetched_at)
+        self.index.replace_source(source_id, snapshot.items)
+        self._snapshots[source_id] = snapshot
+        self.version += 1
+        self.versions[source_id] = self.versions.get(source_id, 0) + 1
+        self.ingest_log.record(source_id, snapshot.items)
+        return snapshot
+
+    @staticmethod
+    def _unchanged(
+        current: Tuple[NewsRecord, ...], items: Tuple[NewsRecord, ...]
+    ) -> bool:
+        """Check whether refetched items match the current ones in content."""
+        if len(current) != len(items):
+            return False
+        return all(
+            old is new or _content_key(old) == _content_key(new)
+            for old, new in zip(current, items)
+        )
+
+    async def refresh(self, source_id: str) -> Optional[SourceSnapshot]:
+        """Fetch a source and publish a new snapshot.
+
+        Concurrent refreshes of the same source share one upstream fetch.
+        On failure the previous snapshot is kept.
+
+        Args:
+            source_id: Source to refresh.
+
+        Returns:
+            The current snapshot of the source, or None if it never loaded.
+        """
+        return await self._flights.do(source_id, lambda: self._refresh(source_id))
+
+    async def _refresh(self, source_id: str) -> Optional[SourceSnapshot]:
+        """Fetch a source without coalescing, unless its circuit is open."""
+        breaker = self.breaker_for(source_id)
+        if not breaker.allow():
+            metrics.SOURCE_FETCHES.inc(source=source_id, status=STATUS_CIRCUIT_OPEN)
+            return self._snapshots.get(source_id)
+
+        adapter = self.adapters[source_id]
+        try:
+            with metrics.SOURCE_FETCH_SECONDS.time(source=source_id):
+                items = await asyncio.wait_for(
+                    adapter.fetch_news(self.fetch_limit), self.fetch_timeout
+                )
+        except Exception as e:
+            # Keep serving the previous snapshot
+            timed_out = isinstance(e, asyncio.TimeoutError)
+            status = STATUS_TIMEOUT if timed_out else STATUS_ERROR
+            self._outcomes[source_id] = status
+            metrics.SOURCE_FETCHES.inc(source=source_id, status=status)
+            breaker.record_failure()
+            if timed_out:
+                logger.warning("Timed out fetching from %s", source_id)
+            else:
+                logger.exception("Error fetching from %s", source_id)
+            return self._snapshots.get(source_id)
+        # Adapters combining several requests list the ones that failed
+        missing = getattr(items, "missing", [])
+        if missing:
+            logger.warning("Fetched %s without %s", source_id, ", ".join(missing))
+        status = STATUS_PARTIAL if missing else STATUS_OK
+        self._outcomes[source_id] = status
+        metrics.SOURCE_FETCHES.inc(source=source_id, status=status)
+        breaker.record_success()
+        # Parsers only check URLs structurally; validate the whole fetch once
+        items, dropped = drop_invalid(items)
+        if dropped:
+            logger.warning("Dropped %d invalid items from %s", dropped, source_id)
+        previous = self._snapshots.get(source_id)
+        snapshot = self.publish(source_id, items)
+        if self.policies is not None:
+            self.policy_for(source_id).observe(
+                snapshot.items, snapshot.fetched_at, adapter.refresh_hint
+            )
+        await self._persist(snapshot, previous)
+        return snapshot
+
+    async def _persist(
+        self, snapshot: SourceSnapshot, previous: Optional[SourceSnapshot] = None
+    ) -> None:
+        """Save a snapshot to the article store, if one is open.
+
+        An unchanged refetch of ``previous`` only moves its fetch time.
+        """
+        store = self.article_store
+        if store is None or not store.is_open:
+            return
+        try:
+            if previous is not None and snapshot.items is previous.items:
+                await asyncio.to_thread(
+                    store.touch,
+                    snapshot.source_id,
+                    previous.fetched_at,
+                    snapshot.fetched_at,
+                )
+            else:
+                await asyncio.to_thread(
+                    store.save, snapshot.source_id, snapshot.items, snapshot.fetched_at
+                )
+        except Exception:
+            # The snapshot is already served from memory
+            logger.exception(
+                "Error saving %s to the article store", snapshot.source_id
+            )
+
+    async def restore(self) -> List[str]:
+        """Publish the last saved snapshot of every known source.
+
+        Restored snapshots keep their original fetch time, so stale ones
+        are served until the next refresh replaces them.
+
+        Returns:
+            IDs of the restored sources.
+        """
+        store = self.article_store
+        if store is None or not store.is_open:
+            return []
+        snapshots = await asyncio.to_thread(store.load_snapshots)
+        restored = []
+        for source_id, (fetched_at, items) in snapshots.items():
+            if source_id in self.adapters and source_id not in self._snapshots:
+                self.publish(source_id, items, fetched_at)
+                restored.append(source_id)
+        return restored
+
+    async def get_items(
+        self,
+        sources: List[str],
+        refresh: bool = True,
+        keyword: Optional[str] = None,
+    ) -> List[NewsRecord]:
+        """Return the items of the given sources, refreshing stale ones.
+
+        Args:
+            sources: Source IDs to read.
+            refresh: Fetch stale sources inline. Disabled while a background
+                scheduler keeps the snapshots up to date.
+            keyword: Only return items whose title or summary contains this
+                keyword, looked up in the index.
+
+        Returns:
+            Combined list of items from all requested sources.
+        """
+        sources = await self._ensure_fresh(sources, refresh)
+        if keyword:
+            return self.index.search(keyword, sources)
+
+        items: List[NewsRecord] = []
+        for source_id in sources:
+            snapshot = self._snapshots.get(source_id)
+            if snapshot is not None:
+                items.extend(snapshot.items)
+        return items
+
+    async def get_sorted_streams(
+        self, sources: List[str], sort_order: str = "desc", refresh: bool = True
+    ) -> List[Tuple[NewsRecord, ...]]:
+        """Return each source's items ordered by publication time.
+
+        Args:
+            sources: Source IDs to read.
+            sort_order: 'desc' for newest first, 'asc' for oldest first.
+            refresh: Fetch stale sources inline.
+
+        Returns:
+            One sorted item tuple per source that has a snapshot.
+        """
+        sources = await self._ensure_fresh(sources, refresh)
+        streams = []
+        for source_id in sources:
+            snapshot = self._snapshots.get(source_id)
+            if snapshot is not None:
+                streams.append(
+                    snapshot.newest_first
+                    if sort_order == "desc"
+                    else snapshot.oldest_first
+                )
+        return streams
+
+    async def _ensure_fresh(self, sources: List[str], refresh: bool) -> List[str]:
+        """Drop unknown sources and, if ``refresh``, refetch stale ones.
+
+        Refreshes still running at the deadline continue in the background
+        and the query uses the snapshots available so far.
+        """
+        sources = [s for s in sources if s in self.adapters]
+        stale = [s for s in sources if not self.is_fresh(s)] if refresh else []
+        if stale:
+            tasks = {s: asyncio.ensure_future(self.refresh(s)) for s in stale}
+            _, pending = await asyncio.wait(tasks.values(), timeout=self.deadline)
+            for source_id, task in tasks.items():
+                if task in pending:
+                    # Only this wait is cancelled; the shared refresh goes on
+                    task.cancel()
+                    self._outcomes[source_id] = STATUS_TIMEOUT
+        return sources
@@ -0,0 +1,93 @@
+"""Benchmark per-item cost of NewsItem versus the internal NewsRecord.
+
+Compares the ingest-to-response path: building an item per feed entry and
+converting it to the API dictionary, as done for every source refresh.
+
+Usage:
+    python benchmarks/bench_item_records.py [--items 1000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from backend.models import NewsItem, NewsRecord  # noqa: E402
+
+ENTRIES = [
+    {
+        "title": f"政府、経済対策を決定 円安対応で{i}兆円規模",
+        "url": f"https://news.yahoo.co.jp/articles/{i:040x}",
+        "published_at": datetime(2026, 2, 15, 12, i % 60),
+        "source": "yahoo",
+        "source_name": "Yahoo News",
+        "summary": "政府は臨時閣議で総合経済対策を決定した。" * 3,
+    }
+    for i in range(5000)
+]
+
+
+def pydantic_path(entries):
+    """Previous path: validate a NewsItem, then rebuild the dict."""
+    items = [NewsItem(**entry) for entry in entries]
+    result = []
+    for item in items:
+        result.append(
+            {
+                "title": item.title,
+                "url": str(item.url),
+                "published_at": (
+                    item.published_at.isoformat() if item.published_at else None
+                ),
+                "source": item.source,
+                "source_name": item.source_name,
+                "summary": item.summary,
+            }
+        )
+    return items, result
+
+
+def record_path(entries):
+    """Current path: build a NewsRecord and take its cached dict."""
+    items = [NewsRecord(**entry) for entry in entries]
+    return items, [item.to_dict() for item in items]
+
+
+def measure_allocations(fn, entries) -> int:
+    """Return peak bytes allocated for the items and dicts ``fn`` keeps."""
+    tracemalloc.start()
+    result = fn(entries)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    entries = ENTRIES[: args.items]
+    if pydantic_path(entries)[1] != record_path(entries)[1]:
+        sys.exit("record path output differs from the pydantic path")
+
+    print(f"items: {len(entries)}")
+    print(f"{'path':>10} {'us/item':>10} {'bytes/item':>12}")
+    for name, fn in (("pydantic", pydantic_path), ("record", record_path)):
+        best = min(timeit.repeat(lambda: fn(entries), number=1, repeat=args.repeat))
+        peak = measure_allocations(fn, entries)
+        print(
+            f"{name:>10} {best / len(entries) * 1e6:10.2f}"
+            f" {peak / len(entries):12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
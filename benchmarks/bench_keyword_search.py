@@ -0,0 +1,88 @@
+"""Benchmark keyword search: inverted bigram index vs linear scan.
+
+Usage:
+    python benchmarks/bench_keyword_search.py [--items 20000] [--repeat 50]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from backend.models import NewsRecord  # noqa: E402
+from backend.services import KeywordIndex, NewsAggregator  # noqa: E402
+
+# Common words in Japanese news headlines
+WORDS = [
+    "東京", "大阪", "政府", "首相", "選挙", "株価", "円安", "地震", "台風", "大雪",
+    "経済", "物価", "上昇", "下落", "発表", "会見", "速報", "警察", "事故", "裁判",
+    "野球", "サッカー", "五輪", "新型", "感染", "ワクチン", "ＡＩ", "半導体", "輸出",
+    "気温", "予報", "米国", "中国", "韓国", "国会", "予算", "値上げ", "賃金", "企業",
+]
+KEYWORDS = ["東京", "円安", "半導体", "ai", "株価上昇", "値", "存在しない語"]
+
+
+def make_vocabulary(rng: random.Random, size: int = 3000) -> list:
+    """Mix the common words with random kanji compounds."""
+    kanji = [chr(c) for c in range(0x4E00, 0x4E00 + 800)]
+    filler = ["".join(rng.choices(kanji, k=rng.choice((2, 3)))) for _ in range(size)]
+    return WORDS + filler
+
+
+def make_records(count: int) -> list:
+    rng = random.Random(0)
+    vocabulary = make_vocabulary(rng)
+    return [
+        NewsRecord(
+            title="".join(rng.choices(vocabulary, k=6)),
+            url=f"https://example.com/{i}",
+            published_at=None,
+            source="bench",
+            source_name="Bench",
+            summary="".join(rng.choices(vocabulary, k=20)),
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    records = make_records(args.items)
+    aggregator = NewsAggregator({})
+    index = KeywordIndex()
+    build = timeit.timeit(lambda: index.replace_source("bench", records), number=1)
+
+    print(f"items: {args.items}, index build: {build * 1000:.0f} ms")
+    print(f"{'keyword':>12} {'matches':>8} {'scan ms':>9} {'index ms':>9}")
+    for keyword in KEYWORDS:
+        expected = aggregator.filter_by_keyword(records, keyword)
+        if index.search(keyword) != expected:
+            sys.exit(f"index results differ from the linear scan for {keyword!r}")
+        scan = min(
+            timeit.repeat(
+                lambda: aggregator.filter_by_keyword(records, keyword),
+                number=1,
+                repeat=max(1, args.repeat // 10),
+            )
+        )
+        indexed = min(
+            timeit.repeat(
+                lambda: index.search(keyword), number=1, repeat=args.repeat
+            )
+        )
+        print(
+            f"{keyword:>12} {len(expected):>8} {scan * 1000:>9.2f} "
+            f"{indexed * 1000:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark merging many feeds: full sort vs heap top-k vs k-way merge.
+
+Usage:
+    python benchmarks/bench_merge.py [--feeds 10 100 500] [--items 50] [--limit 20]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from backend.models import NewsRecord  # noqa: E402
+from backend.services import NewsAggregator  # noqa: E402
+from backend.services.source_store import SourceSnapshot  # noqa: E402
+
+
+def full_sort(items, limit):
+    """The previous merge_and_sort: dedupe, sort everything, slice."""
+    seen, unique = set(), []
+    for item in items:
+        if item.url not in seen:
+            seen.add(item.url)
+            unique.append(item)
+    return sorted(
+        unique,
+        key=lambda x: x.published_at if x.published_at else datetime.min,
+        reverse=True,
+    )[:limit]
+
+
+def make_snapshots(feeds: int, items: int) -> list:
+    """Build mostly date-ordered feeds with some shared articles."""
+    rng = random.Random(0)
+    now = datetime(2026, 2, 15, 12)
+    snapshots = []
+    for f in range(feeds):
+        records = []
+        for i in range(items):
+            # Wire stories show up in several feeds under the same URL
+            if rng.random() < 0.1:
+                url = f"https://example.com/wire/{rng.randrange(500)}"
+            else:
+                url = f"https://example.com/{f}/{i}"
+            records.append(
+                NewsRecord(
+                    title=f"feed {f} item {i}",
+                    url=url,
+                    published_at=now - timedelta(minutes=i * 7 + rng.randrange(10)),
+                    source=f"feed{f}",
+                    source_name=f"Feed {f}",
+                )
+            )
+        snapshots.append(SourceSnapshot(f"feed{f}", tuple(records), 0.0))
+    return snapshots
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feeds", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    aggregator = NewsAggregator({})
+    print(f"items per feed: {args.items}, limit: {args.limit}")
+    print(f"{'feeds':>6} {'full sort ms':>13} {'top-k ms':>9} {'k-way ms':>9}")
+    for feeds in args.feeds:
+        snapshots = make_snapshots(feeds, args.items)
+        flat = [item for s in snapshots for item in s.items]
+        streams = [s.newest_first for s in snapshots]
+        implementations = {
+            "full": lambda: full_sort(flat, args.limit),
+            "topk": lambda: aggregator.merge_and_sort(flat, args.limit),
+            "kway": lambda: aggregator.merge_sorted_streams(streams, args.limit),
+        }
+        # The k-way merge keeps the newest copy of a duplicate rather than
+        # the first one in feed order, so only the top-k path must match
+        if implementations["full"]() != implementations["topk"]():
+            sys.exit("top-k output differs from the full sort")
+
+        timings = {
+            name: min(timeit.repeat(fn, number=1, repeat=args.repeat))
+            for name, fn in implementations.items()
+        }
+        print(
+            f"{feeds:>6} {timings['full'] * 1000:>13.2f} "
+            f"{timings['topk'] * 1000:>9.2f} {timings['kway'] * 1000:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
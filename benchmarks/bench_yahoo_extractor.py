@@ -0,0 +1,60 @@
+"""Benchmark the Yahoo front page link extractor against BeautifulSoup.
+
+Usage:
+    python benchmarks/bench_yahoo_extractor.py [--limit 50] [--repeat 20]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from backend.adapters.parsing import extract_article_links, parse_front_page  # noqa: E402
+
+FIXTURE = ROOT / "benchmarks" / "fixtures" / "yahoo_top.html"
+BASE_URL = "https://news.yahoo.co.jp/"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    body = FIXTURE.read_text(encoding="utf-8")
+    implementations = {
+        "beautifulsoup": parse_front_page,
+        "extractor": extract_article_links,
+    }
+
+    results = {}
+    for name, fn in implementations.items():
+        results[name] = [
+            (item.title, str(item.url))
+            for item in fn(body, args.limit, BASE_URL, "yahoo", "Yahoo News")
+        ]
+    if results["beautifulsoup"] != results["extractor"]:
+        sys.exit("extractor output differs from the BeautifulSoup implementation")
+
+    print(f"fixture: {FIXTURE.name} ({len(body.encode('utf-8')) / 1024:.0f} KiB)")
+    print(f"limit: {args.limit}, links found: {len(results['extractor'])}")
+    timings = {}
+    for name, fn in implementations.items():
+        best = min(
+            timeit.repeat(
+                lambda: fn(body, args.limit, BASE_URL, "yahoo", "Yahoo News"),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        timings[name] = best
+        print(f"{name:>14}: {best * 1000:8.2f} ms")
+    speedup = timings["beautifulsoup"] / timings["extractor"]
+    print(f"{'speedup':>14}: {speedup:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
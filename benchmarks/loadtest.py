@@ -0,0 +1,305 @@
+"""Cache-stampede load test: concurrent in-process /api/news bursts.
+
+Thousands of concurrent requests over a set of distinct query keys are
+sent through the ASGI app, with the upstream replaced by the stand-in from
+``benchmarks/upstream.py``. Each phase is one burst:
+
+    cold     Empty source store and result cache.
+    hit      Every key cached and fresh.
+    stale    Every cached result invalidated by a source publish, so
+             requests are served stale and schedule background refreshes.
+    expired  Result cache cleared and every source snapshot past its TTL,
+             so rebuilds refetch the sources.
+
+For each phase the latency percentiles, the upstream calls per URL, and
+the refresh work per cache key are reported: refreshes scheduled or run
+(``_refresh_cache`` calls) and rebuilds (results computed and cached).
+Ideally every key is rebuilt at most once and every upstream URL fetched
+at most once per phase; anything above that is duplicated work.
+
+Usage:
+    python benchmarks/loadtest.py [--requests 5000] [--keys 50]
+        [--concurrency 1000] [--latency 0.05] [--jitter 0.02]
+        [--error-rate 0.0] [--output loadtest.json]
+        [--max-duplicate-rebuilds N]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List
+from urllib.parse import urlencode
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import backend.main as api  # noqa: E402
+from backend.services import SourceStore  # noqa: E402
+
+from benchmarks.upstream import StandInUpstream  # noqa: E402
+
+PHASES = ("cold", "hit", "stale", "expired")
+PERCENTILES = (50, 90, 99)
+
+
+def make_queries(count: int, seed: int = 0) -> List[str]:
+    """Return ``count`` distinct /api/news URLs with varied parameters."""
+    combos = list(
+        itertools.product(
+            ["all", "yahoo", "nhk", "google", "nhk,google"],
+            [10, 20, 30, 50],
+            ["desc", "asc"],
+            ["published_at", "source"],
+            [None, "政府", "経済"],
+        )
+    )
+    random.Random(seed).shuffle(combos)
+    if count > len(combos):
+        sys.exit(f"at most {len(combos)} distinct keys are available")
+    queries = []
+    for sources, limit, order, sort_by, keyword in combos[:count]:
+        params = {
+            "sources": sources,
+            "limit": limit,
+            "sort_by": sort_by,
+            "sort_order": order,
+        }
+        if keyword:
+            params["keyword"] = keyword
+        queries.append(f"/api/news?{urlencode(params)}")
+    return queries
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of sorted ``values``."""
+    if not values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(values))) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+class RefreshCounter:
+    """Counts refresh calls and cache rebuilds per key while installed."""
+
+    def __init__(self):
+        self.refreshes: Counter = Counter()
+        self.rebuilds: Counter = Counter()
+        self._refresh_cache = api._refresh_cache
+        self._cache_set = api._cache.set
+
+    def install(self) -> None:
+        """Wrap the app's refresh function and result cache writes."""
+        refresh_cache = self._refresh_cache
+        cache_set = self._cache_set
+
+        async def counted_refresh(cache_key: str, *args: Any) -> Dict[str, Any]:
+            self.refreshes[cache_key] += 1
+            return await refresh_cache(cache_key, *args)
+
+        def counted_set(key: str, value: Any) -> None:
+            self.rebuilds[key] += 1
+            cache_set(key, value)
+
+        api._refresh_cache = counted_refresh
+        api._cache.set = counted_set
+
+    def uninstall(self) -> None:
+        """Restore the wrapped functions."""
+        api._refresh_cache = self._refresh_cache
+        del api._cache.set
+
+    def reset(self) -> None:
+        """Start counting a new phase."""
+        self.refreshes.clear()
+        self.rebuilds.clear()
+
+
+async def burst(
+    client: httpx.AsyncClient,
+    queries: List[str],
+    requests: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """Send ``requests`` concurrent requests spread over ``queries``.
+
+    Returns:
+        Latencies in seconds, sorted, and the count of failed requests.
+    """
+    slots = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    failures = 0
+
+    async def one(url: str) -> None:
+        nonlocal failures
+        async with slots:
+            started = time.perf_counter()
+            response = await client.get(url)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                failures += 1
+
+    await asyncio.gather(*(one(queries[i % len(queries)]) for i in range(requests)))
+    latencies.sort()
+    return {"latencies": latencies, "failures": failures}
+
+
+def summarize(
+    phase: str,
+    outcome: Dict[str, Any],
+    counter: RefreshCounter,
+    upstream_calls: Counter,
+    elapsed: float,
+) -> Dict[str, Any]:
+    """Build the report of one phase."""
+    latencies = outcome["latencies"]
+    rebuilds = counter.rebuilds
+    return {
+        "phase": phase,
+        "requests": len(latencies),
+        "failures": outcome["failures"],
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            **{
+                f"p{pct}": round(percentile(latencies, pct) * 1000, 2)
+                for pct in PERCENTILES
+            },
+            "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        },
+        "upstream_calls": dict(upstream_calls),
+        "duplicate_upstream_calls": sum(
+            max(n - 1, 0) for n in upstream_calls.values()
+        ),
+        "refresh_calls": sum(counter.refreshes.values()),
+        "rebuilds": sum(rebuilds.values()),
+        "keys_rebuilt": len(rebuilds),
+        "duplicate_rebuilds": sum(max(n - 1, 0) for n in rebuilds.values()),
+        "max_rebuilds_per_key": max(rebuilds.values(), default=0),
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print one phase's numbers."""
+    latency = report["latency_ms"]
+    print(
+        f"{report['phase']:>8}: {report['requests']} requests, "
+        f"{report['failures']} failed, {report['requests_per_second']} req/s"
+    )
+    print(
+        "          latency ms "
+        + ", ".join(f"{name} {value}" for name, value in latency.items())
+    )
+    print(
+        f"          upstream calls {sum(report['upstream_calls'].values())} "
+        f"({report['duplicate_upstream_calls']} duplicate), "
+        f"refresh calls {report['refresh_calls']}, "
+        f"rebuilds {report['rebuilds']} over {report['keys_rebuilt']} keys "
+        f"({report['duplicate_rebuilds']} duplicate, "
+        f"max {report['max_rebuilds_per_key']} per key)"
+    )
+
+
+def prepare(phase: str, adapters: Dict[str, Any]) -> None:
+    """Put the app's store and cache into the state a phase starts from."""
+    if phase == "cold":
+        api.source_store = SourceStore(adapters, breakers={})
+        api._cache.clear()
+        api._result_snapshots.clear()
+    elif phase == "stale":
+        # A published snapshot of every source makes every cached result stale
+        store = api.source_store
+        for source_id in adapters:
+            store.versions[source_id] = store.versions.get(source_id, 0) + 1
+    elif phase == "expired":
+        # Same items, fetched long enough ago that every source is stale
+        previous = api.source_store
+        store = SourceStore(adapters, breakers={})
+        for source_id in adapters:
+            snapshot = previous.get(source_id)
+            if snapshot is not None:
+                fetched_at = time.time() - store.ttl_for(source_id) - 1
+                store.publish(source_id, snapshot.items, fetched_at)
+        api.source_store = store
+        api._cache.clear()
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Run every phase and return the reports."""
+    upstream = StandInUpstream(args.latency, args.jitter, args.error_rate, args.seed)
+    adapters = api.aggregator.adapters
+    pools = {source_id: adapter.http_pool for source_id, adapter in adapters.items()}
+    original_store = api.source_store
+    pool = upstream.install(adapters.values())
+    counter = RefreshCounter()
+    counter.install()
+    queries = make_queries(args.keys, args.seed)
+    reports = []
+    try:
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadtest", timeout=None
+        ) as client:
+            for phase in PHASES:
+                prepare(phase, adapters)
+                counter.reset()
+                calls_before = Counter(upstream.calls)
+                started = time.perf_counter()
+                outcome = await burst(client, queries, args.requests, args.concurrency)
+                elapsed = time.perf_counter() - started
+                report = summarize(
+                    phase, outcome, counter, upstream.calls - calls_before, elapsed
+                )
+                print_report(report)
+                reports.append(report)
+    finally:
+        counter.uninstall()
+        api.source_store = original_store
+        api._cache.clear()
+        api._result_snapshots.clear()
+        for source_id, adapter in adapters.items():
+            adapter.http_pool = pools[source_id]
+        await pool.aclose()
+    return reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000, help="per phase")
+    parser.add_argument("--keys", type=int, default=50, help="distinct queries")
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write the reports as JSON")
+    parser.add_argument(
+        "--max-duplicate-rebuilds",
+        type=int,
+        help="exit with status 1 if any phase rebuilds keys more often",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{args.requests} requests per phase over {args.keys} keys, "
+        f"concurrency {args.concurrency}, upstream latency {args.latency}s"
+    )
+    reports = asyncio.run(run(args))
+    if args.output:
+        text = json.dumps(reports, indent=2, ensure_ascii=False)
+        args.output.write_text(text + "\n")
+
+    if args.max_duplicate_rebuilds is not None:
+        worst = max(report["duplicate_rebuilds"] for report in reports)
+        if worst > args.max_duplicate_rebuilds:
+            sys.exit(f"{worst} duplicate rebuilds in one phase")
+
+
+if __name__ == "__main__":
+    main()
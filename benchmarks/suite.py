@@ -0,0 +1,357 @@
+"""Reproducible benchmark suite over recorded feeds, compared to a baseline.
+
+Scenarios:
+    parse.*            Items parsed per second for each recorded fixture,
+                       with feedparser, the streaming RSS parser and the
+                       Yahoo front page extractor.
+    merge_and_sort.*   NewsAggregator.merge_and_sort over N items.
+    filter_by_keyword.* NewsAggregator.filter_by_keyword over N items.
+    api.*              In-process /api/news requests per second on a cache
+                       hit, a stale hit (answer plus background refresh), a
+                       miss (rebuild from the source store) and with every
+                       source refetched from the stand-in upstream.
+
+Results are written as JSON and compared against ``baseline.json``; the
+exit status is 1 if any scenario is slower than the baseline by more than
+the tolerance. Baselines are machine specific: regenerate them with
+``--update-baseline`` on the machine the comparisons run on.
+
+Usage:
+    python benchmarks/suite.py [--only parse api] [--quick]
+        [--output results.json] [--baseline benchmarks/baseline.json]
+        [--tolerance 0.25] [--update-baseline]
+        [--latency 0.0] [--jitter 0.0] [--error-rate 0.0]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from backend.adapters.parsing import extract_article_links, parse_rss  # noqa: E402
+from backend.adapters.streaming import StreamingRSSParser  # noqa: E402
+from backend.models import NewsRecord  # noqa: E402
+from backend.services import NewsAggregator, SourceStore  # noqa: E402
+
+from benchmarks.upstream import StandInUpstream, load_fixture  # noqa: E402
+
+BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+FEEDS = {
+    "yahoo_rss": "yahoo",
+    "nhk_rss": "nhk",
+    "google_rss": "google",
+}
+FRONT_PAGE_URL = "https://news.yahoo.co.jp/"
+KEYWORD = "経済"
+
+Results = Dict[str, Dict[str, Any]]
+
+
+def result(value: float, unit: str, better: str) -> Dict[str, Any]:
+    """Build one scenario result.
+
+    Args:
+        value: Measured value.
+        unit: Unit of ``value``.
+        better: 'higher' or 'lower'.
+    """
+    return {"value": round(value, 3), "unit": unit, "better": better}
+
+
+def _dumps(report: Dict[str, Any]) -> str:
+    """Serialize a report the way it is stored."""
+    return json.dumps(report, indent=2, ensure_ascii=False) + "\n"
+
+
+def best_seconds(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest per-call time of ``fn`` over ``repeat`` rounds.
+
+    Each round runs ``fn`` often enough to take at least 0.2 seconds, so
+    fast calls are not dominated by timer noise.
+    """
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(number=number, repeat=repeat)) / number
+
+
+def bench_parse(quick: bool) -> Results:
+    """Measure parse throughput per recorded fixture."""
+    repeat = 2 if quick else 5
+    results: Results = {}
+    for name, source in FEEDS.items():
+        raw = load_fixture(f"{name}.xml")
+        text = raw.decode("utf-8")
+        count = len(parse_rss(text, 1000, source, source))
+
+        def streamed() -> List[NewsRecord]:
+            parser = StreamingRSSParser(1000, source, source)
+            parser.feed(raw)
+            return parser.close()
+
+        seconds = best_seconds(lambda: parse_rss(text, 1000, source, source), repeat)
+        results[f"parse.{name}.feedparser"] = result(
+            count / seconds, "items/s", "higher"
+        )
+        seconds = best_seconds(streamed, repeat)
+        results[f"parse.{name}.streaming"] = result(
+            count / seconds, "items/s", "higher"
+        )
+
+    page = load_fixture("yahoo_top.html").decode("utf-8")
+
+    def extract() -> List[NewsRecord]:
+        return extract_article_links(page, 50, FRONT_PAGE_URL, "yahoo", "Yahoo News")
+
+    count = len(extract())
+    seconds = best_seconds(extract, repeat)
+    results["parse.yahoo_top.extractor"] = result(count / seconds, "items/s", "higher")
+    return results
+
+
+def make_records(count: int) -> List[NewsRecord]:
+    """Build ``count`` records from the recorded feeds' articles.
+
+    Titles and summaries are reused, with unique URLs and shuffled
+    publication times so sorting has work to do.
+    """
+    rng = random.Random(0)
+    templates = []
+    for name, source in FEEDS.items():
+        body = load_fixture(f"{name}.xml").decode("utf-8")
+        templates.extend(parse_rss(body, 1000, source, source))
+    records = []
+    for i in range(count):
+        template = templates[i % len(templates)]
+        records.append(
+            NewsRecord(
+                title=template.title,
+                url=f"{template.url}#{i}",
+                published_at=template.published_at
+                - timedelta(minutes=rng.randrange(60 * 24 * 7)),
+                source=template.source,
+                source_name=template.source_name,
+                summary=template.summary,
+            )
+        )
+    rng.shuffle(records)
+    return records
+
+
+def bench_aggregate(quick: bool) -> Results:
+    """Measure how merge_and_sort and filter_by_keyword scale with N."""
+    sizes = [1_000, 10_000] if quick else [1_000, 10_000, 100_000]
+    aggregator = NewsAggregator({})
+    results: Results = {}
+    for size in sizes:
+        records = make_records(size)
+        repeat = 2 if quick else 5
+        seconds = best_seconds(lambda: aggregator.merge_and_sort(records), repeat)
+        results[f"merge_and_sort.{size}"] = result(seconds * 1000, "ms", "lower")
+        seconds = best_seconds(
+            lambda: aggregator.filter_by_keyword(records, KEYWORD), repeat
+        )
+        results[f"filter_by_keyword.{size}"] = result(seconds * 1000, "ms", "lower")
+    return results
+
+
+async def _requests_per_second(
+    client: httpx.AsyncClient,
+    url: str,
+    count: int,
+    before: Callable[[], None] = lambda: None,
+    rounds: int = 5,
+) -> float:
+    """Send ``count`` sequential requests in rounds and return the best rate.
+
+    ``before`` runs ahead of every request and is not timed.
+    """
+    best = 0.0
+    per_round = max(count // rounds, 1)
+    for _ in range(rounds):
+        elapsed = 0.0
+        for _ in range(per_round):
+            before()
+            started = time.perf_counter()
+            response = await client.get(url)
+            elapsed += time.perf_counter() - started
+            response.raise_for_status()
+        best = max(best, per_round / elapsed)
+    return best
+
+
+async def _bench_api(args: argparse.Namespace) -> Results:
+    """Run the /api/news scenarios, restoring the app's globals afterwards."""
+    # Imported here so the other scenarios do not build the app
+    import backend.main as main
+
+    upstream = StandInUpstream(args.latency, args.jitter, args.error_rate)
+    adapters = main.aggregator.adapters
+    pools = {source_id: adapter.http_pool for source_id, adapter in adapters.items()}
+    original_store = main.source_store
+    pool = upstream.install(adapters.values())
+    count = 50 if args.quick else 300
+    url = "/api/news?sources=all&limit=20"
+    results: Results = {}
+
+    def use_store(store: SourceStore) -> None:
+        main.source_store = store
+        main._cache.clear()
+        main._result_snapshots.clear()
+
+    try:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            use_store(SourceStore(adapters, breakers={}))
+            (await client.get(url)).raise_for_status()  # Fill the store and cache
+
+            rate = await _requests_per_second(client, url, count)
+            results["api.hit"] = result(rate, "req/s", "higher")
+
+            def invalidate() -> None:
+                # A published snapshot makes the cached result stale
+                store = main.source_store
+                store.versions["yahoo"] = store.versions.get("yahoo", 0) + 1
+
+            rate = await _requests_per_second(client, url, count, invalidate)
+            results["api.stale"] = result(rate, "req/s", "higher")
+
+            rate = await _requests_per_second(client, url, count, main._cache.clear)
+            results["api.miss"] = result(rate, "req/s", "higher")
+
+            # Every snapshot expires at once, so each request refetches
+            use_store(
+                SourceStore(
+                    adapters, ttl_seconds={}, default_ttl_seconds=0, breakers={}
+                )
+            )
+            calls = sum(upstream.calls.values())
+            rate = await _requests_per_second(
+                client, url, max(count // 5, 10), main._cache.clear
+            )
+            results["api.upstream"] = result(rate, "req/s", "higher")
+            print(
+                f"stand-in upstream calls: {sum(upstream.calls.values()) - calls} "
+                f"for {max(count // 5, 10)} requests"
+            )
+    finally:
+        main.source_store = original_store
+        main._cache.clear()
+        main._result_snapshots.clear()
+        for source_id, adapter in adapters.items():
+            adapter.http_pool = pools[source_id]
+        await pool.aclose()
+    return results
+
+
+def bench_api(args: argparse.Namespace) -> Results:
+    """Measure end-to-end /api/news throughput against the stand-in upstream."""
+    return asyncio.run(_bench_api(args))
+
+
+def compare(results: Results, baseline: Results, tolerance: float) -> List[str]:
+    """Print each result next to its baseline and list the regressions.
+
+    Args:
+        results: Current results.
+        baseline: Stored results.
+        tolerance: Allowed slowdown as a fraction, e.g. 0.25.
+
+    Returns:
+        Names of the scenarios that regressed beyond the tolerance.
+    """
+    regressions = []
+    print(f"{'scenario':<34} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<34} {'-':>12} {current['value']:>12.3f} {'new':>8}")
+            continue
+        if current["better"] == "higher":
+            ratio = current["value"] / base["value"]
+        else:
+            ratio = base["value"] / current["value"]
+        flag = ""
+        if ratio < 1 - tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<34} {base['value']:>12.3f} {current['value']:>12.3f} "
+            f"{(ratio - 1) * 100:>+7.0f}%{flag}"
+        )
+    return regressions
+
+
+SCENARIOS = {
+    "parse": lambda args: bench_parse(args.quick),
+    "aggregate": lambda args: bench_aggregate(args.quick),
+    "api": bench_api,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(SCENARIOS))
+    parser.add_argument("--quick", action="store_true", help="fewer rounds")
+    parser.add_argument("--output", type=Path, help="write the results JSON here")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    results: Results = {}
+    for name in args.only or SCENARIOS:
+        results.update(SCENARIOS[name](args))
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "quick": args.quick,
+            "upstream": {
+                "latency": args.latency,
+                "jitter": args.jitter,
+                "error_rate": args.error_rate,
+            },
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(_dumps(report))
+
+    if args.update_baseline:
+        stored = {}
+        if args.baseline.exists():
+            stored = json.loads(args.baseline.read_text())["results"]
+        report["results"] = {**stored, **results}
+        args.baseline.write_text(_dumps(report))
+        print(f"baseline written to {args.baseline}")
+        return
+
+    baseline: Results = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        sys.exit(f"{len(regressions)} scenario(s) regressed: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
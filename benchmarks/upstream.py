@@ -0,0 +1,119 @@
+"""Local stand-in for the upstream news sites, serving recorded fixtures.
+
+Requests for the configured feed URLs are answered from
+``benchmarks/fixtures`` through an httpx mock transport, so adapters run
+their real fetch and parse paths without network access. Latency and
+errors can be injected to model slow or failing upstreams.
+"""
+
+import asyncio
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from backend.adapters.base import NewsAdapter  # noqa: E402
+from backend.config import settings  # noqa: E402
+from backend.http_client import HTTPClientPool  # noqa: E402
+
+FIXTURES = ROOT / "benchmarks" / "fixtures"
+
+RSS = "application/rss+xml; charset=UTF-8"
+HTML = "text/html; charset=UTF-8"
+
+# Upstream URL -> (fixture file, content type)
+ROUTES: Dict[str, Tuple[str, str]] = {
+    settings.NEWS_SOURCES["yahoo"]["rss_url"]: ("yahoo_rss.xml", RSS),
+    settings.NEWS_SOURCES["yahoo"]["scrape_url"]: ("yahoo_top.html", HTML),
+    settings.NEWS_SOURCES["nhk"]["rss_url"]: ("nhk_rss.xml", RSS),
+    settings.NEWS_SOURCES["google"]["rss_url"]: ("google_rss.xml", RSS),
+}
+
+
+def load_fixture(name: str) -> bytes:
+    """Return the bytes of a recorded fixture."""
+    return (FIXTURES / name).read_bytes()
+
+
+class StandInUpstream:
+    """Answers upstream requests from fixtures with injected latency and errors.
+
+    Every request is counted by URL in ``calls``. Unknown URLs get a 404.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """Initialize the stand-in.
+
+        Args:
+            latency: Seconds each response is delayed.
+            jitter: Extra random delay of up to this many seconds.
+            error_rate: Fraction of requests answered with a 503.
+            seed: Seed of the jitter and error sequence.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self.bodies = {
+            url: (load_fixture(name), content_type)
+            for url, (name, content_type) in ROUTES.items()
+        }
+        self.calls: Counter = Counter()
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer one request.
+
+        Args:
+            request: Request sent by an adapter.
+
+        Returns:
+            The fixture for the URL, a 503 or a 404.
+        """
+        url = str(request.url)
+        self.calls[url] += 1
+        delay = self.latency + self._rng.random() * self.jitter
+        if delay:
+            await asyncio.sleep(delay)
+        if self._rng.random() < self.error_rate:
+            return httpx.Response(503, text="injected error")
+        route = self.bodies.get(url)
+        if route is None:
+            return httpx.Response(404)
+        body, content_type = route
+        return httpx.Response(200, content=body, headers={"Content-Type": content_type})
+
+    def transport(self) -> httpx.MockTransport:
+        """Return a transport that routes requests to this stand-in."""
+        return httpx.MockTransport(self.handle)
+
+    def install(
+        self, adapters: Iterable[NewsAdapter], pool: Optional[HTTPClientPool] = None
+    ) -> HTTPClientPool:
+        """Point adapters at the stand-in through a shared client pool.
+
+        Args:
+            adapters: Adapters whose ``http_pool`` is replaced.
+            pool: Pool to use; by default a new one over ``transport()``.
+
+        Returns:
+            The installed pool; close it with ``aclose()`` when done.
+        """
+        if pool is None:
+            pool = HTTPClientPool(transport=self.transport())
+        for adapter in adapters:
+            adapter.http_pool = pool
+            # Start from empty validators so every run parses the fixtures
+            adapter.validators.clear()
+        return pool
@@ -1,9 +1,131 @@
 """Configuration for pytest."""
 
 import sys
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
+
+import pytest
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from backend.adapters.base import NewsAdapter  # noqa: E402
+from backend.models import NewsItem, NewsRecord  # noqa: E402
+
+# Publication time of the first record built by the factories below
+BASE_TIME = datetime(2026, 2, 15, 12)
+
+
+def make_record(source, title=None, i=0, minutes=None, **fields):
+    """Build a record for ``source``.
+
+    Args:
+        source: Source ID; also used, upper-cased, as the source name.
+        title: Headline. Defaults to ``"{source} {i}"``.
+        i: Position of the record, used in its URL.
+        minutes: Publication time in minutes after ``BASE_TIME``.
+            Defaults to ``i``.
+        **fields: Other NewsRecord fields, e.g. ``summary``.
+
+    Returns:
+        The record.
+    """
+    if minutes is None:
+        minutes = i
+    values = {
+        "title": f"{source} {i}" if title is None else title,
+        "url": f"https://example.com/{source}/{i}",
+        "published_at": BASE_TIME + timedelta(minutes=minutes),
+        "source": source,
+        "source_name": source.upper(),
+    }
+    values.update(fields)
+    return NewsRecord(**values)
+
+
+def make_records(source, titles, start=0, step=timedelta(minutes=1), **fields):
+    """Build one record per title, ``step`` apart, newest last.
+
+    Args:
+        source: Source ID.
+        titles: Headlines in publication order.
+        start: Position of the first record.
+        step: Time between consecutive records.
+        **fields: Other NewsRecord fields shared by every record.
+
+    Returns:
+        The records.
+    """
+    return [
+        make_record(
+            source,
+            title,
+            position,
+            published_at=BASE_TIME + step * position,
+            **fields,
+        )
+        for position, title in enumerate(titles, start)
+    ]
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingAdapter(NewsAdapter):
+    """Adapter that counts upstream fetches."""
+
+    def __init__(self, source_id: str, count: int = 3):
+        super().__init__(source_id, source_id.upper())
+        self.calls = 0
+        self.limits = []
+        self.count = count
+
+    async def fetch_news(self, limit: int = 10):
+        self.calls += 1
+        self.limits.append(limit)
+        return [
+            NewsItem(
+                title=f"{self.source_id} {i}",
+                url=f"https://example.com/{self.source_id}/{i}",
+                source=self.source_id,
+                source_name=self.source_name,
+            )
+            for i in range(min(limit, self.count))
+        ]
+
+
+class FailingAdapter(NewsAdapter):
+    """Adapter that always fails and counts its calls."""
+
+    def __init__(self, source_id: str, source_name: Optional[str] = None):
+        super().__init__(source_id, source_name or source_id.upper())
+        self.calls = 0
+
+    async def fetch_news(self, limit: int = 10):
+        self.calls += 1
+        raise RuntimeError("upstream down")
+
+
+@pytest.fixture
+def app_store(monkeypatch):
+    """Give the app an empty source store, ingest log and result caches."""
+    import backend.main as main
+    from backend.services import IngestLog, KeywordIndex
+
+    monkeypatch.setattr(main.source_store, "_snapshots", {})
+    monkeypatch.setattr(main.source_store, "index", KeywordIndex())
+    monkeypatch.setattr(main.source_store, "ingest_log", IngestLog(start=0))
+    main._cache.clear()
+    main._result_snapshots.clear()
+    yield main.source_store
+    main._cache.clear()
+    main._result_snapshots.clear()
@@ -1,9 +1,12 @@
 """Tests for news adapters."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from backend.adapters.base import NewsAdapter
+from backend.adapters.parsing import extract_article_links, parse_front_page
 from backend.adapters.yahoo_adapter import YahooNewsAdapter
 from backend.models import NewsItem
 
@@ -62,7 +65,10 @@ class TestYahooNewsAdapter:
         
         with patch("httpx.AsyncClient") as mock_client:
             mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.headers = {}
             mock_response.text = mock_rss_content
+            mock_response.content = mock_rss_content.encode("utf-8")
             mock_response.raise_for_status = MagicMock()
             
             mock_client.return_value.__aenter__.return_value.get = AsyncMock(
@@ -103,3 +109,142 @@ class TestYahooNewsAdapter:
         assert len(merged) == 2
         assert merged[0].url == item1.url
         assert merged[1].url == item3.url
+
+
+class TestYahooConcurrentFetch:
+    """Tests for Yahoo's concurrent RSS + scrape fetch."""
+
+    @staticmethod
+    def _item(n: int) -> NewsItem:
+        return NewsItem(
+            title=f"Article {n}",
+            url=f"https://news.yahoo.co.jp/articles/{n}",
+            source="yahoo",
+            source_name="Yahoo News",
+        )
+
+    @pytest.mark.asyncio
+    async def test_legs_run_concurrently(self):
+        """Test that each leg starts before the other one finishes."""
+        adapter = YahooNewsAdapter(deadline=1.0)
+        rss_started = asyncio.Event()
+        scrape_started = asyncio.Event()
+
+        async def rss(limit):
+            rss_started.set()
+            # Only completes if the scrape leg runs in the meantime
+            await scrape_started.wait()
+            return [self._item(1)]
+
+        async def scrape(limit):
+            scrape_started.set()
+            await rss_started.wait()
+            return [self._item(2)]
+
+        adapter._fetch_rss = rss
+        adapter._fetch_scrape = scrape
+
+        items = await adapter.fetch_news(limit=10)
+
+        assert len(items) == 2
+        assert items.missing == []
+
+    @pytest.mark.asyncio
+    async def test_missing_leg_is_recorded(self):
+        """Test that a leg missing the deadline is skipped and recorded."""
+        adapter = YahooNewsAdapter(deadline=0.05)
+
+        async def fast_rss(limit):
+            return [self._item(1)]
+
+        async def hanging_scrape(limit):
+            await asyncio.sleep(10)
+
+        adapter._fetch_rss = fast_rss
+        adapter._fetch_scrape = hanging_scrape
+
+        items = await adapter.fetch_news(limit=10)
+
+        assert [i.title for i in items] == ["Article 1"]
+        assert items.missing == ["scrape"]
+        assert items.partial
+
+    @pytest.mark.asyncio
+    async def test_both_legs_failing_raises(self):
+        """Test that an error is raised when no leg produced items."""
+        adapter = YahooNewsAdapter(deadline=0.05)
+
+        async def failing(limit):
+            raise RuntimeError("down")
+
+        adapter._fetch_rss = failing
+        adapter._fetch_scrape = failing
+
+        with pytest.raises(RuntimeError):
+            await adapter.fetch_news(limit=10)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_fetch_cancels_legs(self):
+        """Test that cancelling fetch_news does not leave legs running."""
+        adapter = YahooNewsAdapter(deadline=10)
+        started = asyncio.Event()
+        cancelled = []
+
+        async def hanging(name):
+            try:
+                started.set()
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+
+        adapter._fetch_rss = lambda limit: hanging("rss")
+        adapter._fetch_scrape = lambda limit: hanging("scrape")
+
+        fetch = asyncio.ensure_future(adapter.fetch_news(limit=10))
+        await started.wait()
+        fetch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await fetch
+        await asyncio.sleep(0)
+
+        assert sorted(cancelled) == ["rss", "scrape"]
+
+
+class TestArticleLinkExtractor:
+    """Tests for the Yahoo front page link extractor."""
+
+    PAGE = """<html><head><script>var a = '<a href="/articles/js">x</a>';</script></head>
+<body>
+  <a href="/flash">Breaking</a>
+  <a href="https://news.yahoo.co.jp/articles/one">
+    <span>First</span>
+    <span>  Story  </span>
+  </a>
+  <a href="/articles/one">Duplicate</a>
+  <a href="/articles/empty"><img src="x.jpg"></a>
+  <a href="/articles/two">Second &amp; story</a>
+  <a href="/articles/three">Third</a>
+</body></html>"""
+
+    def test_matches_beautifulsoup(self):
+        """Test that the extractor matches the BeautifulSoup implementation."""
+        base = "https://news.yahoo.co.jp/"
+        expected = parse_front_page(self.PAGE, 10, base, "yahoo", "Yahoo News")
+        actual = extract_article_links(self.PAGE, 10, base, "yahoo", "Yahoo News")
+
+        assert [(i.title, str(i.url)) for i in actual] == [
+            (i.title, str(i.url)) for i in expected
+        ]
+        assert [i.title for i in actual] == ["FirstStory", "Second & story", "Third"]
+
+    def test_stops_at_limit(self):
+        """Test that extraction stops once limit links are found."""
+        items = extract_article_links(
+            self.PAGE, 2, "https://news.yahoo.co.jp/", "yahoo", "Yahoo News"
+        )
+
+        assert [str(i.url) for i in items] == [
+            "https://news.yahoo.co.jp/articles/one",
+            "https://news.yahoo.co.jp/articles/two",
+        ]
@@ -1,11 +1,16 @@
 """Tests for news aggregator service."""
 
+import asyncio
+import random
+
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from backend.models import NewsItem
+from backend.models import NewsItem, NewsRecord
 from backend.services.aggregator import NewsAggregator
+from backend.services.circuit_breaker import CircuitBreaker
 from backend.adapters.base import NewsAdapter
+from conftest import FailingAdapter
 
 
 class MockAdapter(NewsAdapter):
@@ -19,6 +24,21 @@ class MockAdapter(NewsAdapter):
         return self.items[:limit]
 
 
+class HangingAdapter(NewsAdapter):
+    """Adapter whose upstream never answers."""
+
+    def __init__(self, source_id: str):
+        super().__init__(source_id, source_id.upper())
+        self.cancelled = False
+
+    async def fetch_news(self, limit: int = 10):
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
 class TestNewsAggregator:
     """Tests for NewsAggregator service."""
     
@@ -87,6 +107,46 @@ class TestNewsAggregator:
         
         assert len(result) == 2
     
+    @pytest.mark.asyncio
+    async def test_deadline_returns_finished_sources(self, caplog):
+        """Test that a hanging source does not hold back the others."""
+        items = [
+            NewsItem(
+                title="Fast",
+                url="https://example.com/fast",
+                source="fast",
+                source_name="Fast",
+            )
+        ]
+        slow = HangingAdapter("slow")
+        aggregator = NewsAggregator(
+            {"fast": MockAdapter("fast", "Fast", items), "slow": slow},
+            deadline=0.05,
+        )
+
+        result = await aggregator.fetch_and_aggregate(["fast", "slow"])
+
+        assert [item.title for item in result] == ["Fast"]
+        assert result.status == {"fast": "ok", "slow": "timeout"}
+        assert "Timed out fetching from slow" in caplog.messages
+        await asyncio.sleep(0)  # Let the cancellation reach the adapter
+        assert slow.cancelled
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_source(self):
+        """Test that a repeatedly failing source stops being called."""
+        failing = FailingAdapter("down")
+        aggregator = NewsAggregator({"down": failing})
+        aggregator.breakers["down"] = CircuitBreaker(failure_threshold=2)
+
+        first = await aggregator.fetch_from_sources(["down"])
+        await aggregator.fetch_from_sources(["down"])
+        third = await aggregator.fetch_from_sources(["down"])
+
+        assert first.status == {"down": "error"}
+        assert third.status == {"down": "circuit_open"}
+        assert failing.calls == 2
+
     def test_merge_and_sort_by_date(self):
         """Test merging and sorting by published date."""
         items = [
@@ -211,3 +271,107 @@ class TestNewsAggregator:
         unique = aggregator.merge_and_sort(items)
         
         assert len(unique) == 2
+
+
+def make_feed(source, count, rng, undated=0):
+    """Build a feed of records with random, partly equal, dates."""
+    base = datetime(2026, 2, 15)
+    records = [
+        NewsRecord(
+            title=f"{source} {i}",
+            url=f"https://example.com/{source}/{i}",
+            published_at=base + timedelta(minutes=rng.randrange(60)),
+            source=source,
+            source_name=source.upper(),
+        )
+        for i in range(count)
+    ]
+    records += [
+        NewsRecord(
+            title=f"{source} undated {i}",
+            url=f"https://example.com/{source}/undated/{i}",
+            published_at=None,
+            source=source,
+            source_name=source.upper(),
+        )
+        for i in range(undated)
+    ]
+    return records
+
+
+def full_sort(items, sort_by, sort_order):
+    """Reference ordering: stable sort of the whole list."""
+    if sort_by == "source":
+        key = lambda x: x.source  # noqa: E731
+    else:
+        key = lambda x: x.published_at or datetime.min  # noqa: E731
+    return sorted(items, key=key, reverse=(sort_order == "desc"))
+
+
+class TestTopKMerge:
+    """Tests for the heap-based top-k paths."""
+
+    @pytest.mark.parametrize("sort_by", ["published_at", "source"])
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    @pytest.mark.parametrize("limit", [None, 1, 7, 1000])
+    def test_merge_and_sort_matches_full_sort(self, sort_by, sort_order, limit):
+        """Test that heap selection returns the same items as a full sort."""
+        rng = random.Random(1)
+        items = []
+        for source in ("nhk", "google", "yahoo"):
+            items += make_feed(source, 15, rng, undated=2)
+
+        result = NewsAggregator({}).merge_and_sort(items, limit, sort_by, sort_order)
+        assert result == full_sort(items, sort_by, sort_order)[:limit]
+
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    def test_merge_sorted_streams_matches_full_sort(self, sort_order):
+        """Test the k-way merge against a full sort of unique items."""
+        rng = random.Random(2)
+        feeds = [make_feed(f"s{i}", 20, rng, undated=3) for i in range(5)]
+        streams = [full_sort(feed, "published_at", sort_order) for feed in feeds]
+
+        aggregator = NewsAggregator({})
+        result = aggregator.merge_sorted_streams(streams, 25, sort_order)
+
+        everything = [item for feed in feeds for item in feed]
+        assert result == full_sort(everything, "published_at", sort_order)[:25]
+
+    def test_merge_sorted_streams_dedupes_during_merge(self):
+        """Test that the first copy of a URL out of the merge wins."""
+        newer = NewsRecord(
+            title="newer",
+            url="https://example.com/same",
+            published_at=datetime(2026, 2, 15, 12),
+            source="a",
+            source_name="A",
+        )
+        older = NewsRecord(
+            title="older",
+            url="https://example.com/same",
+            published_at=datetime(2026, 2, 15, 9),
+            source="b",
+            source_name="B",
+        )
+
+        result = NewsAggregator({}).merge_sorted_streams([[older], [newer]])
+        assert [item.title for item in result] == ["newer"]
+
+    def test_merge_sorted_streams_stops_at_limit(self):
+        """Test that the merge does not consume more than it needs."""
+        rng = random.Random(3)
+        consumed = []
+
+        def stream(feed):
+            for item in full_sort(feed, "published_at", "desc"):
+                consumed.append(item)
+                yield item
+
+        feeds = [make_feed(f"s{i}", 50, rng) for i in range(4)]
+        result = NewsAggregator({}).merge_sorted_streams(
+            [stream(feed) for feed in feeds], limit=5
+        )
+
+        assert len(result) == 5
+        # Each stream is read at most one item past what was emitted
+        assert len(consumed) <= 5 + len(feeds) + 1
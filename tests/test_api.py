@@ -27,6 +27,7 @@ class TestAPIEndpoints:
         assert "sources" in data
         assert "default" in data
         assert len(data["sources"]) > 0
+        assert all(s["poll_interval_seconds"] > 0 for s in data["sources"])
     
     def test_news_endpoint_default(self):
         """Test news endpoint with default parameters."""
@@ -67,6 +68,18 @@ class TestAPIEndpoints:
         data = response.json()
         assert isinstance(data, list)
     
+    def test_news_endpoint_source_status(self):
+        """Test that each queried source's status is reported."""
+        response = client.get("/api/news?sources=nhk,google&limit=1")
+        assert response.status_code == 200
+        statuses = dict(
+            part.split("=") for part in response.headers["x-source-status"].split(", ")
+        )
+        assert set(statuses) == {"nhk", "google"}
+        assert set(statuses.values()) <= {
+            "ok", "stale", "timeout", "error", "circuit_open", "pending"
+        }
+
     def test_news_endpoint_invalid_limit(self):
         """Test news endpoint with invalid limit."""
         # Limit too high should be clamped
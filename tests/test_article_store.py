@@ -0,0 +1,235 @@
+"""Tests for the persistent article store."""
+
+import asyncio
+import sqlite3
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.main as main
+from backend.models import NewsRecord
+from backend.services import ArticleStore, IngestionScheduler, SourceStore
+from backend.services.article_store import history_key
+from conftest import BASE_TIME, CountingAdapter, make_records
+
+@pytest.fixture
+def article_store(tmp_path):
+    """Open a store in a temporary directory."""
+    store = ArticleStore(tmp_path / "db" / "articles.db")
+    store.open()
+    yield store
+    store.close()
+
+
+class TestArticleStore:
+    """Tests for ArticleStore."""
+
+    def test_open_uses_wal(self, article_store):
+        """Test that the database runs in WAL mode."""
+        conn = sqlite3.connect(article_store.path)
+        try:
+            (mode,) = conn.execute("PRAGMA journal_mode").fetchone()
+        finally:
+            conn.close()
+        assert mode == "wal"
+
+    def test_load_snapshots_returns_last_fetch(self, article_store):
+        """Test that only the latest snapshot is restored, in feed order."""
+        first = make_records("nhk", ["古い記事", "続報"], summary="要約")
+        article_store.save("nhk", first, fetched_at=1000.0)
+        second = [first[1], *make_records("nhk", ["新しい記事"], start=2, summary="要約")]
+        article_store.save("nhk", second, fetched_at=2000.0)
+
+        snapshots = article_store.load_snapshots()
+
+        fetched_at, records = snapshots["nhk"]
+        assert fetched_at == 2000.0
+        assert [r.to_dict() for r in records] == [r.to_dict() for r in second]
+
+    def test_touch_moves_fetch_time(self, article_store):
+        """Test that an unchanged refetch keeps the snapshot restorable."""
+        records = make_records("nhk", ["一", "二"])
+        article_store.save("nhk", records, fetched_at=1000.0)
+
+        article_store.touch("nhk", 1000.0, 2000.0)
+
+        fetched_at, restored = article_store.load_snapshots()["nhk"]
+        assert fetched_at == 2000.0
+        assert [r.title for r in restored] == ["一", "二"]
+
+    def test_upsert_updates_existing_articles(self, article_store):
+        """Test that a refetched URL updates the row instead of adding one."""
+        (record,) = make_records("nhk", ["見出し"])
+        article_store.save("nhk", [record], fetched_at=1000.0)
+        edited = NewsRecord(
+            "見出し（更新）", record.url, record.published_at, "nhk", "NHK"
+        )
+        article_store.save("nhk", [edited], fetched_at=2000.0)
+
+        history = article_store.history(["nhk"], limit=10)
+        assert [r.title for r in history] == ["見出し（更新）"]
+
+    def test_history_keeps_articles_dropped_from_feeds(self, article_store):
+        """Test history queries beyond the live snapshot."""
+        article_store.save(
+            "nhk", make_records("nhk", ["一", "二", "三"]), fetched_at=1000.0
+        )
+        article_store.save(
+            "nhk", make_records("nhk", ["四"], start=3), fetched_at=2000.0
+        )
+        article_store.save(
+            "google", make_records("google", ["ｇ一"]), fetched_at=2000.0
+        )
+
+        titles = [r.title for r in article_store.history(["nhk"], limit=10)]
+        assert titles == ["四", "三", "二", "一"]
+
+        before = BASE_TIME + timedelta(minutes=2)
+        titles = [r.title for r in article_store.history(["nhk"], 2, before)]
+        assert titles == ["二", "一"]
+
+        titles = [
+            r.title for r in article_store.history(["nhk", "google"], 10, keyword="G一")
+        ]
+        assert titles == ["ｇ一"]
+        assert article_store.history([], limit=10) == []
+
+    def test_history_pages_through_equal_timestamps(self, article_store):
+        """Test that articles sharing a page boundary's timestamp are kept."""
+        records = make_records("nhk", ["一", "二", "三"])
+        same_time = [
+            NewsRecord(r.title, r.url, BASE_TIME, r.source, r.source_name)
+            for r in records
+        ]
+        undated = NewsRecord("日付なし", "https://example.com/nhk/x", None, "nhk", "NHK")
+        article_store.save("nhk", [*same_time, undated], fetched_at=1000.0)
+
+        titles = []
+        after = None
+        while True:
+            page = article_store.history(["nhk"], 2, after=after)
+            if not page:
+                break
+            titles.extend(r.title for r in page)
+            after = history_key(page[-1])
+
+        assert titles == ["一", "二", "三", "日付なし"]
+
+    def test_retention(self, tmp_path):
+        """Test that old and excess articles are pruned on save."""
+        store = ArticleStore(tmp_path / "articles.db", retention_days=1, max_articles=3)
+        store.open()
+        try:
+            store.save("nhk", make_records("nhk", ["古い"]), fetched_at=0.0)
+            store.save(
+                "yahoo",
+                make_records("yahoo", ["一", "二", "三", "四"]),
+                fetched_at=2 * 86400.0,
+            )
+
+            titles = {r.title for r in store.history(["nhk", "yahoo"], limit=10)}
+        finally:
+            store.close()
+        assert titles == {"二", "三", "四"}
+
+
+class TestRestore:
+    """Tests for restoring snapshots on startup."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_persists_and_restart_restores(self, tmp_path):
+        """Test that a new store serves the previous process's snapshot."""
+        path = tmp_path / "articles.db"
+        first = ArticleStore(path)
+        first.open()
+        store = SourceStore(
+            {"a": CountingAdapter("a")}, ttl_seconds={"a": 60}, article_store=first
+        )
+        await store.refresh("a")
+        first.close()
+
+        second = ArticleStore(path)
+        second.open()
+        try:
+            adapter = CountingAdapter("a")
+            restarted = SourceStore(
+                {"a": adapter}, ttl_seconds={"a": 60}, article_store=second
+            )
+            assert await restarted.restore() == ["a"]
+            items = await restarted.get_items(["a"])
+        finally:
+            second.close()
+
+        assert adapter.calls == 0
+        assert [i.title for i in items] == ["a 0", "a 1", "a 2"]
+        assert restarted.get("a").fetched_at == store.get("a").fetched_at
+
+    @pytest.mark.asyncio
+    async def test_scheduler_does_not_wait_for_restored_sources(self, article_store):
+        """Test that stale restored sources refresh in the background."""
+        article_store.save("a", make_records("a", ["保存済み"]), fetched_at=1000.0)
+        adapter = CountingAdapter("a")
+        store = SourceStore(
+            {"a": adapter}, ttl_seconds={"a": 60}, article_store=article_store
+        )
+        await store.restore()
+        scheduler = IngestionScheduler(store)
+
+        await scheduler.start()
+        try:
+            assert adapter.calls == 0
+            assert [i.title for i in store.get("a").items] == ["保存済み"]
+            await asyncio.sleep(0.05)
+            assert adapter.calls == 1
+            assert store.is_fresh("a")
+        finally:
+            await scheduler.stop()
+
+
+class TestHistoryEndpoint:
+    """Tests for /api/news/history."""
+
+    def test_history(self, monkeypatch, article_store):
+        """Test that the endpoint reads the article store."""
+        monkeypatch.setattr(main, "article_store", article_store)
+        article_store.save("nhk", make_records("nhk", ["一", "二"]), fetched_at=1000.0)
+        client = TestClient(main.app)
+
+        response = client.get("/api/news/history", params={"sources": "nhk"})
+        assert response.status_code == 200
+        assert [item["title"] for item in response.json()] == ["二", "一"]
+
+        response = client.get(
+            "/api/news/history",
+            params={"before": response.json()[0]["published_at"]},
+        )
+        assert [item["title"] for item in response.json()] == ["一"]
+
+    def test_history_cursor(self, monkeypatch, article_store):
+        """Test following X-Next-Cursor through every stored article."""
+        monkeypatch.setattr(main, "article_store", article_store)
+        article_store.save(
+            "nhk", make_records("nhk", ["一", "二", "三"]), fetched_at=1000.0
+        )
+        client = TestClient(main.app)
+
+        response = client.get("/api/news/history", params={"limit": 2})
+        assert [item["title"] for item in response.json()] == ["三", "二"]
+
+        cursor = response.headers["X-Next-Cursor"]
+        response = client.get(
+            "/api/news/history", params={"limit": 2, "cursor": cursor}
+        )
+        assert [item["title"] for item in response.json()] == ["一"]
+        assert "X-Next-Cursor" not in response.headers
+
+        response = client.get("/api/news/history", params={"cursor": "!"})
+        assert response.status_code == 400
+
+    def test_history_disabled(self, monkeypatch, tmp_path):
+        """Test that a closed store answers 503."""
+        monkeypatch.setattr(main, "article_store", ArticleStore(tmp_path / "x.db"))
+        client = TestClient(main.app)
+
+        assert client.get("/api/news/history").status_code == 503
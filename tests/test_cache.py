@@ -0,0 +1,69 @@
+"""Tests for the bounded TTL/LRU cache."""
+
+from backend.services.cache import TTLCache
+from conftest import FakeClock
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups update hit and miss counters."""
+        cache = TTLCache(max_entries=10, max_bytes=1000)
+        cache.set("a", "value")
+
+        assert cache.get("a").value == "value"
+        assert cache.get("b") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_lru_eviction_by_entry_count(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = TTLCache(max_entries=2, max_bytes=1000)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.evictions == 1
+
+    def test_eviction_by_byte_budget(self):
+        """Test that the byte budget is enforced."""
+        cache = TTLCache(max_entries=10, max_bytes=10, size_of=len)
+        cache.set("a", "xxxx")
+        cache.set("b", "yyyy")
+        cache.set("c", "zzzz")
+
+        assert len(cache) == 2
+        assert cache.total_bytes == 8
+        assert "a" not in cache
+
+        cache.set("huge", "x" * 11)
+        assert "huge" not in cache
+
+    def test_ttl_stale_then_expired(self):
+        """Test that entries turn stale after TTL and expire later."""
+        clock = FakeClock()
+        cache = TTLCache(ttl_seconds=10, stale_seconds=5, clock=clock)
+        cache.set("a", 1)
+
+        clock.now += 11
+        entry = cache.get("a")
+        assert entry.stale
+        assert cache.stale_hits == 1
+
+        clock.now += 5
+        assert cache.get("a") is None
+        assert cache.expirations == 1
+
+    def test_invalid_value_is_stale(self):
+        """Test that values failing the validity check are stale."""
+        version = {"current": 1}
+        cache = TTLCache(is_valid=lambda v: v == version["current"])
+        cache.set("a", 1)
+        assert not cache.get("a").stale
+
+        version["current"] = 2
+        assert cache.get("a").stale
@@ -0,0 +1,83 @@
+"""Tests for per-source circuit breakers."""
+
+import logging
+
+from backend.services.circuit_breaker import CircuitBreaker
+from conftest import FakeClock
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        """Test that only consecutive failures count."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_a_single_probe(self):
+        """Test that one probe is let through after the reset time."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 59
+        assert not breaker.allow()
+
+        clock.now = 60
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self):
+        """Test that a failing probe opens the circuit for another period."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=5, reset_seconds=60, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+
+        clock.now = 60
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now = 119
+        assert not breaker.allow()
+        clock.now = 120
+        assert breaker.allow()
+
+    def test_transitions_are_logged(self, caplog):
+        """Test that opening and closing the circuit is logged."""
+        breaker = CircuitBreaker(failure_threshold=2, name="nhk")
+
+        with caplog.at_level(logging.WARNING):
+            breaker.record_failure()
+            breaker.record_failure()
+            breaker.record_failure()
+            breaker.record_success()
+
+        assert [r.getMessage() for r in caplog.records] == [
+            "Circuit for nhk opened after 2 consecutive failures",
+            "Circuit for nhk closed again",
+        ]
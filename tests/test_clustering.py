@@ -0,0 +1,151 @@
+"""Tests for near-duplicate story clustering."""
+
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.main as main
+from backend.services import StoryCluster, cluster_stories
+from backend.services.clustering import (
+    NearDuplicateIndex,
+    jaccard,
+    normalize_title,
+    title_signature,
+)
+from conftest import make_record
+
+
+class TestSignatures:
+    """Tests for title normalization and MinHash signatures."""
+
+    def test_normalize_title(self):
+        """Test stripping publisher suffixes, punctuation and width."""
+        assert normalize_title("東京で大雪、交通に乱れ - 日本経済新聞") == "東京で大雪交通に乱れ"
+        assert normalize_title("ＮＨＫ　「速報」") == "nhk速報"
+
+    def test_signature_is_stable(self):
+        """Test that equal normalized titles get equal signatures."""
+        first = title_signature("東京で大雪、交通に乱れ")
+        second = title_signature("東京で大雪 交通に乱れ - 日本経済新聞")
+        assert first == second
+
+    def test_signature_estimates_jaccard(self):
+        """Test that signature agreement tracks bigram similarity."""
+        similar = ("日経平均株価が一時500円超値上がり", "日経平均 一時500円超値上がり")
+        different = ("東京で大雪、交通に乱れ", "大阪で震度3の地震")
+
+        def agreement(a, b):
+            (_, sa), (_, sb) = title_signature(a), title_signature(b)
+            return sum(x == y for x, y in zip(sa, sb)) / len(sa)
+
+        assert agreement(*similar) > 0.5
+        assert agreement(*different) < 0.2
+
+    def test_index_compares_only_bucket_neighbours(self):
+        """Test that unrelated titles are not compared."""
+        rng = random.Random(0)
+        index = NearDuplicateIndex(threshold=0.5)
+        for i in range(200):
+            title = "".join(chr(rng.randrange(0x4E00, 0x9FA0)) for _ in range(15))
+            grams, signature = title_signature(title)
+            index.add(StoryCluster(make_record("a", "x", i), grams, signature))
+
+        index.comparisons = 0
+        grams, signature = title_signature("東京で大雪、交通に乱れ")
+        assert list(index.candidates(grams, signature)) == []
+        assert index.comparisons < 20
+
+
+class TestClusterStories:
+    """Tests for cluster_stories."""
+
+    def test_collapses_cross_source_duplicates(self):
+        """Test that one story from three sources becomes one item."""
+        nhk = make_record("nhk", "東京で大雪 交通に乱れ", 0)
+        google = make_record("google", "東京で大雪、交通に乱れ - 日本経済新聞", 1)
+        yahoo = make_record("yahoo", "東京都心で大雪、交通に乱れ", 2)
+        other = make_record("yahoo", "大阪で震度3の地震", 3)
+
+        result = cluster_stories([nhk, google, other, yahoo])
+
+        assert len(result) == 2
+        cluster, single = result
+        assert isinstance(cluster, StoryCluster)
+        assert cluster.record is nhk
+        assert cluster.alternates == [google, yahoo]
+        assert single is other
+
+    def test_same_source_is_not_merged(self):
+        """Test that similar headlines from one source stay separate."""
+        first = make_record("nhk", "東京で大雪 交通に乱れ", 0)
+        update = make_record("nhk", "東京で大雪 交通に乱れ続く", 1)
+
+        assert cluster_stories([first, update]) == [first, update]
+
+    def test_threshold(self):
+        """Test that the similarity threshold controls merging."""
+        a = make_record("nhk", "首相が記者会見 経済対策を表明", 0)
+        b = make_record("yahoo", "首相が会見 経済対策を表明へ", 1)
+        similarity = jaccard(
+            title_signature(a.title)[0], title_signature(b.title)[0]
+        )
+
+        assert len(cluster_stories([a, b], threshold=similarity)) == 1
+        assert len(cluster_stories([a, b], threshold=similarity + 0.01)) == 2
+
+    def test_to_dict(self):
+        """Test the API shape of a cluster."""
+        nhk = make_record("nhk", "東京で大雪 交通に乱れ", 0)
+        google = make_record("google", "東京で大雪、交通に乱れ - 日経", 1)
+        (cluster,) = cluster_stories([nhk, google])
+
+        data = cluster.to_dict()
+        assert data["url"] == nhk.url
+        assert data["alternates"] == [
+            {
+                "title": google.title,
+                "url": google.url,
+                "source": "google",
+                "source_name": "GOOGLE",
+            }
+        ]
+        # The record's own memoized dict is left untouched
+        assert "alternates" not in nhk.to_dict()
+
+
+class TestNewsClustering:
+    """Tests for ?cluster= on /api/news."""
+
+    @pytest.fixture(autouse=True)
+    def store(self, app_store):
+        """Serve an isolated store with the same story from two sources."""
+        app_store.publish("nhk", [make_record("nhk", "東京で大雪 交通に乱れ", 1)])
+        app_store.publish(
+            "google", [make_record("google", "東京で大雪、交通に乱れ - 日経", 0)]
+        )
+
+    def test_cluster_toggle(self):
+        """Test that clustering only applies when requested."""
+        client = TestClient(main.app)
+
+        plain = client.get("/api/news", params={"sources": "nhk,google"}).json()
+        clustered = client.get(
+            "/api/news", params={"sources": "nhk,google", "cluster": "true"}
+        ).json()
+
+        assert len(plain) == 2
+        assert len(clustered) == 1
+        assert clustered[0]["source"] == "nhk"
+        assert [alt["source"] for alt in clustered[0]["alternates"]] == ["google"]
+
+    def test_clusters_count_toward_cache_budget(self):
+        """Test that cached cluster results are sized with their clusters."""
+        client = TestClient(main.app)
+        client.get("/api/news", params={"sources": "nhk,google"})
+        plain = main._cache.total_bytes
+        main._cache.clear()
+
+        client.get("/api/news", params={"sources": "nhk,google", "cluster": "true"})
+
+        assert main._cache.total_bytes > plain + main._CLUSTER_OVERHEAD
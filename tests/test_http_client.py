@@ -0,0 +1,168 @@
+"""Tests for the shared HTTP client pool."""
+
+import httpx
+import pytest
+
+from backend.adapters.nhk_adapter import NHKNewsAdapter
+from backend.config import settings
+from backend.http_client import HTTPClientPool, freshness_hint
+
+
+RSS_BODY = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <item>
+      <title>Pooled Article</title>
+      <link>https://www3.nhk.or.jp/news/html/pooled.html</link>
+    </item>
+  </channel>
+</rss>"""
+
+
+class TestHTTPClientPool:
+    """Tests for HTTPClientPool."""
+
+    @pytest.mark.asyncio
+    async def test_get_uses_shared_client(self):
+        """Test that requests go through the injected transport."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, text="ok")
+
+        pool = HTTPClientPool(transport=httpx.MockTransport(handler))
+        try:
+            response = await pool.get("https://example.com/feed")
+        finally:
+            await pool.aclose()
+
+        assert response.text == "ok"
+        assert len(requests) == 1
+        assert "User-Agent" in requests[0].headers
+
+    @pytest.mark.asyncio
+    async def test_warm_up_ignores_failures(self):
+        """Test that warm-up never raises on upstream errors."""
+        hosts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            hosts.append(request.url.host)
+            raise httpx.ConnectError("unreachable", request=request)
+
+        pool = HTTPClientPool(transport=httpx.MockTransport(handler))
+        try:
+            await pool.warm_up(
+                ["https://a.example.com/rss", "https://a.example.com/x", "https://b.example.com/"]
+            )
+        finally:
+            await pool.aclose()
+
+        assert sorted(hosts) == ["a.example.com", "b.example.com"]
+
+    @pytest.mark.asyncio
+    async def test_adapter_uses_injected_pool(self):
+        """Test that adapters fetch through an injected pool."""
+        pool = HTTPClientPool(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, text=RSS_BODY))
+        )
+        adapter = NHKNewsAdapter()
+        adapter.http_pool = pool
+        try:
+            items = await adapter.fetch_news(limit=5)
+        finally:
+            await pool.aclose()
+
+        assert len(items) == 1
+        assert items[0].title == "Pooled Article"
+
+
+class TestConditionalGet:
+    """Tests for conditional GET and parse short-circuiting."""
+
+    @pytest.fixture(autouse=True)
+    def buffered_parsing(self, monkeypatch):
+        """Exercise the buffered path that keeps the body for re-parsing."""
+        monkeypatch.setattr(settings, "STREAMING_PARSE_ENABLED", False)
+
+    @staticmethod
+    def _adapter(handler) -> NHKNewsAdapter:
+        adapter = NHKNewsAdapter()
+        adapter.http_pool = HTTPClientPool(transport=httpx.MockTransport(handler))
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_items(self):
+        """Test that a 304 returns the previous items without parsing."""
+        seen_headers = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(request.headers)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=RSS_BODY, headers={"ETag": '"v1"'})
+
+        adapter = self._adapter(handler)
+        try:
+            first = await adapter.fetch_news(limit=5)
+            second = await adapter.fetch_news(limit=5)
+        finally:
+            await adapter.http_pool.aclose()
+
+        assert seen_headers[0].get("Accept-Encoding") == "gzip"
+        assert seen_headers[1].get("If-None-Match") == '"v1"'
+        assert [i.title for i in second] == [i.title for i in first]
+        assert adapter.validators.parsed == 1
+        assert adapter.validators.not_modified == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_body_skips_parse(self):
+        """Test that an unchanged body hash skips parsing."""
+        adapter = self._adapter(lambda r: httpx.Response(200, text=RSS_BODY))
+        try:
+            await adapter.fetch_news(limit=5)
+            items = await adapter.fetch_news(limit=5)
+        finally:
+            await adapter.http_pool.aclose()
+
+        assert len(items) == 1
+        assert adapter.validators.parsed == 1
+        assert adapter.validators.unchanged == 1
+
+
+class TestFreshnessHint:
+    """Tests for upstream freshness hints."""
+
+    def test_cache_control(self):
+        """Test max-age parsing, preferring s-maxage."""
+        assert freshness_hint({"Cache-Control": "public, max-age=120"}) == 120
+        assert freshness_hint({"Cache-Control": "max-age=60, s-maxage=300"}) == 300
+        assert freshness_hint({"Cache-Control": "no-cache, max-age=60"}) is None
+        assert freshness_hint({"Cache-Control": "max-age=0"}) is None
+        assert freshness_hint({}) is None
+
+    def test_rss_ttl(self):
+        """Test that an RSS <ttl> in minutes is used, taking the longer hint."""
+        body = b"<rss><channel><ttl>15</ttl><item></item></channel></rss>"
+        assert freshness_hint({}, body) == 900
+        assert freshness_hint({"Cache-Control": "max-age=1800"}, body) == 1800
+
+    @pytest.mark.asyncio
+    async def test_adapter_records_hint(self):
+        """Test that adapters expose the hint of their last full response."""
+        body = RSS_BODY.replace("<channel>", "<channel><ttl>5</ttl>")
+        pool = HTTPClientPool(
+            transport=httpx.MockTransport(
+                lambda r: httpx.Response(
+                    200, text=body, headers={"Cache-Control": "max-age=60"}
+                )
+            )
+        )
+        adapter = NHKNewsAdapter()
+        adapter.http_pool = pool
+        try:
+            await adapter.fetch_news(limit=5)
+        finally:
+            await pool.aclose()
+
+        assert adapter.refresh_hint == 300
@@ -0,0 +1,93 @@
+"""Tests for the ingest log."""
+
+import asyncio
+
+import pytest
+
+from backend.services import IngestLog
+from conftest import make_record
+
+
+class TestIngestLog:
+    """Tests for IngestLog."""
+
+    def test_record_numbers_only_new_items(self):
+        """Test that refetched articles keep their place in the log."""
+        log = IngestLog(start=0)
+        first = [make_record("a", i=1, minutes=5), make_record("a", i=2, minutes=1)]
+
+        entries = log.record("a", first)
+        # Oldest first within one fetch
+        assert [(seq, r.title) for seq, r in entries] == [(1, "a 2"), (2, "a 1")]
+
+        assert log.record("a", [*first, make_record("a", i=3)]) == [
+            (3, log.since(2)[0][1])
+        ]
+        assert log.sequence == 3
+
+    def test_same_url_from_another_source_is_new(self):
+        """Test that seen URLs are tracked per source."""
+        log = IngestLog(start=0)
+        log.record("a", [make_record("a", i=1)])
+
+        assert len(log.record("b", [make_record("b", i=1)])) == 1
+
+    def test_since(self):
+        """Test resuming from a sequence number."""
+        log = IngestLog(backlog_size=3, start=0)
+        log.record("a", [make_record("a", i=i, minutes=i) for i in range(5)])
+
+        assert [seq for seq, _ in log.since(2)] == [3, 4, 5]
+        assert log.since(5) == []
+        # Entries 1 and 2 were dropped from the backlog
+        assert log.since(1) is None
+        # From a previous process with a longer log
+        assert log.since(9) is None
+
+    def test_seen_is_bounded(self):
+        """Test that the oldest seen URLs are forgotten."""
+        log = IngestLog(seen_max=2, start=0)
+        log.record("a", [make_record("a", i=i) for i in range(3)])
+
+        assert len(log.record("a", [make_record("a", i=0)])) == 1
+
+    @pytest.mark.asyncio
+    async def test_wait(self):
+        """Test that waiters wake up when entries are recorded."""
+        log = IngestLog(start=0)
+
+        assert not await log.wait(0, timeout=0.01)
+
+        waiter = asyncio.create_task(log.wait(0, timeout=1))
+        await asyncio.sleep(0)
+        log.record("a", [make_record("a", i=1)])
+
+        assert await waiter
+        assert await log.wait(0)
+
+    def test_sequence_at(self):
+        """Test mapping ingest times to sequence numbers."""
+        log = IngestLog(backlog_size=3, start=0)
+
+        assert log.sequence_at(100.0) == 0
+
+        log.record("a", [make_record("a", i=1)], now=100.0)
+        log.record("a", [make_record("a", i=i) for i in (2, 3)], now=200.0)
+
+        assert log.sequence_at(50.0) == 0
+        assert log.sequence_at(100.0) == 1
+        assert log.sequence_at(150.0) == 1
+        assert log.sequence_at(300.0) == 3
+
+        log.record("a", [make_record("a", i=4)], now=300.0)
+
+        # Entry 1 was dropped, so earlier times cannot be served
+        assert log.since(log.sequence_at(50.0)) is None
+        assert [seq for seq, _ in log.since(log.sequence_at(250.0))] == [4]
+
+    def test_sequence_continues_across_restarts(self):
+        """Test that a new log numbers after an earlier process's log."""
+        earlier = IngestLog()
+        earlier.record("a", [make_record("a", i=i) for i in range(3)])
+
+        assert IngestLog().since(earlier.sequence) is None
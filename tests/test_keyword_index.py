@@ -0,0 +1,122 @@
+"""Tests for the keyword index."""
+
+import random
+
+from backend.services import NewsAggregator
+from backend.services.keyword_index import KeywordIndex
+from conftest import make_record
+
+
+class TestKeywordIndex:
+    """Tests for KeywordIndex."""
+
+    def test_search_title_and_summary(self):
+        """Test that keywords match Japanese titles and summaries."""
+        index = KeywordIndex()
+        records = [
+            make_record("nhk", "東京で大雪 交通に影響", 0),
+            make_record("nhk", "株価が上昇", 1, summary="東京市場の取引"),
+            make_record("nhk", "大阪で地震", 2),
+        ]
+        index.replace_source("nhk", records)
+
+        assert index.search("東京") == records[:2]
+        assert index.search("大雪") == [records[0]]
+        assert index.search("雪") == [records[0]]
+        assert index.search("名古屋") == []
+        assert index.search("") == []
+
+    def test_search_is_case_and_width_insensitive(self):
+        """Test NFKC and case folding of both text and keyword."""
+        index = KeywordIndex()
+        record = make_record("nhk", "ＮＨＫ ＡＩ特集", 0)
+        index.replace_source("nhk", [record])
+
+        assert index.search("nhk") == [record]
+        assert index.search("Ai特") == [record]
+
+    def test_no_match_across_fields(self):
+        """Test that a keyword never spans the title and the summary."""
+        index = KeywordIndex()
+        index.replace_source("nhk", [make_record("nhk", "東京", 0, summary="大阪")])
+
+        assert index.search("京大") == []
+
+    def test_bigrams_must_be_adjacent(self):
+        """Test that documents containing every bigram apart do not match."""
+        index = KeywordIndex()
+        index.replace_source("nhk", [make_record("nhk", "東京 京都", 0)])
+
+        assert index.search("東京都") == []
+
+    def test_search_restricted_to_sources(self):
+        """Test filtering results by source."""
+        index = KeywordIndex()
+        index.replace_source("nhk", [make_record("nhk", "選挙速報", 0)])
+        index.replace_source("yahoo", [make_record("yahoo", "選挙の結果", 0)])
+
+        assert [r.source for r in index.search("選挙")] == ["nhk", "yahoo"]
+        assert [r.source for r in index.search("選挙", ["yahoo"])] == ["yahoo"]
+
+    def test_replace_source_is_incremental(self):
+        """Test that republishing a source adds, keeps and drops articles."""
+        index = KeywordIndex()
+        index.replace_source(
+            "nhk",
+            [make_record("nhk", "台風が接近", 0), make_record("nhk", "台風一過", 1)],
+        )
+        kept = make_record("nhk", "台風一過", 1)
+        added = make_record("nhk", "台風情報", 2)
+        index.replace_source("nhk", [kept, added])
+
+        assert len(index) == 2
+        # The kept article now points at the record from the new snapshot
+        assert index.search("台風") == [kept, added]
+
+    def test_changed_article_is_reindexed(self):
+        """Test that an article whose text changed is searchable by the new text."""
+        index = KeywordIndex()
+        index.replace_source("nhk", [make_record("nhk", "速報 地震", 0)])
+        index.replace_source("nhk", [make_record("nhk", "続報 津波", 0)])
+
+        assert index.search("地震") == []
+        assert len(index.search("津波")) == 1
+
+    def test_compaction_keeps_results(self, monkeypatch):
+        """Test that dropping dead postings does not change results."""
+        monkeypatch.setattr("backend.services.keyword_index._COMPACT_MIN_DEAD", 1)
+        index = KeywordIndex()
+        for round_ in range(5):
+            index.replace_source(
+                "nhk",
+                [make_record("nhk", f"ニュース{i}", round_ * 10 + i) for i in range(3)],
+            )
+
+        assert len(index.search("ニュース")) == 3
+        assert all(
+            doc_id in index._records
+            for posting in index._postings.values()
+            for doc_id in posting
+        )
+
+    def test_matches_linear_scan(self):
+        """Test that the index agrees with NewsAggregator.filter_by_keyword."""
+        rng = random.Random(0)
+        alphabet = "東京大阪都市雪雨株価上昇下落選挙結果ＡＢab "
+        records = [
+            make_record(
+                "nhk",
+                "".join(rng.choice(alphabet) for _ in range(12)),
+                i,
+                summary="".join(rng.choice(alphabet) for _ in range(20)),
+            )
+            for i in range(300)
+        ]
+        index = KeywordIndex()
+        index.replace_source("nhk", records)
+        aggregator = NewsAggregator({})
+
+        for keyword in ["東京", "雪", "株価上", "ab", "Ａb", "京大阪", "選挙 結"]:
+            expected = aggregator.filter_by_keyword(records, keyword)
+            assert index.search(keyword) == expected, keyword
+
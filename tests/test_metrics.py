@@ -0,0 +1,130 @@
+"""Tests for the metrics registry and /metrics."""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import metrics
+from backend.adapters.google_adapter import GoogleNewsAdapter
+from backend.http_client import HTTPClientPool
+from backend.main import app
+from backend.services.source_store import SourceStore
+from conftest import FailingAdapter
+
+
+client = TestClient(app)
+
+FEED = (
+    '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+    "<title>Feed</title><item><title>Article</title>"
+    "<link>https://example.com/1</link></item></channel></rss>"
+).encode("utf-8")
+
+
+class TestMetrics:
+    """Tests for the metric types."""
+
+    def test_counter(self):
+        """Test that counters render one sample per label set."""
+        counter = metrics.Counter("requests_total", "Requests.", ["code"])
+        counter.inc(code="200")
+        counter.inc(2, code="200")
+        counter.inc(code='5"0\\0')
+
+        assert counter.value(code="200") == 3
+        assert counter.render() == [
+            "# HELP requests_total Requests.",
+            "# TYPE requests_total counter",
+            'requests_total{code="200"} 3.0',
+            'requests_total{code="5\\"0\\\\0"} 1.0',
+        ]
+
+    def test_histogram(self):
+        """Test that histogram buckets are cumulative."""
+        histogram = metrics.Histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+
+        assert histogram.render()[2:] == [
+            'latency_seconds_bucket{le="0.1"} 2.0',
+            'latency_seconds_bucket{le="1.0"} 3.0',
+            'latency_seconds_bucket{le="+Inf"} 4.0',
+            "latency_seconds_sum 3.65",
+            "latency_seconds_count 4.0",
+        ]
+
+    def test_histogram_time(self):
+        """Test that timed blocks are observed even when they raise."""
+        histogram = metrics.Histogram("stage_seconds", "Stage.", ["stage"])
+
+        with pytest.raises(ValueError):
+            with histogram.time(stage="parse"):
+                raise ValueError
+
+        assert histogram.count(stage="parse") == 1
+
+    def test_callback_metric(self):
+        """Test that callback metrics are read at render time."""
+        values = {("a",): 1.0}
+        registry = metrics.Registry()
+        registry.register(
+            metrics.CallbackMetric("size", "Size.", "gauge", ["name"], lambda: values)
+        )
+        values[("a",)] = 2.0
+
+        assert 'size{name="a"} 2.0' in registry.render()
+
+
+class TestInstrumentation:
+    """Tests for the recorded application metrics."""
+
+    @pytest.mark.asyncio
+    async def test_upstream_request_is_recorded(self):
+        """Test that a fetch records latency, status, bytes and parse time."""
+        source = "google"
+        responses = metrics.UPSTREAM_RESPONSES.value(source=source, code="200")
+        downloaded = metrics.UPSTREAM_BYTES.value(source=source)
+        requests = metrics.UPSTREAM_REQUEST_SECONDS.count(source=source)
+        parses = metrics.PARSE_SECONDS.count(source=source)
+
+        async def body():
+            # Streamed, so the bytes pass through the transport
+            yield FEED
+
+        adapter = GoogleNewsAdapter()
+        adapter.http_pool = HTTPClientPool(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, content=body()))
+        )
+        try:
+            await adapter.fetch_news(limit=5)
+        finally:
+            await adapter.http_pool.aclose()
+
+        assert metrics.UPSTREAM_RESPONSES.value(source=source, code="200") == (
+            responses + 1
+        )
+        assert metrics.UPSTREAM_BYTES.value(source=source) == downloaded + len(FEED)
+        assert metrics.UPSTREAM_REQUEST_SECONDS.count(source=source) == requests + 1
+        assert metrics.PARSE_SECONDS.count(source=source) == parses + 1
+
+    @pytest.mark.asyncio
+    async def test_source_fetch_status_is_counted(self):
+        """Test that failed refreshes are counted by status."""
+        store = SourceStore({"broken": FailingAdapter("broken", "Broken")})
+        errors = metrics.SOURCE_FETCHES.value(source="broken", status="error")
+
+        await store.refresh("broken")
+
+        assert metrics.SOURCE_FETCHES.value(source="broken", status="error") == (
+            errors + 1
+        )
+
+    def test_metrics_endpoint(self):
+        """Test that /metrics serves the text format."""
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE news_cache_lookups_total counter" in response.text
+        assert 'news_cache_lookup_ratio{result="hit"}' in response.text
+        assert "# TYPE news_upstream_request_seconds histogram" in response.text
@@ -1,10 +1,18 @@
 """Tests for data models."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pydantic import ValidationError
 
-from backend.models import NewsItem
+from backend.models import (
+    NewsItem,
+    NewsRecord,
+    drop_invalid,
+    is_http_url,
+    published_key,
+    timestamp_of,
+    validate_records,
+)
 
 
 def test_news_item_valid():
@@ -59,3 +67,131 @@ def test_news_item_missing_required():
             title="Missing Source",
             url="https://example.com",
         )
+
+
+def test_news_record_to_dict():
+    """Test that a NewsRecord produces the API dictionary once."""
+    record = NewsRecord(
+        title="Record",
+        url="https://example.com/record",
+        published_at=datetime(2026, 2, 15, 12, 0, 0),
+        source="test",
+        source_name="Test Source",
+    )
+
+    data = record.to_dict()
+    assert data == {
+        "title": "Record",
+        "url": "https://example.com/record",
+        "published_at": "2026-02-15T12:00:00",
+        "source": "test",
+        "source_name": "Test Source",
+        "summary": None,
+    }
+    assert record.to_dict() is data
+
+
+def test_news_record_matches_news_item_dict():
+    """Test that a record converted from a NewsItem keeps the API shape."""
+    item = NewsItem(
+        title="Same",
+        url="https://example.com/same",
+        published_at=datetime(2026, 2, 15, 12, 0, 0),
+        source="test",
+        source_name="Test Source",
+        summary="Summary",
+    )
+
+    record = NewsRecord.from_news_item(item)
+    assert record.to_dict() == item.to_dict()
+    assert record.to_news_item() == item
+
+
+def test_news_record_validation_is_explicit():
+    """Test that invalid records are only rejected when validated."""
+    record = NewsRecord(
+        title="Invalid URL",
+        url="not-a-valid-url",
+        published_at=None,
+        source="test",
+        source_name="Test Source",
+    )
+
+    with pytest.raises(ValidationError):
+        record.to_news_item()
+    with pytest.raises(ValidationError):
+        validate_records([record])
+
+
+def test_validate_records():
+    """Test validating several records in one call."""
+    records = [
+        NewsRecord(
+            title=f"Record {i}",
+            url=f"https://example.com/{i}",
+            published_at=None,
+            source="test",
+            source_name="Test Source",
+        )
+        for i in range(3)
+    ]
+
+    items = validate_records(records)
+    assert [str(item.url) for item in items] == [r.url for r in records]
+
+
+def test_drop_invalid():
+    """Test that invalid records are dropped and the rest kept in order."""
+    records = [
+        NewsRecord(
+            title=f"Record {i}",
+            url=url,
+            published_at=None,
+            source="test",
+            source_name="Test Source",
+        )
+        for i, url in enumerate(
+            ["https://example.com/0", "not-a-valid-url", "https://example.com/2"]
+        )
+    ]
+
+    valid, dropped = drop_invalid(records)
+
+    assert [r.title for r in valid] == ["Record 0", "Record 2"]
+    assert dropped == 1
+    assert drop_invalid(valid) == (valid, 0)
+
+
+def test_is_http_url():
+    """Test the structural URL check used by the parsers."""
+    assert is_http_url("https://example.com/a")
+    assert is_http_url("http://example.com")
+    assert not is_http_url("not-a-valid-url")
+    assert not is_http_url("javascript:void(0)")
+    assert not is_http_url("/articles/relative")
+
+
+def test_timestamp_of():
+    """Test integer sort keys for publication dates."""
+    naive = datetime(2026, 2, 15, 12, 0, 0)
+    aware = datetime(2026, 2, 15, 21, 0, 0, tzinfo=timezone(timedelta(hours=9)))
+
+    assert timestamp_of(naive) == timestamp_of(aware)
+    assert timestamp_of(naive) < timestamp_of(naive + timedelta(microseconds=1))
+    assert timestamp_of(None) < timestamp_of(datetime(1, 1, 1))
+
+
+def test_published_key():
+    """Test that records and NewsItems get the same sort key."""
+    published_at = datetime(2026, 2, 15, 12, 0, 0)
+    item = NewsItem(
+        title="Key",
+        url="https://example.com/key",
+        published_at=published_at,
+        source="test",
+        source_name="Test Source",
+    )
+
+    record = NewsRecord.from_news_item(item)
+    assert record.timestamp == timestamp_of(published_at)
+    assert published_key(record) == published_key(item)
@@ -0,0 +1,81 @@
+"""Tests for /api/news?since=, the ingest watermark delta."""
+
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+import backend.main as main
+from conftest import make_records
+
+
+client = TestClient(main.app)
+
+
+def get_delta(since, **params):
+    """Request the delta of the NHK feed after a watermark."""
+    return client.get("/api/news", params={"sources": "nhk", "since": since, **params})
+
+
+class TestNewsDelta:
+    """Tests for the since parameter."""
+
+    def test_returns_items_after_watermark(self, app_store):
+        """Test that only newly ingested items and a new watermark return."""
+        app_store.publish("nhk", make_records("nhk", ["一", "二"]))
+        first = client.get("/api/news", params={"sources": "nhk"})
+        watermark = first.headers["X-Ingest-Sequence"]
+
+        app_store.publish("nhk", make_records("nhk", ["一", "二", "三", "四"]))
+        response = get_delta(watermark)
+
+        assert response.status_code == 200
+        assert [item["title"] for item in response.json()] == ["四", "三"]
+        assert response.headers["X-Ingest-Sequence"] == "4"
+
+        response = get_delta("4")
+        assert response.json() == []
+        assert response.headers["X-Ingest-Sequence"] == "4"
+
+    def test_limit_stops_watermark_at_last_item(self, app_store):
+        """Test that a truncated delta can be continued from its watermark."""
+        app_store.publish("nhk", make_records("nhk", ["一", "二", "三"]))
+
+        response = get_delta("0", limit=2)
+        assert [item["title"] for item in response.json()] == ["二", "一"]
+        assert response.headers["X-Ingest-Sequence"] == "2"
+
+        response = get_delta("2", limit=2)
+        assert [item["title"] for item in response.json()] == ["三"]
+        assert response.headers["X-Ingest-Sequence"] == "3"
+
+    def test_keyword_filter_advances_watermark(self, app_store):
+        """Test that skipped items still move the watermark."""
+        app_store.publish("nhk", make_records("nhk", ["大雪の情報", "選挙", "株価"]))
+
+        response = get_delta("0", keyword="大雪")
+
+        assert [item["title"] for item in response.json()] == ["大雪の情報"]
+        assert response.headers["X-Ingest-Sequence"] == "3"
+
+    def test_timestamp_watermark(self, app_store):
+        """Test that an ISO 8601 time selects items ingested after it."""
+        log = app_store.ingest_log
+        log.record("nhk", make_records("nhk", ["一"]), now=1000.0)
+        log.record("nhk", make_records("nhk", ["二"], start=1), now=2000.0)
+        app_store.publish("nhk", make_records("nhk", ["一", "二"]))
+
+        since = datetime.fromtimestamp(1500, timezone.utc).isoformat()
+        response = get_delta(since)
+
+        assert [item["title"] for item in response.json()] == ["二"]
+        assert response.headers["X-Ingest-Sequence"] == "2"
+
+    def test_invalid_watermark(self, app_store):
+        """Test that a malformed since is rejected."""
+        assert get_delta("yesterday").status_code == 400
+
+    def test_unresumable_watermark(self, app_store):
+        """Test that a watermark from another process is gone."""
+        app_store.publish("nhk", make_records("nhk", ["一"]))
+
+        assert get_delta("99").status_code == 410
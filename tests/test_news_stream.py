@@ -0,0 +1,129 @@
+"""Tests for the /api/news/stream Server-Sent Events endpoint."""
+
+import asyncio
+import json
+
+import pytest
+
+import backend.main as main
+from conftest import make_records
+
+
+def parse_event(message):
+    """Split an SSE message into its fields."""
+    fields = {}
+    for line in message.strip().split("\n"):
+        name, _, value = line.partition(": ")
+        fields[name] = value
+    return fields
+
+
+class Client:
+    """Stands in for the request's disconnect check."""
+
+    def __init__(self):
+        self.connected = True
+
+    async def is_disconnected(self):
+        return not self.connected
+
+
+async def next_event(events):
+    """Return the next message, skipping retry and keep-alive lines."""
+    while True:
+        message = await asyncio.wait_for(events.__anext__(), timeout=1)
+        if not message.startswith(("retry:", ":")):
+            return parse_event(message)
+
+
+class TestNewsStream:
+    """Tests for the SSE event generator."""
+
+    @pytest.mark.asyncio
+    async def test_pushes_only_new_matching_items(self, app_store):
+        """Test that published articles are pushed once, filtered."""
+        app_store.publish("nhk", make_records("nhk", ["既存の記事"]))
+        client = Client()
+        events = main._stream_events(
+            client.is_disconnected,
+            ["nhk"],
+            "大雪",
+            after=app_store.ingest_log.sequence,
+            heartbeat=0.01,
+        )
+        try:
+            first = asyncio.ensure_future(next_event(events))
+            await asyncio.sleep(0.02)
+            app_store.publish("google", make_records("google", ["大雪の情報"]))
+            app_store.publish(
+                "nhk",
+                [
+                    *make_records("nhk", ["既存の記事"]),
+                    *make_records("nhk", ["東京で大雪", "大雪 続報"], start=1),
+                ],
+            )
+
+            event = await first
+        finally:
+            client.connected = False
+            await events.aclose()
+
+        assert event["event"] == "news"
+        assert event["id"] == "4"
+        assert [i["title"] for i in json.loads(event["data"])] == [
+            "大雪 続報",
+            "東京で大雪",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_filtered_items_only_move_position(self, app_store):
+        """Test that non-matching articles advance Last-Event-ID silently."""
+        client = Client()
+        events = main._stream_events(client.is_disconnected, ["nhk"], None, after=0)
+        try:
+            app_store.publish("google", make_records("google", ["一"]))
+            event = await next_event(events)
+        finally:
+            client.connected = False
+            await events.aclose()
+
+        assert event == {"id": "1"}
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_missed_items(self, app_store):
+        """Test that Last-Event-ID resumes after the client's position."""
+        app_store.publish("nhk", make_records("nhk", ["一", "二", "三"]))
+        client = Client()
+        events = main._stream_events(client.is_disconnected, ["nhk"], None, after=1)
+        try:
+            event = await next_event(events)
+        finally:
+            client.connected = False
+            await events.aclose()
+
+        assert event["id"] == "3"
+        assert [i["title"] for i in json.loads(event["data"])] == ["三", "二"]
+
+    @pytest.mark.asyncio
+    async def test_unresumable_position_resets(self, app_store):
+        """Test that a position from a previous process asks for a reload."""
+        app_store.publish("nhk", make_records("nhk", ["一"]))
+        client = Client()
+        events = main._stream_events(client.is_disconnected, ["nhk"], None, after=99)
+        try:
+            event = await next_event(events)
+        finally:
+            client.connected = False
+            await events.aclose()
+
+        assert event["event"] == "reset"
+        assert event["id"] == "1"
+
+    def test_news_response_carries_sequence(self, app_store):
+        """Test that pages tell clients where to start the stream."""
+        from fastapi.testclient import TestClient
+
+        app_store.publish("nhk", make_records("nhk", ["一", "二"]))
+        response = TestClient(main.app).get("/api/news", params={"sources": "nhk"})
+
+        assert response.headers[main.INGEST_SEQUENCE_HEADER] == "2"
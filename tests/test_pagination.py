@@ -0,0 +1,167 @@
+"""Tests for cursor pagination."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.main as main
+from backend.services.pagination import ResultSnapshot, decode_cursor, encode_cursor
+from conftest import make_record
+
+
+def numbered_records(source, count, start=0):
+    """Build records titled by position, newest first, for ``source``."""
+    return [make_record(source, i=i, minutes=-i) for i in range(start, start + count)]
+
+
+class TestResultSnapshot:
+    """Tests for ResultSnapshot and the cursor codec."""
+
+    def test_pages(self):
+        """Test slicing pages and detecting the last one."""
+        results = ResultSnapshot("s", range(5))
+
+        assert results.page(0, 2) == ([0, 1], True)
+        assert results.page(2, 2) == ([2, 3], True)
+        assert results.page(4, 2) == ([4], False)
+        assert results.page(6, 2) == ([], False)
+        # Earlier pages can be served again
+        assert results.page(0, 2) == ([0, 1], True)
+
+    def test_pages_consume_lazily(self):
+        """Test that only one item past the page is produced."""
+        produced = []
+
+        def source():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        results = ResultSnapshot("s", source())
+        results.page(0, 10)
+        assert len(produced) == 11
+        results.page(10, 10)
+        assert len(produced) == 21
+
+    def test_list_is_kept_materialized(self):
+        """Test that an already materialized ordering is used as it is."""
+        items = list(range(5))
+        results = ResultSnapshot("s", items)
+
+        assert results.produced is items
+        assert results.page(3, 5) == ([3, 4], False)
+
+    def test_cursor_round_trip(self):
+        """Test that cursors encode the snapshot and position."""
+        cursor = encode_cursor("abc123", 40)
+
+        assert "abc123" not in cursor
+        assert decode_cursor(cursor) == ("abc123", 40)
+
+    @pytest.mark.parametrize("cursor", ["", "!!!", encode_cursor("x", 0)[:-1] + "?"])
+    def test_invalid_cursor(self, cursor):
+        """Test that malformed cursors are rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestNewsPagination:
+    """Tests for cursor pagination on /api/news."""
+
+    @pytest.fixture(autouse=True)
+    def store(self, app_store):
+        """Serve an isolated store with a fresh NHK snapshot."""
+        app_store.publish("nhk", numbered_records("nhk", 25))
+        return app_store
+
+    def get(self, client, **params):
+        return client.get("/api/news", params=params)
+
+    def test_pages_through_results(self, store):
+        """Test following cursors until the last page."""
+        client = TestClient(main.app)
+        titles = []
+        response = self.get(client, sources="nhk", limit=10)
+        while True:
+            assert response.status_code == 200
+            titles += [item["title"] for item in response.json()]
+            cursor = response.headers.get(main.NEXT_CURSOR_HEADER)
+            if cursor is None:
+                break
+            response = self.get(client, cursor=cursor, limit=10)
+
+        assert titles == [f"nhk {i}" for i in range(25)]
+
+    def test_paged_snapshot_is_measured_again(self, store):
+        """Test that the pinned snapshot's size grows as it is paged."""
+        client = TestClient(main.app)
+        response = self.get(client, sources="nhk", limit=5)
+        before = main._result_snapshots.total_bytes
+
+        self.get(client, cursor=response.headers[main.NEXT_CURSOR_HEADER], limit=10)
+
+        assert main._result_snapshots.total_bytes > before
+
+    def test_pages_do_not_shift_after_refresh(self, store):
+        """Test that a refresh mid-pagination does not move later pages."""
+        client = TestClient(main.app)
+        first = self.get(client, sources="nhk", limit=10)
+        cursor = first.headers[main.NEXT_CURSOR_HEADER]
+
+        # Newer articles arrive and push everything down
+        newer = numbered_records("nhk", 5, start=-5)
+        store.publish("nhk", newer + numbered_records("nhk", 25))
+
+        second = self.get(client, cursor=cursor, limit=10)
+        assert [item["title"] for item in second.json()] == [
+            f"nhk {i}" for i in range(10, 20)
+        ]
+
+        # A new first page sees the refreshed snapshot once the stale
+        # cached page has been rebuilt in the background
+        self.get(client, sources="nhk", limit=10)
+        fresh = self.get(client, sources="nhk", limit=10)
+        assert fresh.json()[0]["title"] == "nhk -5"
+
+    def test_other_source_publish_keeps_cached_page(self, store):
+        """Test that only publishes of queried sources invalidate a page."""
+        client = TestClient(main.app)
+        self.get(client, sources="nhk", limit=10)
+        (key,) = list(main._cache._entries)
+
+        store.publish("google", numbered_records("google", 3))
+        assert not main._cache.peek(key).stale
+
+        store.publish("nhk", numbered_records("nhk", 5, start=-5))
+        assert main._cache.peek(key).stale
+
+    def test_keyword_results_are_paginated(self, store):
+        """Test paging through index-backed results."""
+        client = TestClient(main.app)
+        first = self.get(client, sources="nhk", limit=2, keyword="nhk 1")
+        second = self.get(
+            client, cursor=first.headers[main.NEXT_CURSOR_HEADER], limit=10
+        )
+
+        titles = [i["title"] for i in first.json() + second.json()]
+        assert sorted(titles) == sorted(
+            ["nhk 1"] + [f"nhk {i}" for i in range(10, 20)]
+        )
+        assert main.NEXT_CURSOR_HEADER not in second.headers
+
+    def test_last_page_has_no_cursor(self, store):
+        """Test that a result fitting one page has no next cursor."""
+        client = TestClient(main.app)
+        response = self.get(client, sources="nhk", limit=30)
+
+        assert len(response.json()) == 25
+        assert main.NEXT_CURSOR_HEADER not in response.headers
+
+    def test_bad_and_expired_cursors(self, store):
+        """Test the error responses for unusable cursors."""
+        client = TestClient(main.app)
+        assert self.get(client, cursor="!!!").status_code == 400
+
+        first = self.get(client, sources="nhk", limit=10)
+        cursor = first.headers[main.NEXT_CURSOR_HEADER]
+        main._result_snapshots.clear()
+        assert self.get(client, cursor=cursor).status_code == 410
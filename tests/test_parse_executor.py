@@ -0,0 +1,73 @@
+"""Tests for the parse executor."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from backend import metrics
+from backend.adapters.nhk_adapter import NHKNewsAdapter
+from backend.config import settings
+from backend.http_client import HTTPClientPool
+from backend.parse_executor import ParseExecutor
+
+
+def _thread_name(body: str, limit: int) -> str:
+    return threading.current_thread().name
+
+
+class TestParseExecutor:
+    """Tests for ParseExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self):
+        """Test that parse jobs run in a worker thread."""
+        executor = ParseExecutor(workers=1, max_queue=2)
+        try:
+            name = await executor.run(_thread_name, "", 0)
+        finally:
+            executor.shutdown()
+
+        assert name.startswith("parse")
+        assert executor.stats()["jobs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue_records_wait(self):
+        """Test that jobs beyond the queue bound wait and the wait is measured."""
+        executor = ParseExecutor(workers=1, max_queue=1)
+        release = threading.Event()
+        waits = metrics.PARSE_QUEUE_WAIT_SECONDS.count(pool="thread")
+        try:
+            blocked = asyncio.ensure_future(executor.run(lambda: release.wait(1)))
+            queued = asyncio.ensure_future(executor.run(lambda: "done"))
+            await asyncio.sleep(0.05)
+            release.set()
+            await blocked
+            assert await queued == "done"
+        finally:
+            executor.shutdown()
+
+        assert executor.stats()["max_queue_wait_seconds"] >= 0.04
+        assert metrics.PARSE_QUEUE_WAIT_SECONDS.count(pool="thread") == waits + 2
+
+    @pytest.mark.asyncio
+    async def test_adapter_parses_in_executor(self, monkeypatch):
+        """Test that adapters route parsing through an injected executor."""
+        monkeypatch.setattr(settings, "STREAMING_PARSE_ENABLED", False)
+        body = """<?xml version="1.0"?><rss version="2.0"><channel>
+<item><title>Parsed</title><link>https://www3.nhk.or.jp/news/a.html</link></item>
+</channel></rss>"""
+        adapter = NHKNewsAdapter()
+        adapter.http_pool = HTTPClientPool(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, text=body))
+        )
+        adapter.parse_executor = ParseExecutor(workers=1, max_queue=1)
+        try:
+            items = await adapter.fetch_news(limit=5)
+        finally:
+            await adapter.http_pool.aclose()
+            adapter.parse_executor.shutdown()
+
+        assert [i.title for i in items] == ["Parsed"]
+        assert adapter.parse_executor.jobs == 1
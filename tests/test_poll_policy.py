@@ -0,0 +1,91 @@
+"""Tests for adaptive poll intervals."""
+
+from datetime import datetime, timedelta
+
+from backend.models import NewsRecord
+from backend.services.poll_policy import AdaptivePollPolicy
+
+BASE = datetime(2026, 2, 15, 12)
+
+
+def make_items(count, start=0, spacing=timedelta(minutes=10)):
+    """Build ``count`` articles published ``spacing`` apart."""
+    return [
+        NewsRecord(
+            title=f"記事 {i}",
+            url=f"https://example.com/{i}",
+            published_at=BASE + spacing * i,
+            source="test",
+            source_name="Test",
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def make_policy(**kwargs):
+    """Build a policy with wide bounds and no smoothing lag."""
+    options = dict(
+        initial_seconds=300, min_seconds=30, max_seconds=3600, smoothing=1.0
+    )
+    options.update(kwargs)
+    return AdaptivePollPolicy(**options)
+
+
+class TestAdaptivePollPolicy:
+    """Tests for AdaptivePollPolicy."""
+
+    def test_first_fetch_uses_publication_spread(self):
+        """Test that the first interval follows the feed's publish times."""
+        policy = make_policy()
+
+        # 11 articles over 100 minutes: one every 10 minutes
+        assert policy.observe(make_items(11), now=0) == 600
+
+    def test_first_fetch_without_dates_keeps_initial(self):
+        """Test that undated feeds keep the configured interval."""
+        policy = make_policy()
+        undated = [NewsRecord("x", "https://example.com/x", None, "t", "T")]
+
+        assert policy.observe(undated, now=0) == 300
+
+    def test_fast_feed_shortens_interval(self):
+        """Test that many new URLs per poll shorten the interval."""
+        policy = make_policy()
+        policy.observe(make_items(10), now=0)
+
+        # 10 new articles in 300 s: one every 30 s
+        assert policy.observe(make_items(10, start=10), now=300) == 30
+
+    def test_quiet_feed_lengthens_interval(self):
+        """Test that polls without new URLs lengthen the interval gradually."""
+        policy = make_policy(smoothing=0.5)
+        items = make_items(10)
+        policy.observe(items, now=0)
+        previous = policy.interval
+
+        intervals = []
+        now = 0
+        for _ in range(4):
+            now += policy.interval
+            intervals.append(policy.observe(items, now=now))
+
+        assert intervals == sorted(intervals)
+        assert previous < intervals[0] < 3600
+        assert intervals[-1] == 3600
+
+    def test_bounds(self):
+        """Test that the interval stays within the configured bounds."""
+        policy = make_policy(min_seconds=60, max_seconds=600)
+
+        assert policy.observe(make_items(10, spacing=timedelta(seconds=1)), 0) == 60
+        policy = make_policy(min_seconds=60, max_seconds=600)
+        assert policy.observe(make_items(3, spacing=timedelta(days=1)), 0) == 600
+
+    def test_upstream_hint_raises_lower_bound(self):
+        """Test that a Cache-Control/ttl hint is never undercut."""
+        policy = make_policy()
+        fast = make_items(10, spacing=timedelta(seconds=1))
+
+        assert policy.observe(fast, now=0, hint=900) == 900
+        # Hints beyond the upper bound are capped
+        assert policy.observe(fast, now=10, hint=7200) == 3600
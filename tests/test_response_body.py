@@ -0,0 +1,174 @@
+"""Tests for pre-encoded response bodies."""
+
+import gzip
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.main as main
+from backend.response_body import EncodedBody, encode_json, parse_accept_encoding
+from conftest import make_record
+
+
+def make_records(count):
+    """Build records with Japanese text, all published at the same time."""
+    return [
+        make_record(
+            "test",
+            f"テスト記事 {i}",
+            i,
+            minutes=0,
+            source_name="Test Source",
+            summary="要約" * 10,
+        )
+        for i in range(count)
+    ]
+
+
+def make_items(count):
+    """Build the API item dictionaries of ``make_records(count)``."""
+    return [record.to_dict() for record in make_records(count)]
+
+
+class TestEncodedBody:
+    """Tests for EncodedBody."""
+
+    def test_encode_json_matches_json_response(self):
+        """Test that the bytes match what JSONResponse would send."""
+        items = make_items(3)
+        assert encode_json(items) == main.JSONResponse(items).body
+
+    def test_build_compresses_large_bodies(self):
+        """Test that large bodies get a gzip variant decoding to the JSON."""
+        body = EncodedBody.build(make_items(20), min_size=512)
+
+        assert body.gzip is not None
+        assert gzip.decompress(body.gzip) == body.identity
+        assert json.loads(body.identity) == make_items(20)
+        assert body.size >= len(body.identity) + len(body.gzip)
+
+    def test_build_skips_small_bodies(self):
+        """Test that bodies below the threshold are not compressed."""
+        body = EncodedBody.build([], min_size=512)
+
+        assert body.identity == b"[]"
+        assert body.gzip is None
+        assert body.select("gzip") == (b"[]", None)
+
+    def test_build_is_deterministic(self):
+        """Test that identical payloads produce identical gzip bytes."""
+        first = EncodedBody.build(make_items(20), min_size=0)
+        second = EncodedBody.build(make_items(20), min_size=0)
+        assert first.gzip == second.gzip
+
+    def test_select(self):
+        """Test content negotiation between the variants."""
+        body = EncodedBody(b"identity", gzip=b"gz", br=b"br")
+
+        assert body.select(None) == (b"identity", None)
+        assert body.select("gzip, deflate") == (b"gz", "gzip")
+        assert body.select("gzip, deflate, br") == (b"br", "br")
+        assert body.select("br;q=0.5, gzip") == (b"gz", "gzip")
+        assert body.select("gzip;q=0") == (b"identity", None)
+        assert body.select("*") == (b"br", "br")
+
+        without_br = EncodedBody(b"identity", gzip=b"gz")
+        assert without_br.select("br, gzip;q=0.8") == (b"gz", "gzip")
+        assert without_br.select("br") == (b"identity", None)
+
+    def test_etags(self):
+        """Test per-variant strong ETags and If-None-Match matching."""
+        body = EncodedBody.build(make_items(20), min_size=0)
+        other = EncodedBody.build(make_items(19), min_size=0)
+
+        assert body.etag() == f'"{body.digest}"'
+        assert body.etag("gzip") != body.etag()
+        assert body.matches(body.etag())
+        assert body.matches(f'"nope", W/{body.etag("gzip")}')
+        assert body.matches("*")
+        assert not body.matches(None)
+        assert not body.matches(other.etag())
+
+    def test_parse_accept_encoding(self):
+        """Test parsing q-values from Accept-Encoding."""
+        assert parse_accept_encoding("GZIP;q=0.5, br, ;") == {
+            "gzip": 0.5,
+            "br": 1.0,
+        }
+        assert parse_accept_encoding("gzip;q=bad") == {"gzip": 0.0}
+        assert parse_accept_encoding(None) == {}
+
+
+class TestNewsResponseEncoding:
+    """Tests for compressed /api/news responses."""
+
+    @pytest.fixture(autouse=True)
+    def fake_fetch(self, monkeypatch):
+        """Serve a fixed result and count fetches."""
+        calls = []
+
+        async def fake_fetch_news(sources, limit, *args):
+            calls.append(limit)
+            return make_records(limit)
+
+        monkeypatch.setattr(main, "_fetch_news", fake_fetch_news)
+        main._cache.clear()
+        yield calls
+        main._cache.clear()
+
+    def test_gzip_response(self, fake_fetch):
+        """Test that clients accepting gzip receive the cached gzip bytes."""
+        client = TestClient(main.app)
+        response = client.get(
+            "/api/news?limit=20", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.json() == make_items(20)
+
+    def test_hits_reuse_encoded_body(self, fake_fetch):
+        """Test that cache hits serve the stored bytes without refetching."""
+        client = TestClient(main.app)
+        first = client.get(
+            "/api/news?limit=20", headers={"Accept-Encoding": "identity"}
+        )
+        second = client.get(
+            "/api/news?limit=20", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert fake_fetch == [20]
+        assert "content-encoding" not in first.headers
+        assert second.headers["content-encoding"] == "gzip"
+        assert first.content == second.content
+
+    def test_etag_and_cache_control(self, fake_fetch):
+        """Test that responses carry a validator and revalidation policy."""
+        client = TestClient(main.app)
+        response = client.get(
+            "/api/news?limit=20", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.headers["etag"].endswith('-gzip"')
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_if_none_match_returns_304(self, fake_fetch):
+        """Test that a current validator gets a bodiless 304."""
+        client = TestClient(main.app)
+        first = client.get("/api/news?limit=20")
+        etag = first.headers["etag"]
+
+        response = client.get(
+            "/api/news?limit=20", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = client.get(
+            "/api/news?limit=20", headers={"If-None-Match": '"outdated"'}
+        )
+        assert response.status_code == 200
+        assert response.json() == make_items(20)
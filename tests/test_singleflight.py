@@ -0,0 +1,72 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from backend.services.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_same_key_shares_one_call(self):
+        """Test that concurrent callers with one key share a call."""
+        flights = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flights.do("k", work) for _ in range(10)))
+
+        assert calls == 1
+        assert results == [1] * 10
+        assert flights.coalesced == 9
+        assert not flights.in_flight("k")
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_in_parallel(self):
+        """Test that one slow key does not block another."""
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return "slow"
+
+        async def fast():
+            return "fast"
+
+        slow_task = asyncio.ensure_future(flights.do("slow", slow))
+        await asyncio.sleep(0)
+
+        assert await flights.do("fast", fast) == "fast"
+        assert flights.in_flight("slow")
+
+        release.set()
+        assert await slow_task == "slow"
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_and_not_cached(self):
+        """Test that failures propagate to waiters and allow a retry."""
+        flights = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flights.do("k", fail), flights.do("k", fail), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        async def ok():
+            return "ok"
+
+        assert await flights.do("k", ok) == "ok"
+        assert flights.calls == 2
@@ -0,0 +1,328 @@
+"""Tests for the per-source item store."""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from backend.adapters.base import FetchResult, NewsAdapter
+from backend.adapters.nhk_adapter import NHKNewsAdapter
+from backend.config import settings
+from backend.http_client import HTTPClientPool
+from backend.models import NewsRecord
+from backend.services.circuit_breaker import CircuitBreaker
+from backend.services.scheduler import IngestionScheduler
+from backend.services.source_store import SourceStore
+from conftest import CountingAdapter, FailingAdapter
+
+
+class SlowAdapter(CountingAdapter):
+    """Adapter that answers after a delay."""
+
+    def __init__(self, source_id: str, delay: float):
+        super().__init__(source_id)
+        self.delay = delay
+
+    async def fetch_news(self, limit: int = 10):
+        await asyncio.sleep(self.delay)
+        return await super().fetch_news(limit)
+
+
+class TestSourceStore:
+    """Tests for SourceStore."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_source_is_not_refetched(self):
+        """Test that queries reuse a fresh snapshot."""
+        adapter = CountingAdapter("a")
+        store = SourceStore({"a": adapter}, fetch_limit=40, ttl_seconds={"a": 60})
+
+        first = await store.get_items(["a"])
+        second = await store.get_items(["a"])
+
+        assert adapter.calls == 1
+        assert adapter.limits == [40]
+        assert [i.title for i in first] == [i.title for i in second]
+
+    @pytest.mark.asyncio
+    async def test_expired_source_is_refetched(self):
+        """Test that a source is fetched again once its TTL expires."""
+        adapter = CountingAdapter("a")
+        store = SourceStore({"a": adapter}, ttl_seconds={"a": 0})
+
+        await store.get_items(["a"])
+        adapter.count = 4
+        await store.get_items(["a"])
+
+        assert adapter.calls == 2
+        assert store.version == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_refetch_keeps_version(self):
+        """Test that refetching the same items only moves the fetch time."""
+        adapter = CountingAdapter("a")
+        store = SourceStore({"a": adapter}, ttl_seconds={"a": 0})
+        await store.get_items(["a"])
+        first = store.get("a")
+        sequence = store.ingest_log.sequence
+
+        await store.get_items(["a"])
+        second = store.get("a")
+
+        assert adapter.calls == 2
+        assert store.version == 1
+        assert second.items is first.items
+        assert second.fetched_at >= first.fetched_at
+        assert store.ingest_log.sequence == sequence
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_snapshot(self):
+        """Test that a failing source keeps serving its last snapshot."""
+        store = SourceStore({"a": CountingAdapter("a")}, ttl_seconds={"a": 0})
+        await store.get_items(["a"])
+        store.adapters["a"] = FailingAdapter("a", "A")
+
+        items = await store.get_items(["a", "unknown"])
+
+        assert len(items) == 3
+
+    @pytest.mark.asyncio
+    async def test_same_feed_bytes_keep_version(self):
+        """Test that a feed served again unchanged is not a new snapshot."""
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            "<title>NHK</title><item><title>記事</title>"
+            "<link>https://www3.nhk.or.jp/news/a.html</link></item>"
+            "</channel></rss>"
+        ).encode("utf-8")
+        adapter = NHKNewsAdapter()
+        adapter.http_pool = HTTPClientPool(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, content=body))
+        )
+        store = SourceStore({"nhk": adapter}, ttl_seconds={"nhk": 0})
+        try:
+            await store.get_items(["nhk"])
+            await store.get_items(["nhk"])
+        finally:
+            await adapter.http_pool.aclose()
+
+        assert adapter.validators.unchanged == 1
+        assert store.version == 1
+
+    def test_equal_records_keep_version(self):
+        """Test that new record objects with the same content are no change."""
+        store = SourceStore({"a": CountingAdapter("a")})
+        first = [NewsRecord("A", "https://example.com/a", None, "a", "A")]
+        store.publish("a", first)
+
+        store.publish("a", [NewsRecord("A", "https://example.com/a", None, "a", "A")])
+        assert store.version == 1
+        assert store.get("a").items[0] is first[0]
+
+        store.publish("a", [NewsRecord("B", "https://example.com/a", None, "a", "A")])
+        assert store.version == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_leg_is_reported_as_partial(self, caplog):
+        """Test that a fetch missing some legs is published as partial."""
+
+        class PartialAdapter(NewsAdapter):
+            async def fetch_news(self, limit: int = 10):
+                record = NewsRecord("A", "https://example.com/a", None, "a", "A")
+                return FetchResult([record], missing=["scrape"])
+
+        store = SourceStore({"a": PartialAdapter("a", "A")})
+
+        items = await store.get_items(["a"])
+
+        assert len(items) == 1
+        assert store.status("a") == "partial"
+        assert "Fetched a without scrape" in caplog.messages
+
+    @pytest.mark.asyncio
+    async def test_invalid_items_are_dropped(self):
+        """Test that fetched items failing validation are not published."""
+
+        class InvalidAdapter(NewsAdapter):
+            async def fetch_news(self, limit: int = 10):
+                return [
+                    NewsRecord("Valid", "https://example.com/1", None, "a", "A"),
+                    NewsRecord("Invalid", "https://", None, "a", "A"),
+                ]
+
+        store = SourceStore({"a": InvalidAdapter("a", "A")})
+
+        items = await store.get_items(["a"])
+
+        assert [i.title for i in items] == ["Valid"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_answers_without_slow_source(self):
+        """Test that queries stop waiting on refreshes at the deadline."""
+        slow = SlowAdapter("slow", delay=0.2)
+        store = SourceStore(
+            {"fast": CountingAdapter("fast"), "slow": slow},
+            ttl_seconds={"fast": 60, "slow": 60},
+            deadline=0.05,
+        )
+
+        items = await store.get_items(["fast", "slow"])
+
+        assert {i.source for i in items} == {"fast"}
+        assert store.status("fast") == "ok"
+        assert store.status("slow") == "timeout"
+
+        # The refresh keeps running and publishes once it completes
+        await asyncio.sleep(0.3)
+        assert store.status("slow") == "ok"
+        assert len(await store.get_items(["slow"])) == 3
+        assert slow.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_timeout_counts_as_failure(self):
+        """Test that a fetch over the per-source timeout is abandoned."""
+        store = SourceStore(
+            {"slow": SlowAdapter("slow", delay=1)},
+            ttl_seconds={"slow": 60},
+            fetch_timeout=0.01,
+        )
+
+        assert await store.refresh("slow") is None
+        assert store.status("slow") == "timeout"
+        assert store.breaker_for("slow").failures == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_serves_previous_snapshot(self):
+        """Test that an open circuit skips the upstream but keeps the data."""
+        store = SourceStore(
+            {"a": CountingAdapter("a")},
+            ttl_seconds={"a": 0},
+            breakers={"a": CircuitBreaker(failure_threshold=2, reset_seconds=60)},
+        )
+        await store.refresh("a")
+        failing = FailingAdapter("a", "A")
+        store.adapters["a"] = failing
+
+        await store.refresh("a")
+        assert store.status("a") == "error"
+        await store.refresh("a")
+        assert store.status("a") == "circuit_open"
+
+        store.adapters["a"] = CountingAdapter("a")
+        items = await store.get_items(["a"])
+        assert len(items) == 3
+        assert store.adapters["a"].calls == 0
+
+    @pytest.mark.asyncio
+    async def test_adaptive_ttl(self):
+        """Test that an adaptive store learns the TTL it polls with."""
+        adapter = CountingAdapter("a")
+        store = SourceStore({"a": adapter}, ttl_seconds={"a": 300}, adaptive=True)
+        scheduler = IngestionScheduler(store)
+        assert store.ttl_for("a") == 300
+
+        await store.refresh("a")
+        # Undated items teach nothing on the first fetch
+        assert store.policy_for("a").rate is None
+        assert store.ttl_for("a") == 300
+
+        adapter.count = 6  # Three new articles right after the last poll
+        await store.refresh("a")
+
+        assert store.ttl_for("a") == settings.POLL_MIN_SECONDS
+        assert scheduler.interval_for("a") == store.ttl_for("a")
+
+    @pytest.mark.asyncio
+    async def test_get_items_with_keyword(self):
+        """Test that keyword queries are answered from the index."""
+        store = SourceStore(
+            {"a": CountingAdapter("a"), "b": CountingAdapter("b")},
+            ttl_seconds={"a": 60, "b": 60},
+        )
+
+        items = await store.get_items(["a", "b"], keyword="a 1")
+        assert [i.title for i in items] == ["a 1"]
+
+        items = await store.get_items(["b"], keyword="1")
+        assert [i.title for i in items] == ["b 1"]
+
+    @pytest.mark.asyncio
+    async def test_get_sorted_streams(self):
+        """Test that snapshots are presorted by date, keeping feed order on ties."""
+        store = SourceStore({"a": CountingAdapter("a")}, ttl_seconds={"a": 60})
+        base = datetime(2026, 2, 15)
+        later = base.replace(hour=9)
+        store.publish(
+            "a",
+            [
+                NewsRecord("old", "https://example.com/1", base, "a", "A"),
+                NewsRecord("undated", "https://example.com/2", None, "a", "A"),
+                NewsRecord("new", "https://example.com/3", later, "a", "A"),
+                NewsRecord("old too", "https://example.com/4", base, "a", "A"),
+            ],
+        )
+
+        (desc,) = await store.get_sorted_streams(["a"], "desc")
+        (asc,) = await store.get_sorted_streams(["a", "unknown"], "asc")
+
+        assert [i.title for i in desc] == ["new", "old", "old too", "undated"]
+        assert [i.title for i in asc] == ["undated", "old", "old too", "new"]
+
+
+class TestIngestionScheduler:
+    """Tests for IngestionScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_start_warms_sources_and_stop_cancels(self):
+        """Test that start fetches every source before returning."""
+        adapters = {"a": CountingAdapter("a"), "b": CountingAdapter("b")}
+        store = SourceStore(adapters, ttl_seconds={"a": 60, "b": 60})
+        scheduler = IngestionScheduler(store)
+
+        await scheduler.start()
+        try:
+            assert scheduler.running
+            assert store.get("a") is not None
+            assert store.get("b") is not None
+        finally:
+            await scheduler.stop()
+
+        assert not scheduler.running
+        assert adapters["a"].calls == 1
+
+    @pytest.mark.asyncio
+    async def test_poll_survives_refresh_errors(self, monkeypatch, caplog):
+        """Test that an error escaping refresh is logged and retried."""
+        store = SourceStore({"a": CountingAdapter("a")}, ttl_seconds={"a": 60})
+        scheduler = IngestionScheduler(store, retry_seconds=0)
+        attempts = []
+        retried = asyncio.Event()
+
+        async def refresh(source_id):
+            attempts.append(source_id)
+            if len(attempts) == 1:
+                raise RuntimeError("publish failed")
+            retried.set()
+
+        monkeypatch.setattr(store, "refresh", refresh)
+        task = asyncio.create_task(scheduler._poll("a", refresh_now=True))
+        try:
+            await asyncio.wait_for(retried.wait(), timeout=1)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert attempts[:2] == ["a", "a"]
+        assert "Error refreshing a" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_requests_do_not_refresh_while_scheduled(self):
+        """Test that reads skip upstream fetches when refresh is disabled."""
+        adapter = CountingAdapter("a")
+        store = SourceStore({"a": adapter}, ttl_seconds={"a": 0})
+
+        items = await store.get_items(["a"], refresh=False)
+
+        assert items == []
+        assert adapter.calls == 0
@@ -0,0 +1,156 @@
+"""Tests for the streaming RSS parser."""
+
+from datetime import datetime
+
+import httpx
+import pytest
+
+from backend.adapters.google_adapter import GoogleNewsAdapter
+from backend.adapters.streaming import StreamingRSSParser
+from backend.config import settings
+from backend.http_client import HTTPClientPool
+from backend.parse_executor import ParseExecutor
+
+
+def _feed(count: int) -> bytes:
+    items = "".join(
+        f"""<item>
+  <title>Article {i} &amp; more</title>
+  <link>https://example.com/{i}</link>
+  <pubDate>Sat, 15 Feb 2026 12:00:00 +0900</pubDate>
+  <description>Summary {i}</description>
+</item>"""
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Feed</title><link>https://example.com/</link>{items}"
+        "</channel></rss>"
+    ).encode("utf-8")
+
+
+class TestStreamingRSSParser:
+    """Tests for StreamingRSSParser."""
+
+    def test_builds_items_from_small_chunks(self):
+        """Test that items are built from a body split at arbitrary points."""
+        body = _feed(3)
+        parser = StreamingRSSParser(10, "test", "Test")
+        for i in range(0, len(body), 7):
+            parser.feed(body[i : i + 7])
+
+        items = parser.close()
+
+        assert [i.title for i in items] == [
+            "Article 0 & more",
+            "Article 1 & more",
+            "Article 2 & more",
+        ]
+        assert items[0].published_at == datetime(2026, 2, 15, 3, 0, 0)
+        assert items[0].summary == "Summary 0"
+        assert not parser.done
+
+    def test_stops_at_limit(self):
+        """Test that the parser reports done once the limit is reached."""
+        parser = StreamingRSSParser(2, "test", "Test", include_summary=False)
+        parser.feed(_feed(5))
+
+        assert parser.done
+        assert len(parser.close()) == 2
+        assert parser.close()[0].summary is None
+
+
+class TestStreamedFetch:
+    """Tests for NewsAdapter._fetch_streamed."""
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_after_limit(self):
+        """Test that the rest of the body is not downloaded."""
+        body = _feed(200)
+        chunk_size = 512
+        pulled = []
+
+        async def chunks():
+            for i in range(0, len(body), chunk_size):
+                pulled.append(i)
+                yield body[i : i + chunk_size]
+
+        adapter = GoogleNewsAdapter()
+        adapter.http_pool = HTTPClientPool(
+            transport=httpx.MockTransport(
+                lambda r: httpx.Response(200, content=chunks())
+            )
+        )
+        try:
+            items = await adapter.fetch_news(limit=3)
+        finally:
+            await adapter.http_pool.aclose()
+
+        assert len(items) == 3
+        assert len(pulled) < len(body) // chunk_size
+        assert adapter.validators.streamed == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_feed_falls_back(self):
+        """Test that malformed XML is parsed with feedparser instead."""
+        body = _feed(2).replace(b"&amp;", b"&")
+        adapter = GoogleNewsAdapter()
+        adapter.http_pool = HTTPClientPool(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, content=body))
+        )
+        try:
+            items = await adapter.fetch_news(limit=5)
+        finally:
+            await adapter.http_pool.aclose()
+
+        assert len(items) == 2
+        assert adapter.validators.streamed == 0
+        assert adapter.validators.parsed == 1
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_streamed_items(self):
+        """Test that a 304 returns the previously streamed items."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=_feed(2), headers={"ETag": '"v1"'})
+
+        adapter = GoogleNewsAdapter()
+        adapter.http_pool = HTTPClientPool(transport=httpx.MockTransport(handler))
+        try:
+            first = await adapter.fetch_news(limit=5)
+            second = await adapter.fetch_news(limit=5)
+        finally:
+            await adapter.http_pool.aclose()
+
+        assert [i.url for i in second] == [i.url for i in first]
+        assert adapter.validators.not_modified == 1
+        assert adapter.validators.streamed == 1
+
+    @pytest.mark.asyncio
+    async def test_large_chunks_are_parsed_in_executor(self, monkeypatch):
+        """Test that only chunks above the inline size leave the loop."""
+        monkeypatch.setattr(settings, "STREAMING_PARSE_INLINE_BYTES", 1024)
+        body = _feed(40)
+        sizes = [512, len(body) - 512]
+
+        async def chunks():
+            yield body[: sizes[0]]
+            yield body[sizes[0] :]
+
+        adapter = GoogleNewsAdapter()
+        adapter.parse_executor = ParseExecutor(workers=1, max_queue=2)
+        adapter.http_pool = HTTPClientPool(
+            transport=httpx.MockTransport(
+                lambda r: httpx.Response(200, content=chunks())
+            )
+        )
+        try:
+            items = await adapter.fetch_news(limit=40)
+        finally:
+            await adapter.http_pool.aclose()
+            adapter.parse_executor.shutdown()
+
+        assert len(items) == 40
+        assert adapter.parse_executor.stats()["jobs"] == 1